@@ -58,6 +58,10 @@ def create_app(config_name: str | None = None) -> Flask:
     csrf.init_app(app)
     assets.init_app(app)
 
+    # --- Serve prebuilt .br/.gz static files (flask static compress) ---
+    from app.services.static_compress import serve_precompressed_static
+    serve_precompressed_static(app)
+
     # --- CSS & JS bundling ---
     js_bundle = Bundle(
         'js/main.js',
@@ -73,14 +77,22 @@ def create_app(config_name: str | None = None) -> Flask:
     def generate_csp_nonce() -> None:
         g.csp_nonce = secrets.token_urlsafe(16)
 
+    # --- Keep the session cookie off publicly cached responses (static files, public JSON) ---
+    from app.services.http_cache import SessionlessAwareSessionInterface, is_sessionless_request
+    app.session_interface = SessionlessAwareSessionInterface()
+
     # --- Ensure CSRF token is available as a cookie for JS ---
     @app.after_request
     def set_csrf_cookie(response):
-        if 'csrf_token' not in g:
+        if 'csrf_token' not in g and not is_sessionless_request():
             from flask_wtf.csrf import generate_csrf
             generate_csrf()
         return response
 
+    # --- Keep the cached response's CSP on 304 (runs after Talisman's headers) ---
+    from app.services.http_cache import strip_csp_on_not_modified
+    app.after_request(strip_csp_on_not_modified)
+
     # --- Configure Content Security Policy ---
     csp_config = app.config.get('CSP', {})
 
@@ -122,6 +134,14 @@ def create_app(config_name: str | None = None) -> Flask:
 
     register_template_helpers(app)
 
+    # --- Register CLI commands ---
+    from app.cli import register_commands
+    register_commands(app)
+
+    # --- Start content watcher (optional) ---
+    from app.services.content_watcher import start_content_watcher
+    start_content_watcher(app)
+
     # --- Middleware for JSON requests ---
     @app.before_request
     def handle_json_request() -> None:
@@ -171,6 +191,13 @@ def setup_logging(app: Flask) -> None:
 
 def register_template_helpers(app: Flask) -> None:
     """Register custom template filters and context processors."""
+    # Reuse rendered fragments ({% cache %}) such as post cards and tag sidebars
+    from app.services.cache_service import ByteLRUCache
+    from app.services.fragment_cache import FRAGMENT_CACHE_MAX_BYTES, FragmentCacheExtension
+    app.jinja_env.add_extension(FragmentCacheExtension)
+    fragment_cache_bytes = app.config.get('FRAGMENT_CACHE_MAX_BYTES', FRAGMENT_CACHE_MAX_BYTES)
+    app.jinja_env.fragment_cache = ByteLRUCache(fragment_cache_bytes) if fragment_cache_bytes > 0 else None
+
     @app.template_filter('dateformat')
     def dateformat_filter(value, format: str = '%Y-%m-%d'):
         if value and hasattr(value, 'strftime'):
@@ -186,21 +213,30 @@ def register_template_helpers(app: Flask) -> None:
         from flask_wtf.csrf import generate_csrf
         return dict(csrf_token=generate_csrf)
 
+    # Content hashes of static assets, built once; refreshed by the content watcher
+    from app.services.static_manifest import init_static_manifest
+    manifest = init_static_manifest(app)
+    revalidate = app.debug or app.config.get('TEMPLATES_AUTO_RELOAD', False)
+
+    def static_url(filename: str) -> str:
+        """Return a fingerprinted static asset URL from the startup manifest."""
+        if revalidate and 'content_watcher' not in app.extensions:
+            version = manifest.revalidate(filename)
+        else:
+            version = manifest.lookup(filename)
+        if version:
+            return url_for('static', filename=filename, v=version)
+        # Files outside the manifest directories fall back to an mtime version
+        try:
+            file_path = safe_join(app.static_folder, filename)
+            if file_path:
+                return url_for('static', filename=filename, v=int(os.path.getmtime(file_path)))
+        except (OSError, TypeError, ValueError):
+            pass
+        return url_for('static', filename=filename)
+
     @app.context_processor
     def inject_static_url():
-        def static_url(filename: str) -> str:
-            """Return a cache-busted static asset URL based on file mtime."""
-            version = None
-            try:
-                file_path = safe_join(app.static_folder, filename)
-                if file_path:
-                    version = int(os.path.getmtime(file_path))
-            except (OSError, TypeError, ValueError):
-                version = None
-            if version:
-                return url_for('static', filename=filename, v=version)
-            return url_for('static', filename=filename)
-
         return dict(static_url=static_url)
 
 def verify_startup(app: Flask) -> None:
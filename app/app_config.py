@@ -93,10 +93,34 @@ class Config:
     MAX_TAGS_PER_POST = 15
     MAX_PREVIEW_LENGTH = 300
     MAX_POSTS_TOTAL = 2000
+    POSTS_PER_PAGE = 24  # 목록/태그/시리즈 페이지당 포스트 수 (?per_page=로 변경 가능)
+    MAX_POSTS_PER_PAGE = 100
+
+    # 포스트 로딩 병렬화 - 바뀐 파일이 임계값 이상이면(콜드 스타트 등) 작업자 풀 사용
+    POSTS_LOAD_WORKERS = int(os.environ.get('POSTS_LOAD_WORKERS', min(8, (os.cpu_count() or 1) + 2)))
+    POSTS_LOAD_USE_PROCESSES = os.environ.get('POSTS_LOAD_USE_PROCESSES', 'false').lower() == 'true'
+    POSTS_PARALLEL_THRESHOLD = 32
+
+    # 포스트 메타데이터 SQLite 인덱스 - 워커끼리 공유, 재시작 후 메타데이터 파싱 생략
+    POST_INDEX_ENABLED = os.environ.get('POST_INDEX_ENABLED', 'true').lower() == 'true'
+    POST_INDEX_PATH = os.environ.get('POST_INDEX_PATH', str(app_dir.parent / 'instance' / 'post_index.sqlite3'))
     
     # 캐시 설정
     CACHE_TIMEOUT = 600  # 10분
     CACHE_MAX_SIZE = 1000
+    RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 렌더링된 본문 HTML LRU 예산 (0이면 끔)
+    FRAGMENT_CACHE_MAX_BYTES = 8 * 1024 * 1024  # 포스트 카드/태그 목록 등 템플릿 조각 LRU 예산 (0이면 끔)
+    RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024  # CACHE_TYPE이 simple일 때 전체 응답 캐시 예산 (0이면 끔)
+    POST_BODY_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 지연 로딩된 포스트 본문 LRU 예산
+    FULL_POST_CACHE_SIZE = 128  # 단일 포스트 화면용 TextPost LRU 개수 (목록은 PostSummary 사용)
+
+    # 응답 중 압축(Flask-Compress)은 동적 응답 형식에만 - 정적 CSS/JS 등은 flask static compress로 미리 압축
+    COMPRESS_MIMETYPES = ['text/html', 'text/plain', 'text/xml', 'application/xml', 'application/json']
+
+    # 콘텐츠 감시자 (inotify 또는 폴링) - 켜면 요청마다 파일 시스템을 확인하지 않음
+    CONTENT_WATCHER_ENABLED = os.environ.get('CONTENT_WATCHER_ENABLED', 'false').lower() == 'true'
+    CONTENT_WATCHER_POLL_INTERVAL = 2.0  # 초 (inotify가 없을 때)
+    CONTENT_WATCHER_DEBOUNCE = 0.5  # 초
     
     # 마크다운 설정
     MARKDOWN_EXTENSIONS = [
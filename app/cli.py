@@ -0,0 +1,111 @@
+# app/cli.py
+import os
+import tempfile
+from pathlib import Path
+
+import click
+from flask import Flask, current_app
+from flask.cli import AppGroup
+
+from app.services.freeze_service import BROTLI_AVAILABLE, freeze_site
+from app.services.static_compress import build_asset_bundles, precompress_static
+from app.services.text_service import TextPost, detect_encoding
+
+posts_cli = AppGroup('posts', help='포스트 파일 관리 명령')
+static_cli = AppGroup('static', help='정적 파일 관리 명령')
+
+@posts_cli.command('normalize-encoding')
+@click.option('--dry-run', is_flag=True, help='바꿀 파일만 출력하고 쓰지 않음')
+@click.option('--include-latin1', is_flag=True, help='판별 실패(latin-1)로 읽히는 파일도 변환')
+def normalize_encoding(dry_run: bool, include_latin1: bool) -> None:
+    """레거시 인코딩(cp949/euc-kr, BOM 포함 UTF-8) 포스트를 BOM 없는 UTF-8로 다시 씀
+
+    줄바꿈은 원본 그대로 유지하고, 임시 파일에 쓴 뒤 교체하므로 중간에 실패해도 원본이 남음
+    """
+    posts_dir = Path(current_app.config.get('POSTS_DIR'))
+    if not posts_dir.is_dir():
+        raise click.ClickException(f"포스트 디렉토리 없음: {posts_dir}")
+    converted = skipped = 0
+    for path in sorted(posts_dir.iterdir()):
+        if path.is_symlink() or not path.is_file() or not TextPost._validate_filename(path.name):
+            continue
+        data = path.read_bytes()
+        encoding = detect_encoding(data)
+        if encoding == 'utf-8':
+            continue
+        if encoding == 'latin-1' and not include_latin1:
+            click.echo(f"건너뜀 (인코딩 판별 실패): {path.name}")
+            skipped += 1
+            continue
+        click.echo(f"{'변환 예정' if dry_run else '변환'}: {path.name} ({encoding} -> utf-8)")
+        converted += 1
+        if dry_run:
+            continue
+        _write_atomic(path, data.decode(encoding).encode('utf-8'))
+    click.echo(f"완료: {converted}개 {'변환 예정' if dry_run else '변환'}, {skipped}개 건너뜀")
+
+@posts_cli.command('freeze')
+@click.argument('output_dir', type=click.Path(file_okay=False))
+@click.option('--base-url', default='http://localhost', show_default=True,
+              help='og:url, 사이트맵 등 절대 URL에 쓸 사이트 주소 (예: https://example.com)')
+@click.option('--workers', type=int, default=None, help='동시에 렌더링할 작업자 수 (기본: POSTS_LOAD_WORKERS)')
+@click.option('--force', is_flag=True, help='입력이 바뀌지 않은 페이지도 모두 다시 렌더링')
+@click.option('--no-gallery', is_flag=True, help='갤러리 페이지는 내보내지 않음')
+def freeze(output_dir: str, base_url: str, workers: int | None, force: bool, no_gallery: bool) -> None:
+    """블로그/갤러리 페이지를 정적 파일(+ .gz/.br)로 내보냄 - 다시 실행하면 입력이 바뀐 페이지만 갱신
+
+    nginx 예: location / { try_files $uri/index.html $uri @flask; gzip_static on; brotli_static on; }
+    쿼리 문자열이 있는 요청(목록 커서, 검색 API 등)과 동적 도구는 Flask로 넘겨야 함.
+    요청마다 달라지는 CSP nonce와 CSRF 토큰은 내보낼 때 HTML에서 제거함.
+    """
+    if not BROTLI_AVAILABLE:
+        click.echo("brotli 모듈이 없어 .gz 압축본만 만듭니다")
+    report = freeze_site(current_app._get_current_object(), output_dir, base_url=base_url.rstrip('/'),
+                         workers=workers, force=force, include_gallery=not no_gallery)
+    for url, error in report.failed:
+        click.echo(f"실패: {url} ({error})", err=True)
+    click.echo(f"완료: {len(report.written)}개 기록, {report.unchanged}개 변경 없음, "
+               f"{len(report.removed)}개 삭제, {len(report.failed)}개 실패 -> {output_dir}")
+    if report.failed:
+        raise SystemExit(1)
+
+@static_cli.command('compress')
+@click.option('--force', is_flag=True, help='원본이 바뀌지 않은 파일도 다시 압축')
+@click.option('--no-bundles', is_flag=True, help='flask_assets 번들은 빌드하지 않음')
+def compress_static(force: bool, no_bundles: bool) -> None:
+    """flask_assets 번들을 빌드하고 정적 텍스트 자산의 .br/.gz 압축본을 만듦 (배포 시 실행)
+
+    static 엔드포인트가 Accept-Encoding에 맞는 압축본을 그대로 보내므로 요청 중에는 압축하지 않음.
+    원본을 고친 뒤 다시 실행하지 않으면 오래된 압축본 대신 원본을 압축 없이 보냄.
+    """
+    app = current_app._get_current_object()
+    if not no_bundles:
+        for output, error in build_asset_bundles(app):
+            click.echo(f"번들 {'실패' if error else '빌드'}: {output}{f' ({error})' if error else ''}",
+                       err=bool(error))
+    if not BROTLI_AVAILABLE:
+        click.echo("brotli 모듈이 없어 .gz 압축본만 만듭니다")
+    report = precompress_static(app.static_folder, force=force)
+    for path, error in report.failed:
+        click.echo(f"실패: {path} ({error})", err=True)
+    click.echo(f"완료: {len(report.written)}개 기록, {report.unchanged}개 변경 없음, "
+               f"{len(report.removed)}개 삭제, {len(report.failed)}개 실패")
+    if report.failed:
+        raise SystemExit(1)
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.normalize-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.chmod(tmp_path, path.stat().st_mode & 0o777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def register_commands(app: Flask) -> None:
+    """flask CLI 명령 등록 (예: flask posts normalize-encoding)"""
+    app.cli.add_command(posts_cli)
+    app.cli.add_command(static_cli)
@@ -15,7 +15,13 @@ the original code have been fixed:
 from flask import Blueprint, render_template, current_app, jsonify, request, Response, url_for
 from typing import List, Dict, Any
 from datetime import datetime
-from app.services.text_service import TextPost, get_all_text_posts, get_tags_count
+from app.services.text_service import (
+    TextPost, get_all_text_posts, get_tags_count, get_render_cache, get_body_cache, get_related_tags, get_tag_graph,
+    get_posts_page
+)
+from app.services.http_cache import conditional
+from app.services.pagination import parse_page_args
+from app.services.response_cache import cached, get_response_cache
 from app.services.color_service import ColorService
 import os
 
@@ -23,6 +29,8 @@ import os
 main_bp = Blueprint('main', __name__)
 
 @main_bp.route('/')
+@conditional()
+@cached()
 def index():
     """Render the home page with all posts, recent posts, and popular tags."""
     try:
@@ -44,7 +52,7 @@ def index():
             recent_posts=[],
             popular_tags=[],
             error_message="일시적으로 콘텐츠를 불러올 수 없습니다."
-        )
+        ), 500
 
 @main_bp.route('/about')
 def about():
@@ -66,16 +74,15 @@ def network():
 
 @main_bp.route('/magazine')
 def magazine():
-    page = request.args.get('page', 1, type=int)
     PER_PAGE = 9
     posts_dir = current_app.config.get('POSTS_DIR')
-    all_posts = get_all_text_posts(posts_dir)
-    total_posts = len(all_posts)
-    total_pages = (total_posts + PER_PAGE - 1) // PER_PAGE
-
-    start = (page - 1) * PER_PAGE
-    end = start + PER_PAGE
-    paginated_posts = all_posts[start:end]
+    try:
+        after, before, _ = parse_page_args(request.args, PER_PAGE, PER_PAGE)
+        page = get_posts_page(posts_dir, after=after, before=before, per_page=PER_PAGE)
+    except ValueError:
+        # 잘못된 커서는 첫 페이지로
+        page = get_posts_page(posts_dir, per_page=PER_PAGE)
+    paginated_posts = page.items
 
     posts_with_colors = []
     for post in paginated_posts:
@@ -93,8 +100,13 @@ def magazine():
     return render_template(
         'magazine.html', 
         posts_with_colors=posts_with_colors,
-        current_page=page,
-        total_pages=total_pages
+        current_page=page.offset // PER_PAGE + 1,
+        total_pages=(page.total + PER_PAGE - 1) // PER_PAGE,
+        page=page,
+        page_links={
+            'prev': url_for('main.magazine', before=page.prev_cursor) if page.prev_cursor else None,
+            'next': url_for('main.magazine', after=page.next_cursor) if page.next_cursor else None,
+        }
     )
 
 @main_bp.route('/api/status')
@@ -119,12 +131,20 @@ def api_status():
         except Exception as content_error:
             current_app.logger.warning(f'콘텐츠 통계 수집 실패: {content_error}')
             status_info['content'] = {'status': 'unavailable'}
+        status_info['render_cache'] = get_render_cache().stats()
+        status_info['body_cache'] = get_body_cache().stats()
+        fragment_cache = current_app.jinja_env.fragment_cache
+        status_info['fragment_cache'] = fragment_cache.stats() if fragment_cache else None
+        response_cache = get_response_cache()
+        status_info['response_cache'] = response_cache.stats() if response_cache else None
         return jsonify(status_info)
     except Exception as e:
         current_app.logger.error(f'상태 API 오류: {e}')
         return jsonify({'status': 'error', 'message': '시스템 상태를 확인할 수 없습니다'}), 500
 
 @main_bp.route('/api/tags')
+@conditional(per_session=False)
+@cached()
 def api_tags():
     """Return a tag cloud along with some statistics."""
     try:
@@ -159,21 +179,33 @@ def api_tags():
         current_app.logger.error(f'태그 API 오류: {e}')
         return jsonify({'error': '태그 정보를 가져올 수 없습니다'}), 500
 
+@main_bp.route('/api/tags/graph')
+@conditional(per_session=False)
+@cached()
+def api_tags_graph():
+    """Return the whole tag co-occurrence network (nodes and weighted edges)."""
+    try:
+        posts_dir = current_app.config.get('POSTS_DIR')
+        graph = get_tag_graph(posts_dir)
+        return jsonify({
+            'nodes': graph['nodes'],
+            'edges': graph['edges'],
+            'stats': {'total_tags': len(graph['nodes']), 'total_edges': len(graph['edges'])}
+        })
+    except Exception as e:
+        current_app.logger.error(f'태그 그래프 API 오류: {e}')
+        return jsonify({'error': '태그 그래프를 가져올 수 없습니다'}), 500
+
 @main_bp.route('/api/related-tags/<tag>')
+@conditional('tag', per_session=False)
+@cached()
 def api_related_tags(tag: str):
     """Find tags that are frequently used together with the given tag."""
     try:
         posts_dir = current_app.config.get('POSTS_DIR')
-        all_posts = get_all_text_posts(posts_dir)
-        posts_with_tag = [p for p in all_posts if tag in p.tags]
-        if not posts_with_tag:
+        sorted_related = get_related_tags(posts_dir, tag, 10)
+        if sorted_related is None:
             return jsonify({'related_tags': []})
-        related_tags: Dict[str, int] = {}
-        for post in posts_with_tag:
-            for other_tag in post.tags:
-                if other_tag != tag:
-                    related_tags[other_tag] = related_tags.get(other_tag, 0) + 1
-        sorted_related = sorted(related_tags.items(), key=lambda x: x[1], reverse=True)[:10]
         return jsonify({
             'tag': tag,
             'related_tags': [
@@ -218,6 +250,7 @@ Sitemap: /sitemap.xml
     return Response(robots_content.strip(), mimetype='text/plain')
 
 @main_bp.route('/sitemap.xml')
+@conditional(per_session=False, daily=True)
 def sitemap_xml() -> Response:
     """Generate and return a sitemap XML with URLs from the site."""
     try:
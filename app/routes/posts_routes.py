@@ -11,18 +11,26 @@ rendering remain consistent with the original code.
 """
 
 from flask import Blueprint, render_template, send_from_directory, current_app, abort, url_for, request, redirect, jsonify
+import hashlib
 import os
 import re
 from werkzeug.utils import secure_filename
-from markupsafe import escape
+from markupsafe import Markup, escape
 from app.services.text_service import (
-    get_all_text_posts, get_text_post, get_tags_count,
-    get_series_posts, get_adjacent_posts, render_content
+    get_text_post, get_tags_count, get_post_by_slug,
+    get_series_posts, get_adjacent_posts, render_post_content, get_tag_completions, get_tags_snapshot,
+    get_related_tags, get_posts_page, get_series_page, get_listing_page, PostSummary
 )
-from typing import Dict, List, Any
+from app.services.http_cache import conditional, sessionless
+from app.services.response_cache import cached
+from app.services.pagination import DEFAULT_PER_PAGE, MAX_PER_PAGE, Page, parse_page_args
+from app.services.search_service import MAX_QUERY_LENGTH, search_posts
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 posts_bp = Blueprint('posts', __name__, url_prefix='/posts')
 
+T = TypeVar('T')
+
 # Allowed media extensions per media type
 ALLOWED_EXTENSIONS = {
     'image': {'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'heic', 'heif'},
@@ -30,6 +38,30 @@ ALLOWED_EXTENSIONS = {
     'audio': {'mp3', 'wav', 'ogg', 'flac', 'm4a'}
 }
 
+# Fields available to /posts/api/list (text fields are returned unescaped)
+LIST_FIELDS: Dict[str, Callable[[PostSummary], Any]] = {
+    'id': lambda post: post.id,
+    'slug': lambda post: post.slug,
+    'url': lambda post: post.get_url(),
+    'title': lambda post: plain_text(post.title),
+    'date': lambda post: post.date.isoformat(),
+    'author': lambda post: plain_text(post.author),
+    'tags': lambda post: [plain_text(tag) for tag in post.tags],
+    'series': lambda post: plain_text(post.series) if post.series else None,
+    'series_part': lambda post: post.series_part,
+    'preview': lambda post: plain_text(post.get_preview(100)),
+    'image': lambda post: url_for('posts.serve_image', filename=post.image_filename) if post.image_filename else None,
+    'image_alt': lambda post: plain_text(post.image_alt) if post.image_filename else None,
+    'word_count': lambda post: post.get_word_count(),
+}
+DEFAULT_LIST_FIELDS = ('slug', 'url', 'title', 'date', 'tags', 'preview')
+# Fields the index page's infinite scroll needs to build a card
+CARD_LIST_FIELDS = ('url', 'title', 'date', 'tags', 'preview', 'image', 'image_alt')
+# Bump when the JSON shape changes so long-cached responses are not reused
+LIST_API_VERSION = 1
+LIST_CACHE_MAX_AGE = 60
+LIST_IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
 # Safe filename base pattern (excluding extension)
 SAFE_FILENAME_BASE_PATTERN = re.compile(r'^[a-zA-Z0-9_\-]+$')
 
@@ -65,15 +97,55 @@ def validate_media_filename(filename: str, media_type: str) -> bool:
         return False
     return ext in ALLOWED_EXTENSIONS[media_type]
 
+def fetch_page(fetch: Callable[..., T], *args: Any) -> T:
+    """Fetch one listing page using the ``after``/``before``/``per_page`` query args.
+
+    A malformed cursor falls back to the first page, like unknown query args did before cursors.
+    """
+    default_per_page = current_app.config.get('POSTS_PER_PAGE', DEFAULT_PER_PAGE)
+    try:
+        after, before, per_page = parse_page_args(
+            request.args, default_per_page, current_app.config.get('MAX_POSTS_PER_PAGE', MAX_PER_PAGE)
+        )
+        return fetch(*args, after=after, before=before, per_page=per_page)
+    except ValueError:
+        current_app.logger.info(f"잘못된 페이지 커서, 첫 페이지로 응답: {request.full_path}")
+        return fetch(*args, per_page=default_per_page)
+
+def page_links(page: Page, endpoint: str, **values: Any) -> Dict[str, Optional[str]]:
+    """Build ``rel=prev/next`` URLs for a page, keeping an explicit ``per_page``."""
+    if 'per_page' in request.args:
+        values['per_page'] = page.per_page
+    return {
+        'prev': url_for(endpoint, before=page.prev_cursor, **values) if page.prev_cursor else None,
+        'next': url_for(endpoint, after=page.next_cursor, **values) if page.next_cursor else None,
+    }
+
+def plain_text(value: Any) -> str:
+    """Undo the HTML escaping applied when posts are parsed (for JSON clients)."""
+    return value.unescape() if isinstance(value, Markup) else str(value)
+
+def list_api_url(page: Page, version: str, **values: Any) -> Optional[str]:
+    """URL of the next JSON page pinned to the snapshot ``version`` (cacheable for long)."""
+    if not page.next_cursor:
+        return None
+    return url_for('posts.api_list', after=page.next_cursor, per_page=page.per_page, v=version, **values)
+
 @posts_bp.route('/')
+@conditional()
+@cached()
 def index():
     """List all posts on the blog index page."""
+    posts_dir = current_app.config.get('POSTS_DIR')
+    version, page = fetch_page(get_listing_page, posts_dir)
     try:
+        if not version:
+            # 스냅샷을 만들지 못해 빈 페이지가 돌아옴 - 오류 화면(500)으로 응답해 캐시되지 않도록 함
+            raise RuntimeError("포스트 스냅샷을 만들 수 없습니다")
         current_app.logger.info("포스트 인덱스 페이지 로드 시작")
-        posts_dir = current_app.config.get('POSTS_DIR')
-        posts = get_all_text_posts(posts_dir)
-        tags_count = get_tags_count(posts_dir)
-        current_app.logger.info(f"로드된 포스트 수: {len(posts) if posts else 0}")
+        posts = page.items
+        tags_version, tags_count = get_tags_snapshot(posts_dir)
+        current_app.logger.info(f"로드된 포스트 수: {len(posts)}/{page.total}")
         current_app.logger.info(f"로드된 태그 수: {len(tags_count) if tags_count else 0}")
         tags = []
         if tags_count:
@@ -81,12 +153,16 @@ def index():
                 {"name": escape(tag), "count": count}
                 for tag, count in sorted(tags_count.items(), key=lambda x: x[1], reverse=True)[:20]
             ]
-        recent_posts = posts[:5] if posts and len(posts) > 5 else posts or []
+        recent_posts = posts[:5] if page.offset == 0 else get_posts_page(posts_dir, per_page=5).items
         return render_template(
             'posts/index.html',
-            posts=posts or [],
+            posts=posts,
             tags=tags or [],
-            recent_posts=recent_posts or []
+            tags_version=tags_version,
+            recent_posts=recent_posts,
+            page=page,
+            page_links=page_links(page, 'posts.index'),
+            list_next_url=list_api_url(page, version, fields=','.join(CARD_LIST_FIELDS))
         )
     except Exception as e:
         current_app.logger.error(f'포스트 목록 로드 오류: {str(e)}', exc_info=True)
@@ -96,9 +172,11 @@ def index():
             tags=[],
             recent_posts=[],
             error_message=f"포스트를 로드하는 중 오류가 발생했습니다: {str(e)}"
-        )
+        ), 500
 
 @posts_bp.route('/tags')
+@conditional()
+@cached()
 def tags_overview():
     """Display an overview of all tags grouped alphabetically."""
     try:
@@ -134,21 +212,22 @@ def tags_overview():
         abort(500)
 
 @posts_bp.route('/<slug>')
+@conditional('slug')
+@cached()
 def view_by_slug(slug: str):
     """Display a single post by its slug."""
     if not validate_slug(slug):
         abort(400, "잘못된 요청입니다")
     posts_dir = current_app.config.get('POSTS_DIR')
     try:
-        all_posts = get_all_text_posts(posts_dir)
-        matching_post = next((p for p in all_posts if p.slug == slug), None)
+        matching_post = get_post_by_slug(posts_dir, slug)
         if not matching_post:
             abort(404, "포스트를 찾을 수 없습니다")
         base_url_images = url_for('posts.serve_image', filename='').rstrip('/')
         base_url_videos = url_for('posts.serve_video', filename='').rstrip('/')
         base_url_audios = url_for('posts.serve_audio', filename='').rstrip('/')
-        rendered_content = render_content(
-            matching_post.content,
+        rendered_content = render_post_content(
+            matching_post,
             base_url_images,
             base_url_videos,
             base_url_audios
@@ -194,37 +273,33 @@ def view_post(filename: str):
     return redirect(url_for('posts.view_by_slug', slug=slug_candidate), code=301)
 
 @posts_bp.route('/tag/<tag>')
+@conditional('tag')
+@cached()
 def filter_by_tag(tag: str):
     """Filter posts by a specific tag."""
     if not validate_tag(tag):
         abort(400, "잘못된 태그입니다")
+    posts_dir = current_app.config.get('POSTS_DIR')
+    page = fetch_page(get_posts_page, posts_dir, tag)
     try:
-        posts_dir = current_app.config.get('POSTS_DIR')
-        posts = get_all_text_posts(posts_dir, tag=tag)
-        tags_count = get_tags_count(posts_dir)
-        # Find related tags
-        related_tags_list: List[str] = []
-        for post in posts:
-            for other_tag in post.tags:
-                if other_tag != tag:
-                    related_tags_list.append(other_tag)
-        related_tag_counts: Dict[str, int] = {}
-        for t in related_tags_list:
-            related_tag_counts[t] = related_tag_counts.get(t, 0) + 1
-        top_related_tags = sorted(related_tag_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+        posts = page.items
+        tags_version, tags_count = get_tags_snapshot(posts_dir)
+        top_related_tags = get_related_tags(posts_dir, tag, 5) or []
         all_tags = [
             {"name": escape(t), "count": c}
             for t, c in sorted(tags_count.items(), key=lambda x: x[1], reverse=True)[:20]
         ]
-        all_posts = get_all_text_posts(posts_dir)
-        recent_posts = all_posts[:5] if len(all_posts) > 5 else all_posts
+        recent_posts = get_posts_page(posts_dir, per_page=5).items
         return render_template(
             'posts/tag.html',
             posts=posts,
+            page=page,
+            page_links=page_links(page, 'posts.filter_by_tag', tag=tag),
             current_tag=escape(tag),
             tag_count=tags_count.get(tag, 0),
             related_tags=[{"name": escape(t), "count": c} for t, c in top_related_tags],
             all_tags=all_tags,
+            tags_version=tags_version,
             recent_posts=recent_posts
         )
     except Exception as e:
@@ -232,52 +307,154 @@ def filter_by_tag(tag: str):
         abort(500)
 
 @posts_bp.route('/api/tags/autocomplete')
+@sessionless
 def tag_autocomplete():
     """Autocomplete API for tags. Returns up to 10 matching tags."""
     query = request.args.get('q', '').strip().lower()
     if not query or len(query) < 2:
         return jsonify([])
+    posts_dir = current_app.config.get('POSTS_DIR')
+    response = jsonify(get_tag_completions(posts_dir, query))
+    # 키 입력마다 호출되므로 잠깐 캐시하고, 같은 결과면 304로 응답
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    response.add_etag()
+    return response.make_conditional(request)
+
+@posts_bp.route('/api/search')
+@conditional(per_session=False)
+@cached()
+def api_search():
+    """Full-text search API. Returns BM25-ranked posts with highlighted snippets."""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': '검색어를 입력하세요'}), 400
+    if len(query) > MAX_QUERY_LENGTH:
+        return jsonify({'error': f'검색어는 {MAX_QUERY_LENGTH}자 이하여야 합니다'}), 400
+    page = max(request.args.get('page', 1, type=int) or 1, 1)
+    per_page = min(max(request.args.get('per_page', 10, type=int) or 10, 1), 50)
     try:
         posts_dir = current_app.config.get('POSTS_DIR')
-        tags_count = get_tags_count(posts_dir)
-        matching_tags = [
-            {'name': tag, 'count': count, 'url': f'/posts/tag/{tag}'}
-            for tag, count in tags_count.items()
-            if tag.lower().startswith(query)
-        ]
-        containing_tags = [
-            {'name': tag, 'count': count, 'url': f'/posts/tag/{tag}'}
-            for tag, count in tags_count.items()
-            if query in tag.lower() and not tag.lower().startswith(query)
-        ]
-        all_matches = matching_tags + containing_tags
-        all_matches.sort(key=lambda x: x['count'], reverse=True)
-        return jsonify(all_matches[:10])
+        results, total, complete = search_posts(query, page, per_page, posts_dir)
+        response = jsonify({
+            'query': query,
+            'total': total,
+            'partial': not complete,
+            'page': page,
+            'per_page': per_page,
+            'pages': (total + per_page - 1) // per_page,
+            'results': [
+                {
+                    'title': str(result.post.title),
+                    'url': result.post.get_url(),
+                    'date': result.post.date.isoformat(),
+                    'tags': list(result.post.tags),
+                    'snippet': str(result.snippet),
+                    'score': round(result.score, 4),
+                }
+                for result in results
+            ]
+        })
+        if not complete:
+            # 색인 중의 부분 결과는 캐시하지 않음
+            response.cache_control.no_store = True
+        return response
     except Exception as e:
-        current_app.logger.error(f'태그 자동완성 오류: {e}')
-        return jsonify([])
+        current_app.logger.error(f'검색 API 오류: {e}', exc_info=True)
+        return jsonify({'error': '검색 결과를 가져올 수 없습니다'}), 500
+
+@posts_bp.route('/api/list')
+@sessionless
+def api_list():
+    """Post summaries as JSON for infinite scroll, with cursor pagination and ``fields=`` projection."""
+    tag = request.args.get('tag') or None
+    series = request.args.get('series') or None
+    if tag and not validate_tag(tag):
+        return jsonify({'error': '잘못된 태그입니다'}), 400
+    if series and len(series) > 100:
+        return jsonify({'error': '잘못된 시리즈명입니다'}), 400
+    if tag and series:
+        return jsonify({'error': 'tag와 series는 함께 지정할 수 없습니다'}), 400
+    fields_arg = request.args.get('fields')
+    fields = [name.strip() for name in fields_arg.split(',') if name.strip()] if fields_arg else list(DEFAULT_LIST_FIELDS)
+    unknown = [name for name in fields if name not in LIST_FIELDS]
+    if unknown or not fields:
+        return jsonify({'error': f'알 수 없는 필드: {", ".join(unknown)}', 'fields': list(LIST_FIELDS)}), 400
+    try:
+        after, before, per_page = parse_page_args(
+            request.args,
+            current_app.config.get('POSTS_PER_PAGE', DEFAULT_PER_PAGE),
+            current_app.config.get('MAX_POSTS_PER_PAGE', MAX_PER_PAGE)
+        )
+        posts_dir = current_app.config.get('POSTS_DIR')
+        version, page = get_listing_page(posts_dir, tag, series, after, before, per_page)
+    except ValueError:
+        return jsonify({'error': '잘못된 페이지 요청입니다'}), 400
+    except Exception as e:
+        current_app.logger.error(f'포스트 목록 API 오류: {e}', exc_info=True)
+        return jsonify({'error': '포스트 목록을 가져올 수 없습니다'}), 500
+    if not version:
+        # 스냅샷을 만들지 못함 - 빈 목록을 공개 캐시에 남기지 않도록 오류로 응답
+        return jsonify({'error': '포스트 목록을 가져올 수 없습니다'}), 500
+    if series and not page.total:
+        # 스냅샷의 시리즈 목록에 없는 이름은 캐시 가능한 빈 목록 대신 404
+        return jsonify({'error': '시리즈를 찾을 수 없습니다'}), 404
+
+    # 같은 스냅샷과 같은 요청이면 내용이 같으므로 본문을 만들기 전에 304로 응답
+    etag = hashlib.blake2b(
+        f'{LIST_API_VERSION}|{version}|'.encode() + request.query_string, digest_size=12
+    ).hexdigest()
+    pinned = request.args.get('v') == version
+    if request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        filters = {key: value for key, value in (('tag', tag), ('series', series)) if value}
+        if fields_arg:
+            filters['fields'] = ','.join(fields)
+        response = jsonify({
+            'version': version,
+            'total': page.total,
+            'offset': page.offset,
+            'per_page': page.per_page,
+            'next_cursor': page.next_cursor,
+            'prev_cursor': page.prev_cursor,
+            'next_url': list_api_url(page, version, **filters),
+            'posts': [{name: LIST_FIELDS[name](post) for name in fields} for post in page.items],
+        })
+    # 압축 미들웨어가 강한 ETag에 인코딩을 덧붙이므로 약한 ETag로 비교
+    response.set_etag(etag, weak=True)
+    # 스냅샷 식별자(v)가 맞는 요청은 내용이 바뀌지 않으므로 오래 캐시
+    response.cache_control.public = True
+    response.cache_control.max_age = LIST_IMMUTABLE_MAX_AGE if pinned else LIST_CACHE_MAX_AGE
+    if pinned:
+        response.cache_control.immutable = True
+    return response
 
 @posts_bp.route('/series/<series_name>')
+@conditional('series_name')
+@cached()
 def view_series(series_name: str):
     """Display all posts that belong to a series."""
     if not series_name or not isinstance(series_name, str) or len(series_name) > 100:
         abort(400, "잘못된 시리즈명입니다")
+    posts_dir = current_app.config.get('POSTS_DIR')
+    page = fetch_page(get_series_page, posts_dir, series_name)
+    # 커서가 마지막 글을 지나면 빈 페이지 - 포스트가 하나도 없는 시리즈만 404
+    if not page.total:
+        abort(404, "시리즈를 찾을 수 없습니다")
     try:
-        posts_dir = current_app.config.get('POSTS_DIR')
-        series_posts = get_series_posts(posts_dir, series_name)
-        if not series_posts:
-            abort(404, "시리즈를 찾을 수 없습니다")
         tags_count = get_tags_count(posts_dir)
         tags = [
             {"name": escape(tag), "count": count}
             for tag, count in sorted(tags_count.items(), key=lambda x: x[1], reverse=True)[:10]
         ]
-        all_posts = get_all_text_posts(posts_dir)
-        recent_posts = all_posts[:5] if len(all_posts) > 5 else all_posts
+        recent_posts = get_posts_page(posts_dir, per_page=5).items
         return render_template(
             'posts/series.html',
             series_name=escape(series_name),
-            posts=series_posts,
+            posts=page.items,
+            page=page,
+            page_links=page_links(page, 'posts.view_series', series_name=series_name),
             tags=tags,
             recent_posts=recent_posts
         )
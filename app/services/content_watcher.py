@@ -0,0 +1,214 @@
+# app/services/content_watcher.py
+import atexit
+import os
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from blinker import Namespace
+from flask import Flask
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_ENABLED = True
+except ImportError:
+    INotify = None  # type: ignore
+    inotify_flags = None  # type: ignore
+    INOTIFY_ENABLED = False
+
+_signals = Namespace()
+
+# sender: 변경 종류('posts', 'post_images', 'gallery'), kwargs: directory, names
+content_changed = _signals.signal('content-changed')
+
+_active_watcher: Optional['ContentWatcher'] = None
+_watcher_lock = threading.Lock()
+
+def _normalize(directory: str) -> str:
+    return os.path.realpath(directory)
+
+def is_watched(resolved_dir: Optional[str]) -> bool:
+    """절대 경로 ``resolved_dir``의 변경이 감시자로 통지되는지 여부 (요청 경로에서 stat 생략 판단용)"""
+    watcher = _active_watcher
+    if watcher is None or not resolved_dir:
+        return False
+    # fork 전에 시작된 감시자의 스레드는 자식 프로세스(gunicorn --preload 워커)에 없으므로 처음 확인할 때 다시 시작
+    if watcher.pid != os.getpid() and not _restart_in_child(watcher):
+        return False
+    return watcher.watches(resolved_dir)
+
+class ContentWatcher:
+    """콘텐츠 디렉토리 변경을 감지해 디바운스 후 content_changed 시그널 발행"""
+
+    def __init__(self, directories: Dict[str, str], poll_interval: float = 2.0,
+                 debounce: float = 0.5, logger=None):
+        self.directories = {kind: _normalize(path) for kind, path in directories.items()
+                            if path and os.path.isdir(path)}
+        self._paths = {path: kind for kind, path in self.directories.items()}
+        self.poll_interval = max(poll_interval, 0.1)
+        self.debounce = max(debounce, 0.0)
+        self.logger = logger
+        self.backend = 'inotify' if INOTIFY_ENABLED else 'polling'
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pending: Dict[str, Set[str]] = {}
+        self._last_event = 0.0
+        # 감시 스레드를 시작한 프로세스
+        self.pid: Optional[int] = None
+
+    def watches(self, resolved_dir: str) -> bool:
+        return resolved_dir in self._paths
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive() and self.pid == os.getpid():
+            return
+        target = self._run_inotify if self.backend == 'inotify' else self._run_polling
+        if self.pid != os.getpid():
+            # fork된 자식: 부모의 스레드 상태는 쓸 수 없으므로 새로 만듦
+            self._stop = threading.Event()
+            self._pending = {}
+        self._stop.clear()
+        self.pid = os.getpid()
+        self._thread = threading.Thread(target=target, name='content-watcher', daemon=True)
+        self._thread.start()
+        self._log('info', f"[Watcher] 감시 시작 ({self.backend}): {', '.join(self.directories)}")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if (self._thread and self.pid == os.getpid() and self._thread.is_alive()
+                and self._thread is not threading.current_thread()):
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _log(self, level: str, message: str) -> None:
+        if self.logger is not None:
+            getattr(self.logger, level)(message)
+
+    def _record(self, kind: str, name: str) -> None:
+        self._pending.setdefault(kind, set()).add(name)
+        self._last_event = time.monotonic()
+
+    def _flush_if_quiet(self) -> None:
+        if not self._pending or time.monotonic() - self._last_event < self.debounce:
+            return
+        pending, self._pending = self._pending, {}
+        for kind, names in pending.items():
+            self._log('debug', f"[Watcher] 변경 감지 {kind}: {sorted(names)[:10]}")
+            try:
+                content_changed.send(kind, directory=self.directories[kind], names=frozenset(names))
+            except Exception as e:
+                self._log('error', f"[Watcher] 변경 통지 실패 ({kind}): {e}")
+
+    def _run_inotify(self) -> None:
+        mask = (inotify_flags.CREATE | inotify_flags.MODIFY | inotify_flags.CLOSE_WRITE |
+                inotify_flags.DELETE | inotify_flags.MOVED_FROM | inotify_flags.MOVED_TO |
+                inotify_flags.ATTRIB)
+        wait_ms = int(max(self.debounce, 0.1) * 1000)
+        try:
+            with INotify() as inotify:
+                watch_kinds = {inotify.add_watch(path, mask): kind for kind, path in self.directories.items()}
+                while not self._stop.is_set():
+                    for event in inotify.read(timeout=wait_ms):
+                        kind = watch_kinds.get(event.wd)
+                        if kind:
+                            self._record(kind, event.name)
+                    self._flush_if_quiet()
+        except OSError as e:
+            # 감시 한도 초과 등으로 inotify를 쓸 수 없으면 폴링으로 전환
+            self._log('warning', f"[Watcher] inotify 사용 불가, 폴링으로 전환: {e}")
+            self.backend = 'polling'
+            self._run_polling()
+
+    @staticmethod
+    def _snapshot(directory: str) -> Dict[str, Tuple[int, int, int]]:
+        snapshot = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    snapshot[entry.name] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            pass
+        return snapshot
+
+    def _run_polling(self) -> None:
+        snapshots = {kind: self._snapshot(path) for kind, path in self.directories.items()}
+        while not self._stop.wait(self.poll_interval if not self._pending else min(self.poll_interval, self.debounce)):
+            for kind, path in self.directories.items():
+                current = self._snapshot(path)
+                previous = snapshots[kind]
+                if current != previous:
+                    for name in set(current) | set(previous):
+                        if current.get(name) != previous.get(name):
+                            self._record(kind, name)
+                    snapshots[kind] = current
+            self._flush_if_quiet()
+
+def start_content_watcher(app: Flask) -> Optional[ContentWatcher]:
+    """설정에 따라 콘텐츠 감시자를 시작하고 종료 시 정리되도록 등록"""
+    global _active_watcher
+    if not app.config.get('CONTENT_WATCHER_ENABLED', False):
+        return None
+    directories = {
+        'posts': app.config.get('POSTS_DIR'),
+        'post_images': os.path.join(app.static_folder, 'images', 'posts'),
+        'gallery': app.config.get('GALLERY_PHOTOS_DIR'),
+    }
+    # 정적 파일 매니페스트 갱신용 ('static:css' 등)
+    from app.services.static_manifest import watched_static_directories
+    directories.update(watched_static_directories(app.static_folder))
+    watcher = ContentWatcher(
+        directories,
+        poll_interval=app.config.get('CONTENT_WATCHER_POLL_INTERVAL', 2.0),
+        debounce=app.config.get('CONTENT_WATCHER_DEBOUNCE', 0.5),
+        logger=app.logger,
+    )
+    if not watcher.directories:
+        app.logger.warning("[Watcher] 감시할 디렉토리가 없습니다.")
+        return None
+    with _watcher_lock:
+        if _active_watcher is not None:
+            _active_watcher.stop()
+        _active_watcher = watcher
+        watcher.start()
+    _notify_all(watcher)
+    app.extensions['content_watcher'] = watcher
+    return watcher
+
+def _notify_all(watcher: ContentWatcher) -> None:
+    # 감시 시작 전에 일어난 변경을 놓치지 않도록 한 번 전체 무효화
+    for kind, path in watcher.directories.items():
+        content_changed.send(kind, directory=path, names=frozenset())
+
+def _restart_in_child(watcher: ContentWatcher) -> bool:
+    """fork된 자식에서 감시 스레드를 새로 시작 - 실패하면 False (요청 경로는 stat 비교로 동작)"""
+    with _watcher_lock:
+        if watcher is not _active_watcher: return False
+        if watcher.pid == os.getpid(): return True
+        try:
+            watcher.start()
+        except Exception as e:
+            watcher._log('error', f"[Watcher] fork 후 감시 재시작 실패: {e}")
+            return False
+    _notify_all(watcher)
+    return True
+
+def _reset_lock_after_fork() -> None:
+    global _watcher_lock
+    # 부모의 다른 스레드가 잡고 있던 잠금은 자식에서 풀리지 않음
+    _watcher_lock = threading.Lock()
+
+def stop_content_watcher() -> None:
+    global _active_watcher
+    with _watcher_lock:
+        if _active_watcher is not None:
+            _active_watcher.stop()
+            _active_watcher = None
+
+# 프로세스 종료 시 한 번만 정리 (create_app을 여러 번 불러도 중복 등록하지 않음)
+atexit.register(stop_content_watcher)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_lock_after_fork)
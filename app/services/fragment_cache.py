@@ -0,0 +1,45 @@
+# app/services/fragment_cache.py
+import itertools
+from typing import Any, Callable, Hashable, Tuple
+
+from flask import has_request_context, request
+from jinja2 import nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+
+FRAGMENT_CACHE_MAX_BYTES = 8 * 1024 * 1024
+# 템플릿을 다시 컴파일할 때마다(개발 환경 자동 리로드) 새 키를 쓰도록 붙이는 번호
+_compilations = itertools.count(1)
+
+class FragmentCacheExtension(Extension):
+    """``{% cache key, ... %}...{% endcache %}`` - 같은 키면 렌더링된 HTML 조각을 재사용
+
+    키에는 템플릿 이름/위치와 요청의 script_root가 자동으로 붙으므로 조각을 결정하는 값만 넘기면 됨
+    (포스트 카드는 ``post.cache_key``, 태그 목록은 ``tags_version``). 키 값은 해시 가능해야 함.
+    """
+    tags = {'cache'}
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        environment.extend(fragment_cache=None)
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        key_parts = [parser.parse_expression()]
+        while parser.stream.skip_if('comma'):
+            key_parts.append(parser.parse_expression())
+        body = parser.parse_statements(('name:endcache',), drop_needle=True)
+        location = nodes.Const(f'{parser.name}:{lineno}:{next(_compilations)}')
+        return nodes.CallBlock(
+            self.call_method('_render_cached', [location, nodes.Tuple(key_parts, 'load')]), [], [], body
+        ).set_lineno(lineno)
+
+    def _render_cached(self, location: str, key_parts: Tuple[Hashable, ...], caller: Callable[[], Any]) -> Any:
+        cache = self.environment.fragment_cache
+        if cache is None: return caller()
+        key = (location, request.script_root if has_request_context() else '', key_parts)
+        fragment = cache.get(key)
+        if fragment is None:
+            fragment = caller()
+            cache.set(key, fragment)
+        return fragment
@@ -0,0 +1,229 @@
+# app/services/freeze_service.py
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from flask import Flask, url_for
+
+from app.services.http_cache import site_inputs, tree_signature
+from app.services.post_corpus import get_corpus
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+MANIFEST_NAME = '.freeze-manifest.json'
+MANIFEST_VERSION = 2
+# 미리 압축해 둘 응답 형식 (nginx gzip_static / brotli_static 용)
+COMPRESSIBLE_MIMETYPES = {'text/html', 'text/plain', 'text/xml', 'application/xml', 'application/json'}
+MIN_COMPRESS_SIZE = 256
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+# 정적 HTML에 남기면 안 되는 요청별 값 - 렌더링 시점의 CSP nonce와 내보내기 요청 세션의 CSRF 토큰
+_NONCE_ATTRIBUTE_PATTERN = re.compile(r'\snonce="([^"]*)"')
+_CSRF_META_PATTERN = re.compile(r'[ \t]*<meta name="csrf-token" content="[^"]*">[ \t]*\n?')
+
+@dataclass
+class FreezeReport:
+    written: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    removed: List[str] = field(default_factory=list)
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+
+def _digest(*parts: Any) -> str:
+    return hashlib.blake2b(repr(parts).encode('utf-8', 'surrogateescape'), digest_size=12).hexdigest()
+
+def collect_pages(app: Flask, include_gallery: bool = True) -> Dict[str, str]:
+    """내보낼 URL과 페이지별 입력 지문 - 지문이 그대로면 다시 렌더링하지 않음 (요청 컨텍스트 안에서 호출)"""
+    from app.routes.posts_routes import validate_slug, validate_tag
+
+    root = Path(app.root_path)
+    global_key, _ = site_inputs(app)
+    corpus = get_corpus(app.config.get('POSTS_DIR'))
+    # 목록형 페이지는 포스트 구성 전체에 의존
+    corpus_key = _digest(global_key, corpus.get_fingerprint())
+    tags_count = corpus.get_tags_count()
+    popular_tags = sorted(tags_count.items(), key=lambda x: x[1], reverse=True)[:20]
+    top_tags = popular_tags[:10]
+    signatures = lambda posts: [(p.filename, corpus.signatures.get(p.filename)) for p in posts]
+    recent = signatures(corpus.posts[:5])
+
+    pages = {
+        url_for('main.index'): corpus_key,
+        url_for('main.about'): global_key,
+        url_for('main.robots_txt'): global_key,
+        # 사이트맵 lastmod에 오늘 날짜가 들어감
+        url_for('main.sitemap_xml'): _digest(corpus_key, date.today().isoformat()),
+        url_for('posts.index'): corpus_key,
+    }
+    # 태그/시리즈 화면은 해당 포스트와 사이드바(인기 태그, 최근 글)만 보여줌
+    for tag in tags_count:
+        if validate_tag(tag):
+            pages[url_for('posts.filter_by_tag', tag=tag)] = _digest(
+                global_key, signatures(corpus.get_tagged(tag)), popular_tags, recent
+            )
+    for series_name in sorted({post.series for post in corpus.posts if post.series}):
+        if len(series_name) <= 100:
+            pages[url_for('posts.view_series', series_name=series_name)] = _digest(
+                global_key, signatures(corpus.get_series(series_name)), top_tags, recent
+            )
+    # 포스트 화면은 자기 파일과 이전/다음, 같은 시리즈 글, 상위 태그만 보여줌
+    for slug, post in corpus.by_slug.items():
+        if not validate_slug(slug): continue
+        neighbours = [p for p in corpus.get_adjacent(post) if p is not None]
+        if post.series:
+            neighbours.extend(corpus.get_series(post.series))
+        pages[url_for('posts.view_by_slug', slug=slug)] = _digest(
+            global_key, corpus.signatures.get(post.filename), top_tags, signatures(neighbours)
+        )
+    if include_gallery:
+        from app.services.gallery_service import get_all_photos
+        photos_dir = Path(app.config.get('GALLERY_PHOTOS_DIR'))
+        gallery_key = _digest(global_key, tree_signature(photos_dir, '*'),
+                              tree_signature(root / 'static' / 'gallery_thumbnails', '*.json'))
+        pages[url_for('gallery.index')] = gallery_key
+        for photo in get_all_photos():
+            if photo.get('id'):
+                pages[url_for('gallery.detail', filename=photo['id'])] = gallery_key
+    return pages
+
+def output_path(url: str, mimetype: str) -> str:
+    """URL에 대응하는 출력 파일 (HTML은 디렉토리/index.html - nginx: try_files $uri/index.html $uri)"""
+    path = unquote(urlsplit(url).path).strip('/')
+    if mimetype == 'text/html' and not path.endswith('.html'):
+        path = f'{path}/index.html' if path else 'index.html'
+    parts = Path(path).parts
+    if not parts or any(part in ('', '.', '..') for part in parts):
+        raise ValueError(f"내보낼 수 없는 경로: {url}")
+    return path
+
+def strip_request_values(html: str) -> str:
+    """nonce 속성과 csrf-token 메타 태그 제거 - 모든 방문자에게 같은 파일을 보내므로 요청별 값이 없어야 함"""
+    nonces = {nonce for nonce in _NONCE_ATTRIBUTE_PATTERN.findall(html) if nonce}
+    html = _CSRF_META_PATTERN.sub('', _NONCE_ATTRIBUTE_PATTERN.sub('', html))
+    # 스크립트 안에 넣은 nonce (동적으로 추가하는 <script>의 script.nonce 등)
+    for nonce in nonces:
+        html = html.replace(nonce, '')
+    return html
+
+def _write_file(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.freeze-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def _write_page(path: Path, data: bytes, mimetype: str) -> None:
+    """본문과 미리 압축한 .gz/.br 파일 기록 (압축하지 않는 형식은 남은 압축본 삭제)"""
+    _write_file(path, data)
+    variants: Dict[str, Optional[bytes]] = {suffix: None for suffix in COMPRESSED_SUFFIXES}
+    if mimetype in COMPRESSIBLE_MIMETYPES and len(data) >= MIN_COMPRESS_SIZE:
+        variants['.gz'] = gzip.compress(data, compresslevel=9, mtime=0)
+        if BROTLI_AVAILABLE:
+            variants['.br'] = brotli.compress(data, quality=11)
+    for suffix, compressed in variants.items():
+        variant_path = path.with_name(path.name + suffix)
+        if compressed is not None:
+            _write_file(variant_path, compressed)
+        elif variant_path.exists():
+            variant_path.unlink()
+
+def _remove_page(output_dir: Path, relative: str) -> None:
+    path = output_dir / relative
+    for candidate in [path] + [path.with_name(path.name + suffix) for suffix in COMPRESSED_SUFFIXES]:
+        if candidate.exists():
+            candidate.unlink()
+    # 비게 된 상위 디렉토리 정리
+    parent = path.parent
+    while parent != output_dir and parent.is_dir() and not any(parent.iterdir()):
+        parent.rmdir()
+        parent = parent.parent
+
+def _load_manifest(path: Path) -> Dict[str, Dict[str, str]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION: return {}
+    return manifest.get('pages', {})
+
+def freeze_site(app: Flask, output_dir: str, base_url: str = 'http://localhost', workers: Optional[int] = None,
+                force: bool = False, include_gallery: bool = True) -> FreezeReport:
+    """페이지를 정적 파일로 내보냄 - 입력 지문이 바뀐 페이지만 병렬로 렌더링하고 사라진 페이지는 삭제"""
+    output = Path(output_dir).resolve()
+    output.mkdir(parents=True, exist_ok=True)
+    manifest_path = output / MANIFEST_NAME
+    previous = _load_manifest(manifest_path)
+    report = FreezeReport()
+
+    with app.test_request_context(base_url=base_url):
+        pages = collect_pages(app, include_gallery)
+
+    entries: Dict[str, Dict[str, str]] = {}
+    todo: List[Tuple[str, str]] = []
+    for url, key in pages.items():
+        # og:url, 사이트맵 등 절대 URL이 들어가므로 기준 주소도 지문에 포함
+        key = _digest(key, base_url)
+        entry = previous.get(url)
+        if not force and entry and entry.get('key') == key and (output / entry['file']).is_file():
+            entries[url] = entry
+            report.unchanged += 1
+        else:
+            todo.append((url, key))
+
+    def export(item: Tuple[str, str]) -> Tuple[str, str, Optional[str], Optional[str]]:
+        url, key = item
+        try:
+            response = app.test_client(use_cookies=False).get(url, base_url=base_url)
+            if response.status_code != 200:
+                return url, key, None, f"HTTP {response.status_code}"
+            relative = output_path(url, response.mimetype)
+            data = response.get_data()
+            if response.mimetype == 'text/html':
+                data = strip_request_values(data.decode('utf-8')).encode('utf-8')
+            _write_page(output / relative, data, response.mimetype)
+            return url, key, relative, None
+        except Exception as e:
+            return url, key, None, str(e)
+
+    max_workers = workers or app.config.get('POSTS_LOAD_WORKERS', 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for url, key, relative, error in pool.map(export, todo):
+            if relative is None:
+                report.failed.append((url, error or ''))
+                # 일시적인 실패면 이전에 내보낸 파일을 그대로 둠
+                if url in previous:
+                    entries[url] = previous[url]
+                continue
+            entries[url] = {'file': relative, 'key': key}
+            report.written.append(url)
+
+    kept_files = {entry['file'] for entry in entries.values()}
+    for url, entry in previous.items():
+        if url not in entries:
+            if entry.get('file') and entry['file'] not in kept_files:
+                _remove_page(output, entry['file'])
+            report.removed.append(url)
+
+    _write_file(manifest_path, json.dumps(
+        {'version': MANIFEST_VERSION, 'base_url': base_url, 'pages': entries},
+        ensure_ascii=False, indent=1, sort_keys=True
+    ).encode('utf-8'))
+    return report
@@ -9,6 +9,8 @@ from PIL import Image, ImageOps, ImageFilter
 from PIL.ExifTags import TAGS
 from flask import current_app, url_for
 
+from app.services.content_watcher import content_changed, is_watched
+
 # HEIC/HEIF 지원
 try:
     from pillow_heif import register_heif_opener
@@ -35,6 +37,16 @@ _photo_cache = {}
 _last_api_call = 0
 _warmer_thread = None
 _warmer_lock = threading.Lock()
+# 감시자가 켜져 있을 때만 사용하는 사진 목록 캐시 (변경 통지 시 폐기)
+_photo_list_cache = None
+
+def invalidate_photo_list():
+    global _photo_list_cache
+    _photo_list_cache = None
+
+@content_changed.connect_via('gallery')
+def _on_gallery_changed(sender, **kwargs):
+    invalidate_photo_list()
 
 def _load_caches():
     global _address_cache, _photo_cache
@@ -100,6 +112,7 @@ def _background_address_warmer(app_context):
                     if key in _photo_cache:
                         _photo_cache[key]['gps']['address'] = addr
                 _save_photo_cache()
+                invalidate_photo_list()
                 current_app.logger.info(f"[Gallery] 백그라운드 주소 획득: {key} -> {addr}")
             time.sleep(1.2) # 1.1초 이상 대기 필수
         current_app.logger.info("[Gallery] 백그라운드 워머 종료")
@@ -295,6 +308,7 @@ def process_photo_file(filename: str, photos_dir: str, allow_network=False) -> d
                 with _warmer_lock:
                     _photo_cache[cache_key]['gps']['address'] = addr
                 _save_photo_cache()
+                invalidate_photo_list()
         return data
 
     current_app.logger.info(f"[Gallery] 캐시 미스 또는 정보 없음 - 재처리: {filename}")
@@ -347,7 +361,11 @@ def process_photo_file(filename: str, photos_dir: str, allow_network=False) -> d
     return photo_data
 
 def get_all_photos() -> list[dict]:
+    global _photo_list_cache
     photos_dir = current_app.config.get('GALLERY_PHOTOS_DIR')
+    cached = _photo_list_cache
+    if cached is not None:
+        return [dict(photo) for photo in cached]
     if not os.path.isdir(photos_dir): 
         current_app.logger.error(f"[Gallery] 사진 디렉토리 경로 오류: {photos_dir}")
         return []
@@ -371,7 +389,9 @@ def get_all_photos() -> list[dict]:
         
     if needs_warming:
         _start_warmer()
-        
+
+    if is_watched(os.path.realpath(photos_dir)):
+        _photo_list_cache = [dict(photo) for photo in photo_list]
     return photo_list
 
 def get_photo_by_id(filename: str) -> dict | None:
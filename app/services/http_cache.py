@@ -0,0 +1,163 @@
+# app/services/http_cache.py
+import hashlib
+import time
+from datetime import date, datetime, timezone
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+from flask import Flask, Response, current_app, g, request, session
+from flask.sessions import SecureCookieSessionInterface
+from werkzeug.http import is_resource_modified
+
+from app.services.text_service import get_content_validators, get_content_version
+
+# 바뀌면 모든 페이지에 영향을 주는 입력 (템플릿, 스타일/스크립트, 사이트 이미지, 코드)
+SITE_INPUTS = (
+    ('templates', '**/*'),
+    ('static/css', '**/*'),
+    ('static/js', '**/*'),
+    ('static/gen', '**/*'),
+    ('static/images/site', '**/*'),
+    ('.', '*.py'),
+    ('routes', '*.py'),
+    ('services', '*.py'),
+)
+# 304 응답에서 뺄 헤더 - 브라우저가 저장된 본문의 nonce와 맞는 원래 CSP를 유지하도록 함
+CSP_HEADERS = ('Content-Security-Policy', 'Content-Security-Policy-Report-Only')
+
+# 경로 인자 이름 -> get_content_validators 키워드 (이름이 같으면 생략)
+SCOPE_KEYWORDS = {'series_name': 'series'}
+# 공개 캐시되는 응답 - 세션 쿠키(Set-Cookie, Vary: Cookie)를 붙이지 않음 (뷰는 sessionless로 지정)
+SESSIONLESS_ENDPOINTS = {'static'}
+
+_site_inputs: Optional[Tuple[str, int]] = None
+
+def tree_signature(root: Path, pattern: str = '**/*') -> List[Tuple[str, int, int]]:
+    if not root.is_dir(): return []
+    signature = []
+    for path in sorted(root.glob(pattern)):
+        if path.is_file():
+            stat = path.stat()
+            signature.append((str(path.relative_to(root)), stat.st_size, stat.st_mtime_ns))
+    return signature
+
+def site_inputs(app: Flask) -> Tuple[str, int]:
+    """(템플릿/정적 파일/코드 지문, 그중 최종 수정 시각 ns)"""
+    root = Path(app.root_path)
+    signatures = [tree_signature(root / name, pattern) for name, pattern in SITE_INPUTS]
+    digest = hashlib.blake2b(repr(signatures).encode('utf-8', 'surrogateescape'), digest_size=12).hexdigest()
+    newest = max((mtime for signature in signatures for _, _, mtime in signature), default=0)
+    return digest, newest
+
+def get_site_inputs() -> Tuple[str, int]:
+    """프로세스당 한 번 계산 (템플릿 자동 리로드가 켜진 개발 환경에서는 요청마다 계산)"""
+    global _site_inputs
+    app = current_app._get_current_object()
+    if _site_inputs is None or app.debug or app.config.get('TEMPLATES_AUTO_RELOAD'):
+        _site_inputs = site_inputs(app)
+    return _site_inputs
+
+def content_version() -> str:
+    """스냅샷 식별자 + 사이트 지문 - 요청마다 한 번만 계산 (포스트나 템플릿이 바뀌면 달라짐)"""
+    version = g.get('_content_version')
+    if version is None:
+        version = g._content_version = f"{get_content_version(current_app.config.get('POSTS_DIR'))}:{get_site_inputs()[0]}"
+    return version
+
+def sessionless(view: Callable) -> Callable:
+    """세션을 쓰지 않는 공개 응답으로 지정 - CSRF 토큰을 만들지 않고 세션 쿠키도 저장하지 않음"""
+    view.sessionless = True
+    return view
+
+def is_sessionless_request() -> bool:
+    endpoint = request.endpoint
+    if endpoint is None: return False
+    return endpoint in SESSIONLESS_ENDPOINTS or getattr(current_app.view_functions.get(endpoint), 'sessionless', False)
+
+class SessionlessAwareSessionInterface(SecureCookieSessionInterface):
+    """공개 응답에는 세션을 저장하지 않음 - 공유 캐시가 다른 사람의 세션 쿠키를 내보내지 않도록"""
+
+    def save_session(self, app: Flask, session, response: Response) -> None:
+        if is_sessionless_request(): return
+        super().save_session(app, session, response)
+
+def _http_datetime(mtime_ns: int) -> datetime:
+    # 미래 시각은 허용되지 않으므로 현재 시각으로 제한
+    return datetime.fromtimestamp(min(mtime_ns / 1e9, time.time()), tz=timezone.utc)
+
+def _validators(view_args: dict, scope: Optional[str], per_session: bool,
+                daily: bool) -> Optional[Tuple[str, datetime]]:
+    scoped = {SCOPE_KEYWORDS.get(scope, scope): view_args.get(scope)} if scope else {}
+    validators = get_content_validators(current_app.config.get('POSTS_DIR'), **scoped)
+    if validators is None: return None
+    fingerprint, last_modified = validators
+    site_key, site_modified = get_site_inputs()
+    g._content_version = f'{fingerprint}:{site_key}'
+    parts: List[Any] = [request.endpoint, sorted(view_args.items()), request.query_string,
+                        request.host_url, site_key, fingerprint]
+    if per_session:
+        # 본문의 CSRF 토큰은 세션마다 다르므로 세션이 새로 생기는 요청은 항상 새로 렌더링
+        field_name = current_app.config.get('WTF_CSRF_FIELD_NAME', 'csrf_token')
+        token = session.get(field_name)
+        if not token: return None
+        parts.append(token)
+    if daily:
+        parts.append(date.today().isoformat())
+    etag = hashlib.blake2b(repr(parts).encode('utf-8', 'surrogateescape'), digest_size=12).hexdigest()
+    return etag, _http_datetime(max(last_modified, site_modified))
+
+def set_validators(response: Response, etag: str, last_modified: datetime, per_session: bool = True) -> None:
+    """약한 ETag(압축 여부와 무관)와 Last-Modified를 붙이고 매번 재검증하도록 캐시 헤더 지정"""
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    response.cache_control.no_cache = True
+    if per_session:
+        response.cache_control.private = True
+    else:
+        response.cache_control.public = True
+
+def conditional(scope: Optional[str] = None, per_session: bool = True, daily: bool = False) -> Callable:
+    """콘텐츠 화면용 조건부 GET - 검증자가 맞으면 뷰(포스트 파싱, 템플릿)를 실행하지 않고 304 응답
+
+    ETag는 스냅샷 식별자 + 엔드포인트/경로 인자/쿼리 문자열 + 사이트 지문으로 만들고,
+    Last-Modified는 ``scope``로 지정한 경로 인자('slug', 'tag', 'series_name')의 포스트 기준으로 정함.
+    per_session이면 CSRF 토큰이 들어간 HTML로 보고 세션을 ETag에 넣어 private으로 캐시하고,
+    아니면 public으로 캐시하며 세션을 건드리지 않음 (sessionless).
+    """
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(**view_args: Any):
+            if request.method not in ('GET', 'HEAD'):
+                return view(**view_args)
+            try:
+                validators = _validators(view_args, scope, per_session, daily)
+            except Exception as e:
+                current_app.logger.warning(f"조건부 요청 검증자 계산 실패 ({request.path}): {e}")
+                validators = None
+            if validators is not None and not is_resource_modified(
+                    request.environ, etag=validators[0], last_modified=validators[1]):
+                response = current_app.response_class(status=304)
+                set_validators(response, *validators, per_session=per_session)
+                return response
+            response = current_app.make_response(view(**view_args))
+            if response.status_code != 200 or response.cache_control.no_store: return response
+            if validators is None:
+                # 새 세션이었다면 렌더링 중에 토큰이 생겼으므로 다음 요청부터 비교 가능
+                try:
+                    validators = _validators(view_args, scope, per_session, daily)
+                except Exception:
+                    validators = None
+            if validators is not None:
+                set_validators(response, *validators, per_session=per_session)
+            return response
+        # 공개 캐시되는 응답에는 세션 쿠키를 붙이지 않음
+        return wrapper if per_session else sessionless(wrapper)
+    return decorator
+
+def strip_csp_on_not_modified(response: Response) -> Response:
+    """304에는 CSP를 보내지 않음 - 새 헤더가 저장된 응답의 헤더를 덮어쓰면 본문의 nonce와 어긋남"""
+    if response.status_code == 304:
+        for name in CSP_HEADERS:
+            response.headers.pop(name, None)
+    return response
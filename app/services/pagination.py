@@ -0,0 +1,90 @@
+# app/services/pagination.py
+from dataclasses import dataclass
+from typing import Callable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar('T')
+# 정렬 키: 정수 필드들 + 마지막 문자열(포스트 id)
+SortKey = Tuple
+
+DEFAULT_PER_PAGE = 24
+MAX_PER_PAGE = 100
+
+@dataclass(frozen=True)
+class Page:
+    """키셋 페이지 - 앞뒤 페이지는 경계 항목의 정렬 키(커서)로 찾음"""
+    items: List
+    offset: int
+    total: int
+    per_page: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+def encode_cursor(key: SortKey) -> str:
+    return '.'.join(str(part) for part in key)
+
+def decode_cursor(cursor: str, like: SortKey) -> SortKey:
+    """``like``와 같은 모양(정수들 + 문자열)의 키로 복원 - 형식이 틀리면 ValueError"""
+    parts = cursor.split('.', len(like) - 1)
+    if len(parts) != len(like) or not parts[-1]:
+        raise ValueError(f"잘못된 커서: {cursor!r}")
+    return tuple(int(part) for part in parts[:-1]) + (parts[-1],)
+
+def _position(items: Sequence[T], key: Callable[[T], SortKey], target: SortKey,
+              descending: bool, inclusive: bool) -> int:
+    """정렬된 목록에서 ``target``보다 앞서는 항목 수 (inclusive면 같은 키도 앞선 것으로 셈)"""
+    lo, hi = 0, len(items)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        value = key(items[mid])
+        if descending:
+            before = value > target or (inclusive and value == target)
+        else:
+            before = value < target or (inclusive and value == target)
+        if before:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def paginate(items: Sequence[T], key: Callable[[T], SortKey], per_page: int, descending: bool = True,
+             after: Optional[str] = None, before: Optional[str] = None) -> Page:
+    """``key`` 순으로 정렬된 목록에서 커서 다음(after) 또는 이전(before) 한 페이지를 잘라냄
+
+    위치는 이분 탐색으로 찾으므로 목록 길이와 관계없이 페이지 크기만큼만 복사함
+    """
+    if not items:
+        return Page(items=[], offset=0, total=0, per_page=per_page)
+    like = key(items[0])
+    if after is not None:
+        start = _position(items, key, decode_cursor(after, like), descending, inclusive=True)
+        end = start + per_page
+    elif before is not None:
+        end = _position(items, key, decode_cursor(before, like), descending, inclusive=False)
+        start = max(0, end - per_page)
+    else:
+        start, end = 0, per_page
+    page_items = list(items[start:end])
+    end = start + len(page_items)
+    return Page(
+        items=page_items,
+        offset=start,
+        total=len(items),
+        per_page=per_page,
+        next_cursor=encode_cursor(key(page_items[-1])) if page_items and end < len(items) else None,
+        prev_cursor=encode_cursor(key(page_items[0])) if page_items and start > 0 else None,
+    )
+
+def parse_page_args(args: Mapping[str, str], default: int = DEFAULT_PER_PAGE,
+                    maximum: int = MAX_PER_PAGE) -> Tuple[Optional[str], Optional[str], int]:
+    """요청 인자에서 (after, before, per_page) 추출 - 페이지 크기는 1..maximum으로 제한"""
+    try:
+        per_page = int(args.get('per_page', default))
+    except (TypeError, ValueError):
+        per_page = default
+    per_page = min(max(per_page, 1), maximum)
+    after = args.get('after') or None
+    before = None if after else (args.get('before') or None)
+    for cursor in (after, before):
+        if cursor is not None and len(cursor) > 300:
+            raise ValueError("커서가 너무 깁니다")
+    return after, before, per_page
@@ -0,0 +1,326 @@
+# app/services/post_corpus.py
+import hashlib
+import itertools
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from flask import current_app
+
+from app.services.content_watcher import content_changed, is_watched
+from app.services.pagination import DEFAULT_PER_PAGE, Page, paginate
+from app.services.post_index import get_post_index, row_signature, summary_from_row
+from app.services.tag_index import TagGraph, TagIndex
+from app.services.text_service import PostSummary, TextPost, build_lazy_text_post, parse_text_files
+
+# 파일 시그니처: (st_ino, st_size, st_mtime_ns)
+FileSignature = Tuple[int, int, int]
+
+@dataclass
+class PostCorpus:
+    """포스트 디렉토리 스냅샷 - 파일 구성이 바뀔 때마다 버전 증가 (목록용 PostSummary만 보관)"""
+    posts_dir: str
+    version: int = 0
+    posts: List[PostSummary] = field(default_factory=list)
+    signatures: Dict[str, FileSignature] = field(default_factory=dict)
+    by_filename: Dict[str, PostSummary] = field(default_factory=dict)
+
+    # 버전마다 한 번 만드는 조회용 인덱스
+    by_slug: Dict[str, PostSummary] = field(default_factory=dict, init=False, repr=False)
+    positions: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    series: Dict[str, Tuple[PostSummary, ...]] = field(default_factory=dict, init=False, repr=False)
+    tagged: Dict[str, Tuple[PostSummary, ...]] = field(default_factory=dict, init=False, repr=False)
+
+    _tags_count: Optional[Dict[str, int]] = field(default=None, init=False, repr=False)
+    _tag_index: Optional[TagIndex] = field(default=None, init=False, repr=False)
+    _tag_graph: Optional[TagGraph] = field(default=None, init=False, repr=False)
+    _fingerprint: Optional[str] = field(default=None, init=False, repr=False)
+    _last_modified: Optional[int] = field(default=None, init=False, repr=False)
+    _tags_version: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        tagged: Dict[str, List[PostSummary]] = {}
+        series: Dict[str, List[PostSummary]] = {}
+        for index, post in enumerate(self.posts):
+            # 슬러그가 겹치면 정렬 순서상 앞선 포스트가 우선
+            self.by_slug.setdefault(post.slug, post)
+            self.positions[post.filename] = index
+            for tag in dict.fromkeys(post.tags):
+                tagged.setdefault(tag, []).append(post)
+            if post.series:
+                series.setdefault(post.series, []).append(post)
+        # 스냅샷의 포스트로 한 번에 만듦 - 없는 이름으로 조회해도 항목이 늘지 않음
+        self.tagged = {tag: tuple(posts) for tag, posts in tagged.items()}
+        self.series = {name: tuple(sorted(posts, key=_series_key)) for name, posts in series.items()}
+
+    def get_fingerprint(self) -> str:
+        """파일 시그니처로 만든 스냅샷 식별자 - 버전 번호와 달리 워커/재시작과 무관하게 같음"""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=8)
+            for name, signature in sorted(self.signatures.items()):
+                digest.update(f'{name}\0{signature}\0'.encode('utf-8', 'surrogateescape'))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def get_last_modified(self, posts: Optional[Iterable[PostSummary]] = None) -> int:
+        """포스트 파일의 가장 최근 수정 시각(ns) - posts를 주지 않으면 스냅샷 전체 기준"""
+        if posts is not None:
+            return max((self.signatures[p.filename][2] for p in posts if p.filename in self.signatures), default=0)
+        if self._last_modified is None:
+            self._last_modified = max((signature[2] for signature in self.signatures.values()), default=0)
+        return self._last_modified
+
+    def get_tags_count(self) -> Dict[str, int]:
+        if self._tags_count is None:
+            # 스냅샷의 포스트만 집계 (공유 인덱스에는 다른 워커가 기록 중인 행이 섞일 수 있음)
+            tags_count: Dict[str, int] = {}
+            for post in self.posts:
+                for tag_item in post.tags:
+                    tags_count[tag_item] = tags_count.get(tag_item, 0) + 1
+            self._tags_count = tags_count
+        return self._tags_count
+
+    def get_tags_version(self) -> str:
+        """포스트별 태그 구성의 지문 - 태그 개수나 함께 쓰인 태그가 바뀔 때만 달라짐 (본문 수정과 무관)"""
+        if self._tags_version is None:
+            digest = hashlib.blake2b(digest_size=8)
+            for post in sorted(self.posts, key=lambda p: p.filename):
+                digest.update(f'{post.filename}\0{post.tags}\0'.encode('utf-8', 'surrogateescape'))
+            self._tags_version = digest.hexdigest()
+        return self._tags_version
+
+    def get_tag_index(self) -> TagIndex:
+        if self._tag_index is None:
+            self._tag_index = TagIndex(self.get_tags_count())
+        return self._tag_index
+
+    def get_tag_graph(self) -> TagGraph:
+        if self._tag_graph is None:
+            self._tag_graph = TagGraph((post.tags for post in self.posts), self.get_tags_count())
+        return self._tag_graph
+
+    def get_tagged(self, tag: str) -> Tuple[PostSummary, ...]:
+        """태그가 붙은 포스트 (최신순) - 없는 태그면 빈 튜플"""
+        return self.tagged.get(tag, ())
+
+    def get_series(self, series_name: str) -> Tuple[PostSummary, ...]:
+        """시리즈 포스트 (편 번호, 날짜, id 순) - 없는 시리즈면 빈 튜플"""
+        return self.series.get(series_name, ())
+
+    def get_page(self, tag: Optional[str] = None, after: Optional[str] = None,
+                 before: Optional[str] = None, per_page: int = DEFAULT_PER_PAGE) -> Page:
+        """최신순 목록(또는 태그 목록)의 한 페이지 - 커서는 (날짜, id)"""
+        posts = self.get_tagged(tag) if tag else self.posts
+        return paginate(posts, _sort_key, per_page, descending=True, after=after, before=before)
+
+    def get_series_page(self, series_name: str, after: Optional[str] = None,
+                        before: Optional[str] = None, per_page: int = DEFAULT_PER_PAGE) -> Page:
+        """시리즈 순서(편 번호, 날짜, id)의 한 페이지"""
+        return paginate(self.get_series(series_name), _series_key, per_page,
+                        descending=False, after=after, before=before)
+
+    def get_adjacent(self, post: Union[TextPost, PostSummary]) -> Tuple[Optional[PostSummary], Optional[PostSummary]]:
+        index = self.positions.get(post.filename)
+        if index is None: return None, None
+        prev_post = self.posts[index - 1] if index > 0 else None
+        next_post = self.posts[index + 1] if index < len(self.posts) - 1 else None
+        return prev_post, next_post
+
+_corpora: Dict[str, PostCorpus] = {}
+_corpus_lock = threading.Lock()
+# 프로세스 전역 단조 증가 버전 - 스냅샷이 폐기돼도 이전 버전 번호를 재사용하지 않음
+_versions = itertools.count(1)
+# 감시자가 변경을 통지한 디렉토리 - 다음 조회 때 한 번 다시 스캔
+_stale_dirs: Set[str] = set()
+_resolved_dirs: Dict[str, str] = {}
+
+def _corpus_key(posts_dir: str) -> str:
+    key = _resolved_dirs.get(posts_dir)
+    if key is None:
+        key = _resolved_dirs[posts_dir] = str(Path(posts_dir).resolve())
+    return key
+
+def _scan_signatures(posts_dir: Path) -> Dict[str, FileSignature]:
+    """os.scandir 한 번으로 허용된 확장자의 파일 시그니처를 수집"""
+    allowed_extensions = current_app.config.get('ALLOWED_TEXT_EXTENSIONS', {'txt', 'md'})
+    max_posts = current_app.config.get('MAX_POSTS_TOTAL', 2000)
+    suffixes = tuple(f'.{ext}' for ext in allowed_extensions)
+    found: Dict[str, FileSignature] = {}
+    with os.scandir(posts_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(suffixes):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            found[entry.name] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    return {name: found[name] for name in sorted(found)[:max_posts]}
+
+def _sort_key(post: PostSummary) -> Tuple[int, str]:
+    return (post.date_us, post.id)
+
+def _series_key(post: PostSummary) -> Tuple[int, int, str]:
+    return (post.series_part or 9999, post.date_us, post.id)
+
+def _bisect_position(posts: List[PostSummary], key: Tuple[int, str]) -> int:
+    """날짜 내림차순 목록에서 ``key``가 들어갈 첫 위치"""
+    lo, hi = 0, len(posts)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _sort_key(posts[mid]) > key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+def _remove_sorted(posts: List[PostSummary], post: PostSummary) -> None:
+    index = _bisect_position(posts, _sort_key(post))
+    while index < len(posts):
+        if posts[index] is post:
+            del posts[index]
+            return
+        index += 1
+
+def _apply_date_fallback(post: TextPost, signature: FileSignature) -> None:
+    # 날짜 정보가 없는 경우 파일 수정 시간을 기본값으로 사용 (now() 대신)
+    if post.date == post.created_at and post.date > datetime.now():
+        post.date = datetime.fromtimestamp(signature[2] / 1e9)
+
+def _load_posts(posts_dir: Path, names: List[str], signatures: Dict[str, FileSignature],
+                rows: Dict[str, Any]) -> Tuple[Dict[str, PostSummary], Dict[str, TextPost]]:
+    """바뀐 파일들의 헤더만 로드 (본문은 지연 로딩) - 콜드 스타트처럼 많을 때는 작업자 풀 사용
+
+    인덱스 행의 시그니처가 일치하는 파일은 읽지 않고 행에서 복원
+    반환: (파일명별 요약, 새로 파싱한 포스트)
+    """
+    config = current_app.config
+    loaded: Dict[str, PostSummary] = {}
+    parsed_posts: Dict[str, TextPost] = {}
+    to_read = []
+    for name in names:
+        if not TextPost._validate_filename(name):
+            current_app.logger.warning(f"잘못된 파일명: {name}")
+            continue
+        row = rows.get(name)
+        if row is not None and row_signature(row) == signatures[name]:
+            try:
+                loaded[name] = summary_from_row(row, str(posts_dir / name))
+                continue
+            except Exception as e:
+                current_app.logger.warning(f"포스트 인덱스 행 복원 실패 {name}: {e}")
+        to_read.append(name)
+
+    workers = config.get('POSTS_LOAD_WORKERS', 1)
+    if len(to_read) < config.get('POSTS_PARALLEL_THRESHOLD', 32):
+        workers = 1
+    try:
+        parsed = parse_text_files(posts_dir, to_read, workers, config.get('POSTS_LOAD_USE_PROCESSES', False))
+    except Exception as e:
+        current_app.logger.error(f"포스트 로드 실패 {posts_dir}: {e}")
+        return loaded, parsed_posts
+    # TextPost 생성은 앱 설정을 읽으므로 요청 스레드에서 파일명 순서대로 수행
+    for name in to_read:
+        result = parsed[name]
+        if isinstance(result, Exception):
+            current_app.logger.error(f"포스트 로드 오류 {name}: {result}")
+            continue
+        try:
+            post = build_lazy_text_post(name, result)
+            _apply_date_fallback(post, signatures[name])
+            # 목록 카드에 쓰는 미리보기/이미지는 여기서 한 번만 계산 (본문은 읽지 않음)
+            loaded[name] = PostSummary.from_post(post)
+        except Exception as e:
+            current_app.logger.error(f"포스트 로드 오류 {name}: {e}")
+            continue
+        parsed_posts[name] = post
+    return loaded, parsed_posts
+
+def _build_corpus(posts_dir: Path, key: str, signatures: Dict[str, FileSignature],
+                  previous: Optional[PostCorpus]) -> PostCorpus:
+    """이전 스냅샷과 시그니처를 비교해 바뀐 파일만 다시 파싱"""
+    old_signatures = previous.signatures if previous else {}
+    old_posts = previous.by_filename if previous else {}
+    changed = [name for name, sig in signatures.items() if old_signatures.get(name) != sig]
+    removed = [name for name in old_signatures if name not in signatures]
+
+    # 정렬 순서는 이전 스냅샷을 복사해 바뀐 항목만 빼고 끼워 넣음 (읽는 중인 스냅샷은 건드리지 않음)
+    posts = list(previous.posts) if previous else []
+    by_filename = dict(old_posts)
+    for name in itertools.chain(removed, changed):
+        old_post = by_filename.pop(name, None)
+        if old_post is not None:
+            _remove_sorted(posts, old_post)
+    index = get_post_index()
+    rows = index.fetch(key, changed) if index and changed else {}
+    loaded, parsed_posts = _load_posts(posts_dir, changed, signatures, rows)
+    for name in changed:
+        post = loaded.get(name)
+        if post is None:
+            continue
+        if previous is None:
+            posts.append(post)
+        else:
+            posts.insert(_bisect_position(posts, _sort_key(post)), post)
+        by_filename[name] = post
+    if previous is None:
+        # 날짜 내림차순, 동일 날짜시 제목/파일명 내림차순으로 2차 정렬하여 순서 보장
+        posts.sort(key=_sort_key, reverse=True)
+
+    if index is not None and (parsed_posts or removed or previous is None):
+        updates = [(post, loaded[name], signatures[name]) for name, post in parsed_posts.items()]
+        index.sync(key, updates, signatures.keys())
+
+    version = next(_versions)
+    current_app.logger.info(
+        f"포스트 스냅샷 갱신: v{version} ({len(posts)}개, 재파싱 {len(changed)}개, 삭제 {len(removed)}개)"
+    )
+    return PostCorpus(posts_dir=key, version=version, posts=posts,
+                      signatures=signatures, by_filename=by_filename)
+
+def get_corpus(posts_dir: Optional[str] = None) -> PostCorpus:
+    """현재 포스트 스냅샷 반환 - 파일 목록이나 시그니처가 바뀐 경우에만 갱신"""
+    if posts_dir is None: posts_dir = current_app.config.get('POSTS_DIR')
+    key = _corpus_key(str(posts_dir))
+    corpus = _corpora.get(key)
+    # 감시 중인 디렉토리는 변경 통지가 없는 한 파일 시스템을 확인하지 않음
+    if corpus is not None and key not in _stale_dirs and is_watched(key):
+        return corpus
+
+    path = Path(posts_dir)
+    if not path.exists() or not path.is_dir():
+        current_app.logger.warning(f"포스트 디렉토리 없음: {path}")
+        return PostCorpus(posts_dir=str(path))
+    # 스캔 도중 들어온 통지는 다시 표시되도록 스캔 전에 해제
+    _stale_dirs.discard(key)
+    signatures = _scan_signatures(path)
+    if corpus is not None and corpus.signatures == signatures:
+        return corpus
+    with _corpus_lock:
+        corpus = _corpora.get(key)
+        if corpus is not None and corpus.signatures == signatures:
+            return corpus
+        corpus = _build_corpus(path, key, signatures, corpus)
+        _corpora[key] = corpus
+        return corpus
+
+def invalidate_corpus(posts_dir: Optional[str] = None) -> None:
+    """캐시된 스냅샷을 폐기 - 다음 조회 시 다시 구성"""
+    with _corpus_lock:
+        if posts_dir is None:
+            _corpora.clear()
+        else:
+            _corpora.pop(_corpus_key(str(posts_dir)), None)
+
+def mark_corpus_stale(posts_dir: str) -> None:
+    """다음 조회 시 시그니처를 다시 비교하도록 표시 (파싱 결과는 유지)"""
+    _stale_dirs.add(_corpus_key(posts_dir))
+
+@content_changed.connect_via('posts')
+def _on_posts_changed(sender, directory: str, **kwargs) -> None:
+    mark_corpus_stale(directory)
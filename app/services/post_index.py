@@ -0,0 +1,200 @@
+# app/services/post_index.py
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from flask import current_app
+from markupsafe import Markup
+
+from app.services.text_service import CACHE_VERSION, PREVIEW_LENGTHS, PostSource, PostSummary, TextPost, to_date_us
+
+# 스키마나 메타데이터 해석 방식이 바뀌면 올림 - 스탬프가 다르면 인덱스를 비우고 다시 채움
+INDEX_SCHEMA_VERSION = 7
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    posts_dir TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    post_id TEXT NOT NULL,
+    ino INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    encoding TEXT NOT NULL,
+    body_offset INTEGER NOT NULL,
+    slug TEXT NOT NULL,
+    title TEXT NOT NULL,
+    date TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    author TEXT NOT NULL,
+    description TEXT NOT NULL,
+    subtitle TEXT NOT NULL,
+    series TEXT,
+    series_part INTEGER,
+    tags TEXT NOT NULL,
+    changelog TEXT NOT NULL,
+    thumbnail TEXT,
+    thumbnail_alt TEXT,
+    thumbnail_alt_markup INTEGER NOT NULL DEFAULT 0,
+    previews TEXT NOT NULL,
+    image_filename TEXT,
+    image_alt TEXT NOT NULL,
+    word_count INTEGER,
+    PRIMARY KEY (posts_dir, filename)
+);
+"""
+
+_POST_COLUMNS = (
+    'posts_dir', 'filename', 'post_id', 'ino', 'size', 'mtime_ns', 'encoding', 'body_offset', 'slug', 'title',
+    'date', 'created_at', 'author', 'description', 'subtitle', 'series', 'series_part', 'tags',
+    'changelog', 'thumbnail', 'thumbnail_alt', 'thumbnail_alt_markup', 'previews', 'image_filename', 'image_alt',
+    'word_count',
+)
+_UPSERT_POST = (
+    f"INSERT OR REPLACE INTO posts ({', '.join(_POST_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _POST_COLUMNS)})"
+)
+
+_FETCH_CHUNK = 500
+
+_indexes: Dict[str, Optional['PostIndex']] = {}
+_indexes_lock = threading.Lock()
+
+class PostIndex:
+    """포스트 메타데이터 SQLite 인덱스 - 워커 프로세스끼리 공유하고 재시작 후에도 유지"""
+
+    def __init__(self, path: str, stamp: str, logger=None):
+        self.path = path
+        self.stamp = stamp
+        self.logger = logger
+        self._local = threading.local()
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        # 연결은 스레드마다, fork 이후에는 새로 열어야 함
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _ensure_schema(self) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            row = conn.execute("SELECT value FROM meta WHERE key = 'stamp'").fetchone()
+            if row is None or row['value'] != self.stamp:
+                # 스키마가 바뀌었을 수 있으므로 테이블째 다시 만듦 (post_tags는 이전 스키마의 테이블)
+                conn.execute('DROP TABLE IF EXISTS post_tags')
+                conn.execute('DROP TABLE IF EXISTS posts')
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('stamp', ?)", (self.stamp,))
+        conn.executescript(_SCHEMA)
+
+    def _log_error(self, action: str, error: Exception) -> None:
+        if self.logger is not None:
+            self.logger.warning(f"포스트 인덱스 {action} 실패: {error}")
+
+    def fetch(self, posts_dir: str, filenames: List[str]) -> Dict[str, sqlite3.Row]:
+        """파일명 기준으로 행 반환 (SQLite 변수 개수 제한 때문에 나눠서 조회)"""
+        rows: Dict[str, sqlite3.Row] = {}
+        try:
+            conn = self._connect()
+            for start in range(0, len(filenames), _FETCH_CHUNK):
+                chunk = filenames[start:start + _FETCH_CHUNK]
+                query = f"SELECT * FROM posts WHERE posts_dir = ? AND filename IN ({', '.join('?' for _ in chunk)})"
+                for row in conn.execute(query, (posts_dir, *chunk)):
+                    rows[row['filename']] = row
+        except sqlite3.Error as e:
+            self._log_error('조회', e)
+            return {}
+        return rows
+
+    def sync(self, posts_dir: str, updates: List[Tuple[TextPost, PostSummary, Tuple[int, int, int]]],
+             current_names: Iterable[str]) -> None:
+        """새로 파싱한 포스트를 기록하고 디렉토리에서 사라진 파일의 행을 삭제 (한 트랜잭션)"""
+        try:
+            post_rows = [_post_to_row(posts_dir, post, summary, signature) for post, summary, signature in updates]
+            conn = self._connect()
+            with conn:
+                existing = {row[0] for row in conn.execute(
+                    'SELECT filename FROM posts WHERE posts_dir = ?', (posts_dir,))}
+                stale = [(posts_dir, name) for name in existing.difference(current_names)]
+                stale.extend((posts_dir, post.filename) for post, _, _ in updates)
+                conn.executemany('DELETE FROM posts WHERE posts_dir = ? AND filename = ?', stale)
+                conn.executemany(_UPSERT_POST, post_rows)
+        except (sqlite3.Error, ValueError) as e:
+            self._log_error('갱신', e)
+
+def _post_to_row(posts_dir: str, post: TextPost, summary: PostSummary, signature: Tuple[int, int, int]) -> tuple:
+    """로딩 작업자가 읽은 헤더와 요약 값만 씀 - 본문은 읽지 않음 (단어 수는 계산된 적 있을 때만 기록)"""
+    if post.source is None: raise ValueError(f"본문 위치 정보 없음: {post.filename}")
+    return (
+        posts_dir, post.filename, post.id, *signature, post.source.encoding, post.source.body_offset,
+        post.slug, str(post.title),
+        post.date.isoformat(), post.created_at.isoformat(), str(post.author), str(post.description),
+        str(post.subtitle), None if post.series is None else str(post.series), post.series_part,
+        json.dumps([str(tag) for tag in post.tags], ensure_ascii=False),
+        json.dumps([str(item) for item in post.changelog], ensure_ascii=False),
+        post.thumbnail, None if post.thumbnail_alt is None else str(post.thumbnail_alt),
+        int(isinstance(post.thumbnail_alt, Markup)),
+        json.dumps([str(preview) for preview in summary.previews], ensure_ascii=False),
+        summary.image_filename, str(summary.image_alt), summary.word_count,
+    )
+
+def row_signature(row: sqlite3.Row) -> Tuple[int, int, int]:
+    return (row['ino'], row['size'], row['mtime_ns'])
+
+def summary_from_row(row: sqlite3.Row, path: str) -> PostSummary:
+    """인덱스 행으로 목록용 요약 복원 - 파일을 읽지 않음 (이스케이프된 값은 Markup으로)"""
+    return PostSummary(
+        filename=row['filename'],
+        id=row['post_id'],
+        slug=row['slug'],
+        title=Markup(row['title']),
+        date_us=to_date_us(datetime.fromisoformat(row['date'])),
+        tags=tuple(sys.intern(tag) for tag in json.loads(row['tags'])),
+        author=Markup(row['author']),
+        series=None if row['series'] is None else Markup(row['series']),
+        series_part=row['series_part'],
+        thumbnail=row['thumbnail'],
+        previews=tuple(Markup(preview) for preview in json.loads(row['previews'])),
+        image_filename=row['image_filename'],
+        image_alt=Markup(row['image_alt']),
+        word_count=row['word_count'],
+        source=PostSource(path=path, encoding=row['encoding'], body_offset=row['body_offset'],
+                          size=row['size'], mtime_ns=row['mtime_ns']),
+    )
+
+def _index_stamp(config) -> str:
+    limits = [config.get(key) for key in ('MAX_TITLE_LENGTH', 'MAX_TAG_LENGTH', 'MAX_TAGS_PER_POST', 'MAX_PREVIEW_LENGTH')]
+    return json.dumps([INDEX_SCHEMA_VERSION, CACHE_VERSION, PREVIEW_LENGTHS, limits])
+
+def get_post_index() -> Optional[PostIndex]:
+    """설정된 인덱스 반환 - 꺼져 있거나 열 수 없으면 None (메모리 스냅샷만 사용)"""
+    config = current_app.config
+    if not config.get('POST_INDEX_ENABLED', False):
+        return None
+    path = config.get('POST_INDEX_PATH')
+    if not path:
+        return None
+    index = _indexes.get(path, False)
+    if index is not False:
+        return index
+    with _indexes_lock:
+        index = _indexes.get(path, False)
+        if index is False:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                index = PostIndex(path, _index_stamp(config), logger=current_app.logger)
+            except (OSError, sqlite3.Error) as e:
+                current_app.logger.warning(f"포스트 인덱스를 열 수 없어 비활성화: {path} ({e})")
+                index = None
+            _indexes[path] = index
+        return index
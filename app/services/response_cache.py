@@ -0,0 +1,191 @@
+# app/services/response_cache.py
+import hashlib
+import json
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Union
+from urllib.parse import urlencode
+
+from flask import Config, Response, current_app, g, request
+from flask_wtf.csrf import generate_csrf
+
+from app.services.cache_service import ByteLRUCache
+from app.services.http_cache import CSP_HEADERS, content_version
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None  # type: ignore
+    REDIS_AVAILABLE = False
+
+RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+CACHEABLE_MIMETYPES = {'text/html', 'text/plain', 'text/xml', 'application/xml', 'application/json'}
+# 요청마다 달라지는 값의 자리 - 저장할 때 바꿔 두고 보낼 때 현재 요청의 값으로 채움
+NONCE_PLACEHOLDER = '\x00csp-nonce\x00'
+CSRF_PLACEHOLDER = '\x00csrf-token\x00'
+# 저장 형식 - 키에 들어가므로 바꾸면 이전 형식의 항목은 조회되지 않음
+RESPONSE_CACHE_FORMAT = 2
+# 응답마다 새로 정해지는 헤더는 저장하지 않음 (세션 쿠키, CSP nonce, 본문 길이)
+UNCACHED_HEADERS = frozenset({'set-cookie', 'content-length', 'x-response-cache', *(name.lower() for name in CSP_HEADERS)})
+# Redis 오류 후 다시 시도하기까지 캐시 없이 동작하는 시간(초)
+REDIS_RETRY_INTERVAL = 30.0
+
+class MemoryStore:
+    """프로세스 내 응답 저장소 - 바이트 예산 LRU에 만료 시각을 함께 보관"""
+
+    def __init__(self, max_bytes: int):
+        self._cache = ByteLRUCache(max_bytes, sizeof=lambda item: len(item[1]))
+
+    def get(self, key: str) -> Optional[bytes]:
+        item = self._cache.get(key)
+        if item is None: return None
+        expires_at, data = item
+        if expires_at < time.monotonic():
+            self._cache.pop(key)
+            return None
+        return data
+
+    def set(self, key: str, data: bytes, timeout: int) -> None:
+        self._cache.set(key, (time.monotonic() + timeout, data))
+
+    def stats(self) -> Dict[str, Any]:
+        return {'backend': 'memory', **self._cache.stats()}
+
+class RedisStore:
+    """Redis 프로토콜 서버(Redis, Valkey 등)에 두는 응답 저장소 - 워커끼리 공유, 오류 시 잠시 우회"""
+
+    def __init__(self, client: 'redis.Redis'):
+        self._client = client
+        self._retry_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _failed(self, error: Exception) -> None:
+        self.errors += 1
+        self._retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        current_app.logger.warning(f"응답 캐시 Redis 오류 ({REDIS_RETRY_INTERVAL:.0f}초간 사용 안 함): {error}")
+
+    def get(self, key: str) -> Optional[bytes]:
+        if time.monotonic() < self._retry_at: return None
+        try:
+            data = self._client.get(key)
+        except redis.RedisError as e:
+            self._failed(e)
+            return None
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    def set(self, key: str, data: bytes, timeout: int) -> None:
+        if time.monotonic() < self._retry_at: return
+        try:
+            self._client.set(key, data, ex=max(int(timeout), 1))
+        except redis.RedisError as e:
+            self._failed(e)
+
+    def stats(self) -> Dict[str, Any]:
+        return {'backend': 'redis', 'hits': self.hits, 'misses': self.misses, 'errors': self.errors}
+
+ResponseStore = Union[MemoryStore, RedisStore]
+
+_store: Optional[ResponseStore] = None
+_store_ready = False
+_store_lock = threading.Lock()
+
+def create_store(config: Config) -> Optional[ResponseStore]:
+    """CACHE_TYPE에 맞는 저장소 ('null'이면 None, redis 패키지가 없으면 메모리로 대체)"""
+    cache_type = str(config.get('CACHE_TYPE') or 'null').lower()
+    if cache_type in ('null', 'nullcache', 'none'):
+        return None
+    if cache_type in ('redis', 'rediscache'):
+        if REDIS_AVAILABLE:
+            client = redis.Redis(
+                host=config.get('CACHE_REDIS_HOST', 'localhost'),
+                port=config.get('CACHE_REDIS_PORT', 6379),
+                db=config.get('CACHE_REDIS_DB', 0),
+                password=config.get('CACHE_REDIS_PASSWORD'),
+                socket_timeout=0.5,
+                socket_connect_timeout=0.5,
+            )
+            return RedisStore(client)
+        current_app.logger.warning("redis 패키지가 없어 응답 캐시를 프로세스 메모리에 둡니다")
+    max_bytes = config.get('RESPONSE_CACHE_MAX_BYTES', RESPONSE_CACHE_MAX_BYTES)
+    return MemoryStore(max_bytes) if max_bytes > 0 else None
+
+def get_response_cache() -> Optional[ResponseStore]:
+    global _store, _store_ready
+    if not _store_ready:
+        with _store_lock:
+            if not _store_ready:
+                _store = create_store(current_app.config)
+                _store_ready = True
+    return _store
+
+def reset_response_cache() -> None:
+    """저장소를 버리고 다음 요청 때 설정에서 다시 만듦"""
+    global _store, _store_ready
+    with _store_lock:
+        _store, _store_ready = None, False
+
+def response_cache_key() -> str:
+    """엔드포인트 + 호스트/경로 + 정렬한 쿼리 + 콘텐츠 버전 - 포스트나 템플릿이 바뀌면 키가 달라짐"""
+    query = urlencode(sorted(request.args.items(multi=True)))
+    parts = (RESPONSE_CACHE_FORMAT, request.endpoint, request.host_url, request.path, query, content_version())
+    digest = hashlib.blake2b(repr(parts).encode('utf-8', 'surrogateescape'), digest_size=16).hexdigest()
+    return f"{current_app.config.get('CACHE_KEY_PREFIX', '')}response:{digest}"
+
+def _dump_response(response: Response) -> bytes:
+    """뷰가 정한 헤더(JSON 한 줄)와 본문 - 요청마다 달라지는 값은 자리표시자로 바꿔 저장"""
+    headers = [(name, value) for name, value in response.headers.items() if name.lower() not in UNCACHED_HEADERS]
+    data = f'{json.dumps(headers, ensure_ascii=False)}\n{response.get_data(as_text=True)}'
+    nonce = g.get('csp_nonce')
+    if nonce:
+        data = data.replace(nonce, NONCE_PLACEHOLDER)
+    token = g.get(current_app.config.get('WTF_CSRF_FIELD_NAME', 'csrf_token'))
+    if token:
+        data = data.replace(token, CSRF_PLACEHOLDER)
+    return data.encode('utf-8')
+
+def _load_response(data: bytes) -> Response:
+    text = data.decode('utf-8').replace(NONCE_PLACEHOLDER, g.get('csp_nonce', ''))
+    if CSRF_PLACEHOLDER in text:
+        text = text.replace(CSRF_PLACEHOLDER, generate_csrf())
+    headers, _, body = text.partition('\n')
+    return current_app.response_class(body, headers=json.loads(headers))
+
+def cached(timeout: Optional[int] = None) -> Callable:
+    """전체 응답 캐시 - 200 응답 본문을 저장해 두고 같은 키면 뷰를 실행하지 않음 (no-store 응답은 제외)
+
+    CSP nonce와 CSRF 토큰은 자리표시자로 바꿔 저장했다가 보낼 때 현재 요청의 값으로 채움.
+    만료 시간은 ``timeout``이 없으면 CACHE_DEFAULT_TIMEOUT.
+    """
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(**view_args: Any):
+            store = get_response_cache()
+            if store is None or request.method not in ('GET', 'HEAD'):
+                return view(**view_args)
+            try:
+                key = response_cache_key()
+                data = store.get(key)
+            except Exception as e:
+                current_app.logger.warning(f"응답 캐시 조회 실패 ({request.path}): {e}")
+                return view(**view_args)
+            if data is not None:
+                response = _load_response(data)
+                response.headers['X-Response-Cache'] = 'hit'
+                return response
+            response = current_app.make_response(view(**view_args))
+            if (response.status_code == 200 and response.mimetype in CACHEABLE_MIMETYPES
+                    and not response.is_streamed and not response.cache_control.no_store):
+                store.set(key, _dump_response(response),
+                          timeout or current_app.config.get('CACHE_DEFAULT_TIMEOUT', 600))
+                response.headers['X-Response-Cache'] = 'miss'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,277 @@
+# app/services/search_service.py
+import heapq
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from flask import Flask, current_app
+from markupsafe import Markup, escape
+
+from app.services.post_corpus import FileSignature, PostCorpus, get_corpus
+from app.services.text_service import PostSummary, parse_text_file
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+# 필드별 가중치 (단어 빈도에 곱함)
+FIELD_WEIGHTS = {'title': 3, 'description': 2, 'body': 1}
+SNIPPET_LENGTH = 160
+# 스니펫용으로 색인에 보관하는 정리된 본문 앞부분 (글자 수) - 결과마다 본문 전체를 읽지 않도록
+SNIPPET_SOURCE_CHARS = 2000
+MAX_QUERY_LENGTH = 100
+
+# 한글은 겹치는 음절 바이그램, 홀로 있는 한 글자, 그 밖의 단어(밑줄 제외, 너무 긴 것은 제외)를 추출
+_BIGRAM_PATTERN = re.compile(r'(?=([가-힣]{2}))')
+_WORD_PATTERN = re.compile(
+    r'(?<![가-힣])[가-힣](?![가-힣])|(?<![^\W_가-힣])[^\W_가-힣]{1,40}(?![^\W_가-힣])'
+)
+# 스니펫 강조용 - 검색어를 한글 덩어리와 단어로 분리
+_QUERY_WORD_PATTERN = re.compile(r'[가-힣]+|[^\W_가-힣]+')
+# 본문의 특수 태그/URL은 검색어가 아니므로 제거 (인용/강조 내용은 남김)
+_SEARCH_MARKUP_PATTERN = re.compile(
+    r'\[(?:img|video|audio|youtube):[^\]]*\]|\[/?(?:highlight|quote|code)[^\]]*\]|https?://\S+'
+)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def tokenize(text: str) -> List[str]:
+    """한글은 음절 바이그램(한 글자면 그대로), 나머지는 소문자 단어 단위로 분리"""
+    text = text.lower()
+    return _BIGRAM_PATTERN.findall(text) + _WORD_PATTERN.findall(text)
+
+def _clean_text(text: str) -> str:
+    return _WHITESPACE_PATTERN.sub(' ', _SEARCH_MARKUP_PATTERN.sub(' ', text)).strip()
+
+@dataclass
+class _IndexedDoc:
+    doc_id: int
+    signature: FileSignature
+    length: int
+    terms: Tuple[str, ...]
+    excerpt: str
+
+@dataclass
+class SearchResult:
+    post: PostSummary
+    score: float
+    snippet: Markup
+
+class SearchIndex:
+    """포스트 제목/설명/본문 역색인 - 스냅샷 버전이 바뀌면 백그라운드 스레드가 바뀐 파일만 다시 색인"""
+
+    def __init__(self, posts_dir: str):
+        self.posts_dir = posts_dir
+        self.version = -1
+        self._lock = threading.Lock()
+        self._docs: Dict[str, _IndexedDoc] = {}
+        self._filenames: Dict[int, str] = {}
+        # 단어 -> {문서 번호: 가중 빈도}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        # 문서 번호 -> BM25 길이 정규화 값 k1 * (1 - b + b * len / avg)
+        self._norms: Dict[int, float] = {}
+        self._next_id = 0
+        self._total_length = 0
+        # 색인할 최신 스냅샷과 색인 스레드
+        self._pending: Optional[PostCorpus] = None
+        self._builder: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def _remove(self, filename: str) -> None:
+        doc = self._docs.pop(filename, None)
+        if doc is None: return
+        for term in doc.terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc.doc_id, None)
+                if not postings:
+                    del self._postings[term]
+        del self._filenames[doc.doc_id]
+        self._norms.pop(doc.doc_id, None)
+        self._total_length -= doc.length
+
+    def _analyze(self, post: PostSummary) -> Optional[Tuple[Counter, str]]:
+        """포스트 하나의 필드별 가중 단어 빈도와 스니펫용 본문 앞부분 (파일 읽기는 잠금 밖에서)"""
+        if post.source is None: return None
+        try:
+            metadata, body = parse_text_file(Path(post.source.path))
+        except Exception as e:
+            current_app.logger.warning(f"검색 색인 실패 {post.filename}: {e}")
+            return None
+        fields = {
+            'title': metadata.get('title') or str(post.title),
+            'description': metadata.get('description', ''),
+            'body': _clean_text(body),
+        }
+        counts: Counter = Counter()
+        for name, text in fields.items():
+            weight = FIELD_WEIGHTS[name]
+            for term, count in Counter(tokenize(text)).items():
+                counts[term] += count * weight
+        return counts, fields['body'][:SNIPPET_SOURCE_CHARS]
+
+    def _add(self, filename: str, signature: FileSignature, counts: Counter, excerpt: str) -> None:
+        doc_id = self._next_id
+        self._next_id += 1
+        for term, count in counts.items():
+            self._postings.setdefault(term, {})[doc_id] = count
+        length = sum(counts.values())
+        self._docs[filename] = _IndexedDoc(doc_id, signature, length, tuple(counts), excerpt)
+        self._filenames[doc_id] = filename
+        self._total_length += length
+        average = self._total_length / len(self._docs)
+        self._norms[doc_id] = BM25_K1 * (1 - BM25_B + BM25_B * length / (average or 1.0))
+
+    def is_ready(self, corpus: PostCorpus) -> bool:
+        return corpus.version <= self.version
+
+    def sync(self, corpus: PostCorpus) -> None:
+        """스냅샷이 바뀌었으면 백그라운드 색인 요청 - 끝날 때까지 검색은 지금까지 색인된 포스트로 응답"""
+        if self.is_ready(corpus): return
+        with self._lock:
+            if self.is_ready(corpus): return
+            if self._pending is None or corpus.version > self._pending.version:
+                self._pending = corpus
+            if self._builder is not None and self._builder.is_alive(): return
+            self._builder = threading.Thread(
+                target=self._build, args=(current_app._get_current_object(),),
+                name='search-indexer', daemon=True,
+            )
+            self._builder.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """진행 중인 색인이 끝날 때까지 대기 (벤치마크/CLI용) - 끝났으면 True"""
+        builder = self._builder
+        if builder is not None:
+            builder.join(timeout)
+        return builder is None or not builder.is_alive()
+
+    def _build(self, app: Flask) -> None:
+        with app.app_context():
+            while True:
+                with self._lock:
+                    corpus, self._pending = self._pending, None
+                    if corpus is None:
+                        self._builder = None
+                        return
+                if self.is_ready(corpus): continue
+                try:
+                    self._apply(corpus)
+                except Exception as e:
+                    app.logger.error(f"검색 색인 오류: {e}", exc_info=True)
+
+    def _apply(self, corpus: PostCorpus) -> None:
+        """스냅샷과 시그니처를 비교해 추가/변경/삭제된 포스트만 반영 - 이전 색인은 새 내용이 준비되는 대로 교체"""
+        with self._lock:
+            for filename in [name for name in self._docs if name not in corpus.by_filename]:
+                self._remove(filename)
+            stale = [
+                (filename, post, corpus.signatures.get(filename))
+                for filename, post in corpus.by_filename.items()
+                if filename not in self._docs or self._docs[filename].signature != corpus.signatures.get(filename)
+            ]
+        for filename, post, signature in stale:
+            analyzed = self._analyze(post)
+            with self._lock:
+                self._remove(filename)
+                if analyzed is not None:
+                    self._add(filename, signature, *analyzed)
+        with self._lock:
+            average = self._total_length / len(self._docs) if self._docs else 1.0
+            self._norms = {
+                doc.doc_id: BM25_K1 * (1 - BM25_B + BM25_B * doc.length / (average or 1.0))
+                for doc in self._docs.values()
+            }
+            self.version = corpus.version
+        current_app.logger.info(f"검색 색인 갱신: v{corpus.version} ({len(self._docs)}개, 재색인 {len(stale)}개)")
+
+    def excerpt(self, filename: str) -> Optional[str]:
+        doc = self._docs.get(filename)
+        return doc.excerpt if doc is not None else None
+
+    def rank(self, query: str) -> List[Tuple[str, float]]:
+        """검색어 단어가 하나라도 있는 포스트의 (파일명, BM25 점수) 목록 (정렬하지 않음)"""
+        terms: Dict[str, int] = {}
+        for term in tokenize(query):
+            terms[term] = terms.get(term, 0) + 1
+        if not terms: return []
+        with self._lock:
+            total = len(self._docs)
+            scores: Dict[int, float] = {}
+            norms = self._norms
+            for term, query_count in terms.items():
+                postings = self._postings.get(term)
+                if not postings: continue
+                idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5)) * query_count
+                for doc_id, count in postings.items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * count * (BM25_K1 + 1) / (count + norms[doc_id])
+            return [(self._filenames[doc_id], score) for doc_id, score in scores.items()]
+
+def _highlight_pattern(query: str, text: str) -> Optional['re.Pattern']:
+    words = sorted(set(_QUERY_WORD_PATTERN.findall(query.lower())), key=len, reverse=True)
+    lowered = text.lower()
+    if words and not any(word in lowered for word in words):
+        # 검색어가 그대로 나오지 않으면 바이그램 단위로 강조
+        words = sorted(set(tokenize(query)), key=len, reverse=True)
+    if not words: return None
+    return re.compile('|'.join(re.escape(word) for word in words), re.IGNORECASE)
+
+def make_snippet(text: str, query: str, length: int = SNIPPET_LENGTH) -> Markup:
+    """검색어 첫 등장 위치 주변을 잘라 <mark>로 강조한 HTML 조각"""
+    text = _clean_text(text)
+    pattern = _highlight_pattern(query, text)
+    match = pattern.search(text) if pattern else None
+    start = max(0, match.start() - length // 3) if match else 0
+    end = min(len(text), start + length)
+    window = text[start:end]
+    parts: List[str] = ['…'] if start > 0 else []
+    position = 0
+    for found in (pattern.finditer(window) if pattern else ()):
+        parts.append(str(escape(window[position:found.start()])))
+        parts.append(f'<mark>{escape(found.group())}</mark>')
+        position = found.end()
+    parts.append(str(escape(window[position:])))
+    if end < len(text): parts.append('…')
+    return Markup(''.join(parts))
+
+_indexes: Dict[str, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+def get_search_index(corpus: PostCorpus) -> SearchIndex:
+    """스냅샷 디렉토리의 검색 색인 - 처음 조회할 때 만들고 이후에는 백그라운드에서 증분 갱신"""
+    index = _indexes.get(corpus.posts_dir)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.setdefault(corpus.posts_dir, SearchIndex(corpus.posts_dir))
+    index.sync(corpus)
+    return index
+
+def search_posts(query: str, page: int = 1, per_page: int = 10,
+                 posts_dir: Optional[str] = None) -> Tuple[List[SearchResult], int, bool]:
+    """BM25 순위로 한 페이지의 검색 결과, 전체 건수, 색인 완료 여부 반환 (동점은 최신순)
+
+    색인이 스냅샷을 따라잡기 전에는 지금까지 색인된 포스트만으로 찾은 부분 결과
+    """
+    query = query.strip()[:MAX_QUERY_LENGTH]
+    if not query: return [], 0, True
+    corpus = get_corpus(posts_dir)
+    index = get_search_index(corpus)
+    ranked = index.rank(query)
+    complete = index.is_ready(corpus)
+    positions = corpus.positions
+    ranked = [(name, score) for name, score in ranked if name in positions]
+    start = (page - 1) * per_page
+    # 요청한 페이지까지만 부분 정렬
+    top = heapq.nsmallest(start + per_page, ranked, key=lambda item: (-item[1], positions[item[0]]))
+    results = []
+    for filename, score in top[start:]:
+        post = corpus.by_filename[filename]
+        # 색인이 보관한 본문 앞부분에서 자름 (방금 색인에서 빠졌으면 목록용 미리보기)
+        excerpt = index.excerpt(filename)
+        text = excerpt if excerpt is not None else Markup(post.previews[-1]).unescape()
+        results.append(SearchResult(post=post, score=score, snippet=make_snippet(text, query)))
+    return results, len(ranked), complete
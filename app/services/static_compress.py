@@ -0,0 +1,161 @@
+# app/services/static_compress.py
+import gzip
+import mimetypes
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from flask import Flask, Response, request, send_from_directory
+from werkzeug.utils import safe_join
+
+from app.services.static_manifest import STATIC_MANIFEST_DIRS
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# 미리 압축해 둘 텍스트 계열 정적 파일 (이미지/폰트 woff2처럼 이미 압축된 형식은 제외)
+PRECOMPRESS_SUFFIXES = {'.css', '.js', '.mjs', '.map', '.json', '.svg', '.txt', '.xml', '.html', '.otf', '.ttf', '.ico'}
+# (Content-Encoding, 파일 접미사) - 품질값이 같으면 앞쪽을 우선
+VARIANTS = (('br', '.br'), ('gzip', '.gz'))
+MIN_COMPRESS_SIZE = 256
+# 원본 대비 이 비율보다 크게 줄지 않으면 압축본을 두지 않음
+MAX_COMPRESS_RATIO = 0.95
+
+@dataclass
+class PrecompressReport:
+    written: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    removed: List[str] = field(default_factory=list)
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+
+def _compress(data: bytes, encoding: str) -> Optional[bytes]:
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == 'br' and BROTLI_AVAILABLE:
+        return brotli.compress(data, quality=11)
+    return None
+
+def _write_variant(path: Path, data: bytes, source_mtime_ns: int) -> None:
+    """임시 파일에 쓰고 교체 - 수정 시각을 원본과 맞춰 두어 요청 때 최신 여부를 비교"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.precompress-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.utime(tmp_path, ns=(source_mtime_ns, source_mtime_ns))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def precompress_file(path: Path, force: bool = False) -> List[str]:
+    """파일 하나의 .br/.gz 압축본을 만들고 기록한 경로 목록 반환 (원본과 수정 시각이 같은 압축본은 그대로 둠)"""
+    stat = path.stat()
+    data = None
+    written = []
+    for encoding, suffix in VARIANTS:
+        variant = path.with_name(path.name + suffix)
+        if not force and variant.is_file() and variant.stat().st_mtime_ns == stat.st_mtime_ns:
+            continue
+        if data is None:
+            data = path.read_bytes()
+        compressed = _compress(data, encoding) if len(data) >= MIN_COMPRESS_SIZE else None
+        if compressed is None or len(compressed) > len(data) * MAX_COMPRESS_RATIO:
+            if variant.exists():
+                variant.unlink()
+            continue
+        _write_variant(variant, compressed, stat.st_mtime_ns)
+        written.append(str(variant))
+    return written
+
+def precompress_static(static_folder: str, force: bool = False) -> PrecompressReport:
+    """매니페스트 대상 디렉토리의 텍스트 자산을 미리 압축하고 원본이 사라진 (이 명령이 만든 형식의) 압축본은 삭제"""
+    report = PrecompressReport()
+    root = Path(static_folder)
+    for name in STATIC_MANIFEST_DIRS:
+        directory = root / name
+        if not directory.is_dir(): continue
+        for path in sorted(directory.rglob('*')):
+            if path.name.startswith('.') or not path.is_file():
+                continue
+            if path.suffix in ('.br', '.gz'):
+                # 이 명령이 만드는 형식의 압축본만 정리 (직접 둔 .gz 배포 파일 등은 건드리지 않음)
+                source = path.with_suffix('')
+                if source.suffix.lower() in PRECOMPRESS_SUFFIXES and not source.is_file():
+                    path.unlink()
+                    report.removed.append(str(path))
+                continue
+            if path.suffix.lower() not in PRECOMPRESS_SUFFIXES:
+                continue
+            try:
+                written = precompress_file(path, force)
+            except OSError as e:
+                report.failed.append((str(path), str(e)))
+                continue
+            if written:
+                report.written.extend(written)
+            else:
+                report.unchanged += 1
+    return report
+
+def build_asset_bundles(app: Flask) -> List[Tuple[str, Optional[str]]]:
+    """flask_assets 번들을 빌드해 static 아래에 출력 - (출력 경로, 오류) 목록"""
+    results = []
+    environment = app.jinja_env.assets_environment
+    with app.app_context():
+        for name, bundle in environment._named_bundles.items():
+            try:
+                bundle.build()
+                results.append((bundle.output or name, None))
+            except Exception as e:
+                results.append((bundle.output or name, str(e)))
+    return results
+
+def choose_variant(path: str) -> Optional[Tuple[str, str]]:
+    """Accept-Encoding과 최신 압축본으로 (인코딩, 접미사) 선택 - 없으면 None (원본 전송)"""
+    accept = request.accept_encodings
+    best, best_quality = None, 0.0
+    source_mtime_ns = None
+    for encoding, suffix in VARIANTS:
+        quality = accept[encoding]
+        if quality <= best_quality: continue
+        try:
+            if source_mtime_ns is None:
+                source_mtime_ns = os.stat(path).st_mtime_ns
+            if os.stat(path + suffix).st_mtime_ns != source_mtime_ns:
+                continue
+        except OSError:
+            continue
+        best, best_quality = (encoding, suffix), quality
+    return best
+
+def serve_precompressed_static(app: Flask) -> None:
+    """static 엔드포인트가 미리 만든 .br/.gz 압축본을 골라 보내도록 교체 - 요청 중 압축 없음"""
+    send_static = app.view_functions['static']
+
+    def static(filename: str) -> Response:
+        path = safe_join(app.static_folder, filename)
+        if path and os.path.splitext(path)[1].lower() in PRECOMPRESS_SUFFIXES:
+            variant = choose_variant(path)
+            if variant is not None:
+                encoding, suffix = variant
+                response = send_from_directory(
+                    app.static_folder, filename + suffix,
+                    mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream',
+                    max_age=app.get_send_file_max_age(filename),
+                )
+                response.headers['Content-Encoding'] = encoding
+                response.vary.add('Accept-Encoding')
+                return response
+            response = send_static(filename=filename)
+            response.vary.add('Accept-Encoding')
+            return response
+        return send_static(filename=filename)
+
+    app.view_functions['static'] = static
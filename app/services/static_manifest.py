@@ -0,0 +1,117 @@
+# app/services/static_manifest.py
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from flask import Flask, Response, request
+
+from app.services.content_watcher import content_changed
+
+# 내용 해시를 붙여 내보낼 정적 파일 디렉토리 (포스트 이미지/갤러리 사진처럼 많고 URL로 직접 쓰는 파일은 제외)
+STATIC_MANIFEST_DIRS = ('css', 'js', 'gen', 'font', 'images/site')
+HASH_LENGTH = 12
+IMMUTABLE_MAX_AGE = 31536000
+# 미리 압축한 변형 파일은 원본 해시를 그대로 씀
+SKIPPED_SUFFIXES = ('.gz', '.br', '.tmp')
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+class StaticManifest:
+    """정적 파일 경로 -> 내용 해시 - 시작할 때 만들어 두고 static_url은 dict 조회만 함"""
+
+    def __init__(self, static_folder: str, directories: Tuple[str, ...] = STATIC_MANIFEST_DIRS):
+        self.root = Path(static_folder)
+        self.directories = directories
+        self.hashes: Dict[str, str] = {}
+        # 경로 -> (크기, 수정 시각 ns, 해시) - 다시 만들 때 바뀌지 않은 파일은 읽지 않음
+        self._stats: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def _hash_entry(self, relative: str, path: Path) -> Optional[Tuple[int, int, str]]:
+        try:
+            stat = path.stat()
+            previous = self._stats.get(relative)
+            if previous and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+                return previous
+            return stat.st_size, stat.st_mtime_ns, file_hash(path)
+        except OSError:
+            return None
+
+    def refresh(self) -> None:
+        """디렉토리를 다시 훑어 목록 교체 (진행 중인 요청은 이전 목록을 계속 봄)"""
+        with self._lock:
+            stats: Dict[str, Tuple[int, int, str]] = {}
+            for name in self.directories:
+                directory = self.root / name
+                if not directory.is_dir(): continue
+                for path in directory.rglob('*'):
+                    if path.name.startswith('.') or path.suffix in SKIPPED_SUFFIXES or not path.is_file():
+                        continue
+                    relative = path.relative_to(self.root).as_posix()
+                    entry = self._hash_entry(relative, path)
+                    if entry is not None:
+                        stats[relative] = entry
+            self._stats = stats
+            self.hashes = {relative: entry[2] for relative, entry in stats.items()}
+
+    def revalidate(self, filename: str) -> Optional[str]:
+        """파일 하나만 다시 확인 (감시자 없는 개발 환경에서 렌더링할 때마다 사용)"""
+        if filename not in self.hashes: return None
+        with self._lock:
+            entry = self._hash_entry(filename, self.root / filename)
+            if entry is None:
+                self._stats.pop(filename, None)
+                self.hashes = {k: v for k, v in self.hashes.items() if k != filename}
+                return None
+            if entry[2] != self.hashes.get(filename):
+                self.hashes = {**self.hashes, filename: entry[2]}
+            self._stats[filename] = entry
+            return entry[2]
+
+    def lookup(self, filename: str) -> Optional[str]:
+        return self.hashes.get(filename)
+
+def init_static_manifest(app: Flask) -> StaticManifest:
+    """매니페스트를 만들고 감시자 변경 통지와 immutable 캐시 헤더를 연결"""
+    manifest = StaticManifest(app.static_folder)
+    app.extensions['static_manifest'] = manifest
+    app.logger.info(f"정적 파일 매니페스트: {len(manifest.hashes)}개")
+
+    def on_static_changed(sender: str, **kwargs) -> None:
+        if sender.startswith('static:'):
+            manifest.refresh()
+    content_changed.connect(on_static_changed, weak=False)
+
+    @app.after_request
+    def mark_immutable(response: Response) -> Response:
+        # 현재 해시가 붙은 주소만 영구 캐시 - 이전 해시로 온 요청은 기본 캐시 정책을 따름
+        if request.endpoint != 'static' or response.status_code not in (200, 206, 304):
+            return response
+        version = request.args.get('v')
+        if version and version == manifest.lookup((request.view_args or {}).get('filename', '')):
+            response.cache_control.public = True
+            response.cache_control.max_age = IMMUTABLE_MAX_AGE
+            response.cache_control.immutable = True
+            response.cache_control.no_cache = None
+        return response
+
+    return manifest
+
+def watched_static_directories(static_folder: str) -> Dict[str, str]:
+    """감시자에 넘길 {'static:<디렉토리>': 경로} - 감시자는 하위 디렉토리를 따라가지 않으므로 모두 나열"""
+    directories = {}
+    for name in STATIC_MANIFEST_DIRS:
+        directory = os.path.join(static_folder, name)
+        for current, subdirs, _ in os.walk(directory):
+            subdirs[:] = [d for d in subdirs if not d.startswith('.')]
+            relative = os.path.relpath(current, static_folder).replace(os.sep, '/')
+            directories[f'static:{relative}'] = current
+    return directories
@@ -0,0 +1,121 @@
+# app/services/tag_index.py
+import bisect
+import heapq
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+AUTOCOMPLETE_LIMIT = 10
+MAX_TAG_QUERY_LENGTH = 50
+# 스냅샷 버전마다 새로 만들어지므로 자주 입력되는 검색어만 잠깐 기억
+_RESULT_MEMO_SIZE = 512
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+class TagIndex:
+    """태그 자동완성용 인덱스 - 접두어는 정렬 배열 이분 탐색, 부분 문자열은 바이그램 역색인"""
+
+    def __init__(self, tags_count: Dict[str, int]):
+        self.names: List[str] = list(tags_count)
+        self.counts: List[int] = [tags_count[name] for name in self.names]
+        lowered = [name.lower() for name in self.names]
+        self._lowered = lowered
+        # (소문자 이름, 태그 번호) 정렬 배열 - 대소문자만 다른 태그도 각각 유지
+        self._sorted: List[Tuple[str, int]] = sorted((name, tag_id) for tag_id, name in enumerate(lowered))
+        self._sorted_keys: List[str] = [name for name, _ in self._sorted]
+        self._bigrams: Dict[str, List[int]] = {}
+        for tag_id, name in enumerate(lowered):
+            for gram in _bigrams(name):
+                self._bigrams.setdefault(gram, []).append(tag_id)
+        self._memo: Dict[str, List[Dict[str, object]]] = {}
+        self._memo_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _prefix_ids(self, query: str) -> List[int]:
+        start = bisect.bisect_left(self._sorted_keys, query)
+        # query 뒤에 올 수 있는 가장 큰 문자를 붙여 접두어 범위의 끝을 구함
+        end = bisect.bisect_left(self._sorted_keys, query + '\U0010ffff', start)
+        return [tag_id for _, tag_id in self._sorted[start:end]]
+
+    def _substring_ids(self, query: str) -> Set[int]:
+        grams = sorted(_bigrams(query), key=lambda gram: len(self._bigrams.get(gram, ())))
+        if not grams or grams[0] not in self._bigrams: return set()
+        candidates = set(self._bigrams[grams[0]])
+        for gram in grams[1:]:
+            candidates.intersection_update(self._bigrams[gram])
+            if not candidates: return candidates
+        return {tag_id for tag_id in candidates if query in self._lowered[tag_id]}
+
+    def complete(self, query: str, limit: int = AUTOCOMPLETE_LIMIT) -> List[Dict[str, object]]:
+        """접두어 일치를 먼저, 같은 사용 횟수끼리는 원래 태그 순서로 상위 limit개 반환"""
+        query = query.strip().lower()
+        if len(query) < 2 or len(query) > MAX_TAG_QUERY_LENGTH: return []
+        key = f'{limit}:{query}'
+        cached = self._memo.get(key)
+        if cached is not None: return cached
+        prefix = self._prefix_ids(query)
+        prefix_set = set(prefix)
+        ranked = [(-self.counts[tag_id], 0, tag_id) for tag_id in prefix]
+        ranked.extend((-self.counts[tag_id], 1, tag_id) for tag_id in self._substring_ids(query) - prefix_set)
+        results = [
+            {'name': self.names[tag_id], 'count': self.counts[tag_id], 'url': f'/posts/tag/{self.names[tag_id]}'}
+            for _, _, tag_id in heapq.nsmallest(limit, ranked)
+        ]
+        with self._memo_lock:
+            if len(self._memo) >= _RESULT_MEMO_SIZE:
+                self._memo.clear()
+            self._memo[key] = results
+        return results
+
+class TagGraph:
+    """태그 동시 출현 표 - 태그를 번호로 바꿔 희소 행렬(번호 -> {번호: 함께 쓰인 포스트 수})로 보관"""
+
+    def __init__(self, posts: Iterable[Sequence[str]], tags_count: Dict[str, int]):
+        self.names: List[str] = list(tags_count)
+        self.counts: List[int] = [tags_count[name] for name in self.names]
+        self._ids: Dict[str, int] = {name: tag_id for tag_id, name in enumerate(self.names)}
+        self._matrix: Dict[int, Dict[int, int]] = {}
+        # 포스트 순서대로 쌓아 동점일 때 먼저 함께 등장한 태그가 앞에 오도록 함
+        for tags in posts:
+            ids = [self._intern(tag) for tag in dict.fromkeys(tags)]
+            for tag_id in ids:
+                row = self._matrix.setdefault(tag_id, {})
+                for other_id in ids:
+                    if other_id != tag_id:
+                        row[other_id] = row.get(other_id, 0) + 1
+        self._payload: Optional[Dict[str, Any]] = None
+
+    def _intern(self, tag: str) -> int:
+        tag_id = self._ids.get(tag)
+        if tag_id is None:
+            tag_id = self._ids[tag] = len(self.names)
+            self.names.append(tag)
+            self.counts.append(0)
+        return tag_id
+
+    def related(self, tag: str, limit: int = 10) -> Optional[List[Tuple[str, int]]]:
+        """함께 많이 쓰인 태그 상위 limit개 (태그가 어느 포스트에도 없으면 None)"""
+        tag_id = self._ids.get(tag)
+        if tag_id is None or tag_id not in self._matrix: return None
+        row = self._matrix[tag_id]
+        top = heapq.nlargest(limit, row.items(), key=lambda item: item[1])
+        return [(self.names[other_id], count) for other_id, count in top]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """시각화용 전체 네트워크 (노드와 무방향 간선) - 처음 요청할 때 한 번 만듦"""
+        if self._payload is None:
+            self._payload = {
+                'nodes': [
+                    {'id': tag_id, 'name': name, 'count': self.counts[tag_id], 'url': f'/posts/tag/{name}'}
+                    for tag_id, name in enumerate(self.names)
+                ],
+                'edges': [
+                    {'source': tag_id, 'target': other_id, 'weight': weight}
+                    for tag_id, row in sorted(self._matrix.items())
+                    for other_id, weight in sorted(row.items())
+                    if tag_id < other_id
+                ],
+            }
+        return self._payload
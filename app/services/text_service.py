@@ -1,16 +1,24 @@
 # app/services/text_service.py
 import os
 import re
+import codecs
 import hashlib
-from datetime import datetime
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Set
-from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, Set
+from dataclasses import InitVar, dataclass, field
 from flask import url_for, current_app
 from markupsafe import escape, Markup
 from werkzeug.utils import secure_filename
 from PIL import Image, ImageOps
 
+from app.services.cache_service import ByteLRUCache
+from app.services.content_watcher import content_changed
+from app.services.pagination import DEFAULT_PER_PAGE, Page
+
 try:
     from pillow_heif import register_heif_opener
     register_heif_opener()
@@ -29,10 +37,12 @@ except ImportError:
 try:
     import bleach
     from bleach.css_sanitizer import CSSSanitizer
+    from bleach.linkifier import LinkifyFilter
     BLEACH_AVAILABLE = True
 except ImportError:
     bleach = None
     CSSSanitizer = None  # type: ignore
+    LinkifyFilter = object  # type: ignore
     BLEACH_AVAILABLE = False
 
 try:
@@ -43,6 +53,66 @@ except ImportError:
 
 MAX_FILE_SIZE = 10 * 1024 * 1024
 CACHE_VERSION = "v2.0"
+RENDER_CACHE_MAX_BYTES = 64 * 1024 * 1024
+POST_BODY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+FULL_POST_CACHE_SIZE = 128
+WORD_COUNT_CACHE_SIZE = 4096
+# 목록 로딩 시 헤더 뒤로 읽어 두는 본문 앞부분 (미리보기/첫 이미지 계산용, 글자 수)
+PREVIEW_SOURCE_CHARS = 2000
+PREVIEW_SOURCE_MAX_CHARS = 32 * 1024
+# 템플릿이 쓰는 미리보기 길이 (get_preview/get_rich_preview) - PostSummary에 미리 계산해 둠
+PREVIEW_LENGTHS = (70, 80, 100, 120, 150)
+_PREVIEW_LENGTH_INDEX = {length: index for index, length in enumerate(PREVIEW_LENGTHS)}
+_HEAD_READ_BYTES = 8 * 1024
+_PREVIEW_MARGIN_CHARS = 16
+# 미리보기 마크업 제거를 시작할 앞부분 크기 (모자라면 두 배씩 늘림)
+_PREVIEW_STRIP_CHUNK = 512
+# 인코딩 판별 순서 (UTF-8 BOM이 있으면 utf-8 대신 utf-8-sig)
+_TEXT_ENCODINGS = ('utf-8', 'cp949', 'euc-kr', 'latin-1')
+_LINE_BREAK_PATTERN = re.compile(rb'\r\n|\r|\n')
+_META_LINE_PATTERN = re.compile(r'^\[([a-zA-Z\-_]+):\s*(.+?)\]$')
+_META_KEY_PATTERN = re.compile(r'^[a-zA-Z\-_]+$')
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_render_cache: Optional[ByteLRUCache] = None
+_body_cache: Optional[ByteLRUCache] = None
+_full_post_cache: Optional[ByteLRUCache] = None
+_word_count_cache: Optional[ByteLRUCache] = None
+
+_DEFAULT_MARKDOWN_EXTENSIONS = ['extra', 'nl2br', 'sane_lists', 'codehilite', 'toc']
+MARKDOWN_EXTENSION_CONFIGS = {
+    'codehilite': {'css_class': 'highlight', 'linenums': False, 'guess_lang': False, 'use_pygments': True},
+    'toc': {'permalink': True, 'permalink_class': 'toc-link', 'permalink_title': '이 섹션에 대한 링크'}
+}
+_markdown_local = threading.local()
+_cleaner_local = threading.local()
+
+# 미리보기/단어 수 계산용 정규식 (순서대로 적용)
+_PREVIEW_STRIP_PATTERNS = [
+    re.compile(pattern, re.DOTALL | re.MULTILINE) for pattern in (
+        r'\[(?:img|video|audio|youtube):[^\]]+\]',
+        r'\[highlight\].*?\[/highlight\].*?', r'\[quote.*?\].*?\[/quote\]', r'\[.*?\].*?(?:.*?)\[/.*?\].*?',
+        r'#+\s+', r'\*\*|\*|__|__', r'!\\[.*?\\]', r'\[.*?\\]',
+    )
+]
+# 각 규칙이 일치하려면 반드시 들어 있어야 하는 문자열 - 없으면 정규식을 돌리지 않음
+# (None: 강조 기호 규칙은 같은 결과의 str.replace로 처리)
+_PREVIEW_STRIP_LITERALS = ('[', '[highlight]', '[quote', '[', '#', None, '!\\', '[')
+# 앞부분 끝에서 닫히지 않은 미디어 태그 (첫 번째 규칙이 뒤쪽의 ']'까지 이어서 지울 수 있음)
+_OPEN_MEDIA_TAG_PATTERN = re.compile(r'\[(?:img|video|audio|youtube):[^\]]*\Z')
+# 날짜 메타데이터의 기본 형식
+_ISO_DATE_PATTERN = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}\Z')
+# 파일명, 태그/시리즈 이름에 허용하는 문자
+_FILENAME_PATTERN = re.compile(r'^[a-zA-Z0-9가-힣\s_.-]+$')
+_TAG_PATTERN = re.compile(r'^[가-힣a-zA-Z0-9\s\-_]+$')
+_FIRST_IMAGE_PATTERN = re.compile(r'\[img:([^\|\]\r\n]+?)(?:\|([^\|\]\r\n]*?))?(?:\|([^\]\r\n]*?))?\]')
+# 같은 규칙을 디코딩 전 바이트에 적용 ('[', ']', '|', 줄바꿈은 cp949/euc-kr 두 번째 바이트로 나오지 않음)
+_FIRST_IMAGE_BYTES_PATTERN = re.compile(rb'\[img:([^\|\]\r\n]+?)(?:\|([^\|\]\r\n]*?))?(?:\|([^\]\r\n]*?))?\]')
+_WORD_COUNT_TAG_PATTERN = re.compile(r'\[.*?]', re.DOTALL)
+_WORD_COUNT_MARKUP_PATTERN = re.compile(r'[#*_`~]')
+_WORD_PATTERN = re.compile(r'\w+')
+_KOREAN_CHAR_PATTERN = re.compile(r'[가-힣]')
 
 class URLLinkifyParser(HTMLParser):
     """HTML 내의 텍스트 노드만 추출하여 URL 링크 변환"""
@@ -74,11 +144,69 @@ class URLLinkifyParser(HTMLParser):
         else:
             self.result.append(_linkify_text_urls(data))
 
+# 자동 링크 변환에서 제외할 태그
+LINKIFY_SKIP_TAGS = {'a', 'script', 'style', 'code', 'pre'}
+_URL_PATTERN = re.compile(r'\b(https?://[^\s<>]+)')
+
+class PostLinkifyFilter(LinkifyFilter):
+    """bleach 정제와 같은 트리 순회에서 텍스트 노드의 URL만 링크로 변환"""
+    def __init__(self, source):
+        super().__init__(source, callbacks=[], skip_tags=LINKIFY_SKIP_TAGS)
+
+    def handle_links(self, src_iter):
+        for token in src_iter:
+            if token["type"] != "Characters" or '://' not in token["data"]:
+                yield token
+                continue
+            text = token["data"]
+            end = 0
+            for match in _URL_PATTERN.finditer(text):
+                url = match.group(1).rstrip('.,;:!?)]')
+                if len(url) > 1000 or not _is_safe_url(url):
+                    continue
+                if match.start() > end:
+                    yield {"type": "Characters", "data": text[end:match.start()]}
+                display_text = url[:57] + "..." if len(url) > 60 else url
+                yield {"type": "StartTag", "name": "a", "data": {
+                    (None, "href"): url,
+                    (None, "target"): "_blank",
+                    (None, "rel"): "noopener noreferrer nofollow",
+                    (None, "class"): "auto-link post-link",
+                    (None, "title"): url,
+                }}
+                yield {"type": "Characters", "data": display_text}
+                yield {"type": "EndTag", "name": "a"}
+                end = match.start() + len(url)
+            if end < len(text):
+                yield {"type": "Characters", "data": text[end:]}
+
+@dataclass(frozen=True)
+class PostSource:
+    """본문을 나중에 읽기 위한 파일 위치 (헤더 블록 바로 뒤의 바이트 오프셋)"""
+    path: str
+    encoding: str
+    body_offset: int
+    size: int
+    mtime_ns: int
+
+@dataclass(frozen=True)
+class PostHead:
+    """헤더 블록과 본문 앞부분만 읽은 결과"""
+    metadata: Dict[str, str]
+    source: PostSource
+    preview_source: str
+    truncated: bool
+    # 앞부분에 이미지가 없을 때 본문 전체에서 찾은 첫 이미지 태그 ('': 없음, None: 찾아보지 않음)
+    image_source: Optional[str] = None
+
 @dataclass
 class TextPost:
-    """텍스트 파일 기반 포스트 클래스 - 타입 안전성 강화"""
+    """텍스트 파일 기반 포스트 클래스 - 타입 안전성 강화
+
+    ``source``가 있으면 본문은 필요할 때 파일에서 읽어 제한된 캐시에 보관 (목록에는 앞부분만 유지)
+    """
     filename: str
-    content: str
+    body: InitVar[Optional[str]] = None
     id: str = field(init=False)
     
     title: str = ""
@@ -94,12 +222,18 @@ class TextPost:
     changelog: List[str] = field(default_factory=list)
     thumbnail: Optional[str] = None
     thumbnail_alt: Optional[str] = None
+    source: Optional[PostSource] = field(default=None, repr=False, compare=False)
     
+    _content: Optional[str] = field(default=None, init=False, repr=False)
+    _preview_source: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _preview_truncated: bool = field(default=False, init=False, repr=False, compare=False)
+    _image_source: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     _hash: Optional[str] = field(default=None, init=False)
     _word_count: Optional[int] = field(default=None, init=False)
     _preview: Optional[str] = field(default=None, init=False)
     
-    def __post_init__(self):
+    def __post_init__(self, body: Optional[str]):
+        self._content = body
         if not self._validate_filename(self.filename):
             raise ValueError(f"잘못된 파일명: {self.filename}")
         self.id = Path(self.filename).stem
@@ -117,7 +251,7 @@ class TextPost:
         
         # 허용 문자: 영문, 숫자, 한글, 공백, 특수문자(-, _, .)
         # werkzeug.utils.secure_filename은 한글을 제거하므로 정규식으로 대체
-        if not re.match(r'^[a-zA-Z0-9가-힣\s_.-]+$', filename):
+        if not _FILENAME_PATTERN.match(filename):
             return False
             
         allowed_extensions = current_app.config.get('ALLOWED_TEXT_EXTENSIONS', {'txt', 'md'})
@@ -174,10 +308,17 @@ class TextPost:
         self.thumbnail_alt = alt_text
 
     def _parse_date(self, date_str: str) -> None:
+        date_str = str(date_str).strip()
+        # 대부분인 YYYY-MM-DD는 strptime보다 훨씬 빠른 fromisoformat으로 (결과 동일)
+        if _ISO_DATE_PATTERN.match(date_str):
+            try:
+                self.date = self.created_at = datetime.fromisoformat(date_str)
+                return
+            except ValueError: pass
         date_formats = ['%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M']
         for fmt in date_formats:
             try:
-                self.date = datetime.strptime(str(date_str).strip(), fmt)
+                self.date = datetime.strptime(date_str, fmt)
                 self.created_at = self.date
                 return
             except ValueError: continue
@@ -191,13 +332,13 @@ class TextPost:
         for tag in raw_tags[:max_tags]:
             tag = tag.strip()
             if not tag or len(tag) > max_tag_length: continue
-            if re.match(r'^[가-힣a-zA-Z0-9\s\-_]+$', tag):
+            if _TAG_PATTERN.match(tag):
                 self.tags.append(escape(tag))
     
     def _parse_series_info(self, metadata: Dict[str, str]) -> None:
         if 'series' in metadata:
             series = str(metadata['series'])[:100]
-            if re.match(r'^[가-힣a-zA-Z0-9\s\-_]+$', series):
+            if _TAG_PATTERN.match(series):
                 self.series = escape(series)
         if 'series-part' in metadata:
             try:
@@ -208,6 +349,25 @@ class TextPost:
     def _parse_changelog(self, changelog_str: str) -> None:
         self.changelog = [escape(item.strip()[:200]) for item in str(changelog_str).split(',')[:10] if item.strip()]
     
+    @property
+    def content(self) -> str:
+        if self._content is not None: return self._content
+        if self.source is None: return ""
+        return _load_post_body(self.source)
+
+    def set_preview_source(self, preview_source: str, truncated: bool, image_source: Optional[str] = None) -> None:
+        self._preview_source = preview_source
+        self._preview_truncated = truncated
+        self._image_source = image_source
+
+    def _get_preview_source(self) -> Tuple[str, bool]:
+        """미리보기용 본문 앞부분과 잘림 여부 - 본문 전체를 읽지 않음"""
+        if self._content is not None or self.source is None:
+            return self.content, False
+        if self._preview_source is None:
+            self._preview_source, self._preview_truncated = _read_preview_source(self.source)
+        return self._preview_source, self._preview_truncated
+
     def get_url(self) -> str:
         return url_for('posts.view_by_slug', slug=self.slug or self.id)
     
@@ -220,56 +380,18 @@ class TextPost:
         return preview
     
     def _generate_preview_text(self, length: int) -> str:
-        patterns_to_remove = [
-            r'\[(?:img|video|audio|youtube):[^\]]+\]',
-            r'\[highlight\].*?\[/highlight\].*?', r'\[quote.*?\].*?\[/quote\]', r'\[.*?\].*?(?:.*?)\[/.*?\].*?',
-            r'#+\s+', r'\*\*|\*|__|__', r'!\\[.*?\\]', r'\[.*?\\]',
-        ]
-        text = self.content
-        for pattern in patterns_to_remove:
-            text = re.sub(pattern, ' ', text, flags=re.DOTALL | re.MULTILINE)
-        text = re.sub(r'\s+', ' ', text).strip()
-        if len(text) <= length: return escape(text)
-        preview_text = text[:length]
-        last_space = preview_text.rfind(' ')
-        if last_space > length * 0.8:
-            preview_text = preview_text[:last_space]
-        return escape(preview_text) + "..."
+        source, truncated = self._get_preview_source()
+        return _make_preview_text(source, truncated, lambda: self.content, length)
 
     def get_rich_preview(self, text_length: int = 150) -> Dict[str, Optional[str]]:
-        text_preview_content = self._generate_preview_text(text_length)
-        
-        # Prioritize dedicated thumbnail
-        if self.thumbnail:
-            return {
-                "text": text_preview_content,
-                "image_filename": self.thumbnail,
-                "image_alt": escape(self.thumbnail_alt or self.title)
-            }
-
-        # Fallback to first image in content
-        first_image_filename: Optional[str] = None
-        first_image_alt: str = ""
-        img_match = re.search(r'\[img:([^\|\]\r\n]+?)(?:\|([^\|\]\r\n]*?))?(?:\|([^\]\r\n]*?))?\]', self.content)
-        if img_match:
-            filename_from_tag = img_match.group(1).strip()
-            alt_text_from_tag = img_match.group(2).strip() if img_match.group(2) and img_match.group(2).strip() else filename_from_tag
-            secure_name = secure_filename(filename_from_tag)
-            if secure_name == filename_from_tag:
-                allowed_img_extensions = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg'}
-                if any(filename_from_tag.lower().endswith(f'.{ext}') for ext in {'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'heic', 'heif'}):
-                    first_image_filename = filename_from_tag
-                    first_image_alt = alt_text_from_tag
-                    
-        return {"text": text_preview_content, "image_filename": first_image_filename, "image_alt": escape(first_image_alt)}
+        source, truncated = self._get_preview_source()
+        image_filename, image_alt = _find_preview_image(source, truncated, lambda: self.content,
+                                                        self.thumbnail, self.thumbnail_alt, self.title)
+        return {"text": self._generate_preview_text(text_length), "image_filename": image_filename, "image_alt": image_alt}
 
     def get_word_count(self) -> int:
-        if self._word_count is not None: return self._word_count
-        text = re.sub(r'\[.*?]', '', self.content, flags=re.DOTALL)
-        text = re.sub(r'[#*_`~]', '', text)
-        words = re.findall(r'\w+', text)
-        korean_chars = len(re.findall(r'[가-힣]', text))
-        self._word_count = len(words) + korean_chars // 2
+        if self._word_count is None:
+            self._word_count = _count_words(self.content)
         return self._word_count
     
     def get_file_hash(self) -> str:
@@ -278,6 +400,107 @@ class TextPost:
             self._hash = hashlib.md5(content.encode('utf-8')).hexdigest()
         return self._hash
 
+@dataclass(frozen=True, slots=True)
+class PostSummary:
+    """목록 화면용 포스트 요약 - 슬롯 기반 불변 객체 (태그 문자열은 intern, 날짜는 마이크로초 정수)
+
+    미리보기(PREVIEW_LENGTHS 길이별)와 대표 이미지는 로딩 시 한 번 계산해 두므로 목록 렌더링에는 정규식이 돌지 않음
+    단어 수는 본문 전체가 필요하므로 처음 요청될 때 계산해 별도 캐시에 보관 (로딩 시 본문을 읽지 않도록)
+    단일 포스트 화면에는 load_full_post로 만든 TextPost를 사용
+    """
+    filename: str
+    id: str
+    slug: str
+    title: str
+    # 1970-01-01 기준 마이크로초 (naive datetime과 1:1 대응, 정렬 키로 그대로 사용)
+    date_us: int
+    tags: Tuple[str, ...]
+    author: str
+    series: Optional[str]
+    series_part: Optional[int]
+    thumbnail: Optional[str]
+    # PREVIEW_LENGTHS 순서의 미리보기 텍스트
+    previews: Tuple[str, ...] = field(repr=False)
+    image_filename: Optional[str] = field(repr=False)
+    image_alt: str = field(repr=False)
+    # 인덱스에 기록된 값이 없으면 None (get_word_count가 세어 캐시에 보관)
+    word_count: Optional[int] = field(repr=False, compare=False)
+    source: Optional[PostSource] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_post(cls, post: TextPost) -> 'PostSummary':
+        source, truncated = post._get_preview_source()
+        load_content = lambda: post.content
+        # 로딩 작업자가 본문에서 찾아 둔 이미지 태그가 있으면 본문 전체를 읽지 않음
+        image_source = post._image_source
+        load_image_source = load_content if image_source is None else (lambda: image_source)
+        image_filename, image_alt = _find_preview_image(source, truncated, load_image_source,
+                                                        post.thumbnail, post.thumbnail_alt, post.title)
+        return cls(
+            filename=post.filename, id=post.id, slug=post.slug, title=post.title,
+            date_us=to_date_us(post.date),
+            tags=tuple(sys.intern(str(tag)) for tag in post.tags),
+            author=post.author, series=post.series, series_part=post.series_part, thumbnail=post.thumbnail,
+            previews=_make_preview_texts(source, truncated, load_content, PREVIEW_LENGTHS),
+            image_filename=image_filename, image_alt=image_alt,
+            word_count=post._word_count, source=post.source,
+        )
+
+    @property
+    def date(self) -> datetime:
+        return _EPOCH + timedelta(microseconds=self.date_us)
+
+    def _load_content(self) -> str:
+        return _load_post_body(self.source) if self.source is not None else ""
+
+    @property
+    def content(self) -> str:
+        """본문 전체 - 보관하지 않고 본문 캐시를 거쳐 읽음"""
+        return self._load_content()
+
+    def _preview_text(self, length: int) -> str:
+        index = _PREVIEW_LENGTH_INDEX.get(length)
+        if index is not None: return self.previews[index]
+        # 미리 계산하지 않은 길이는 파일에서 앞부분을 다시 읽어 계산 (보관하지 않음)
+        source, truncated = _read_preview_source(self.source) if self.source is not None else ("", False)
+        return _make_preview_text(source, truncated, self._load_content, length)
+
+    @property
+    def cache_key(self) -> Tuple[Any, ...]:
+        """화면 조각 캐시 키 - 요약은 파일 내용에서만 만들어지므로 파일 시그니처(크기, 수정 시각)로 대신함"""
+        if self.source is None: return (self.filename, self.date_us, self.title)
+        return (self.filename, self.source.size, self.source.mtime_ns)
+
+    def get_url(self) -> str:
+        return url_for('posts.view_by_slug', slug=self.slug or self.id)
+
+    def get_preview(self, length: int = 200) -> str:
+        return self._preview_text(max(50, min(length, current_app.config.get('MAX_PREVIEW_LENGTH', 300))))
+
+    def get_rich_preview(self, text_length: int = 150) -> Dict[str, Optional[str]]:
+        return {"text": self._preview_text(text_length), "image_filename": self.image_filename, "image_alt": self.image_alt}
+
+    def get_word_count(self) -> int:
+        if self.word_count is not None: return self.word_count
+        # 요약은 불변이므로 처음 계산한 값은 파일 시그니처 기준 캐시에 보관
+        cache = get_word_count_cache()
+        count = cache.get(self.cache_key)
+        if count is None:
+            count = _count_words(self._load_content())
+            cache.set(self.cache_key, count)
+        return count
+
+def _count_words(content: str) -> int:
+    text = _WORD_COUNT_TAG_PATTERN.sub('', content)
+    text = _WORD_COUNT_MARKUP_PATTERN.sub('', text)
+    words = _WORD_PATTERN.findall(text)
+    korean_chars = len(_KOREAN_CHAR_PATTERN.findall(text))
+    return len(words) + korean_chars // 2
+
+def to_date_us(value: datetime) -> int:
+    """PostSummary.date_us 형식 (1970-01-01 기준 마이크로초)"""
+    return (value - _EPOCH) // _MICROSECOND
+
 def parse_text_file(file_path: Union[str, Path]) -> Tuple[Dict[str, str], str]:
     file_path = Path(file_path)
     if not _validate_file_path(file_path): raise ValueError(f"잘못된 파일 경로: {file_path}")
@@ -297,6 +520,306 @@ def parse_text_file(file_path: Union[str, Path]) -> Tuple[Dict[str, str], str]:
         current_app.logger.error(f"파일 파싱 오류 {file_path}: {e}")
         raise
 
+def _strip_preview_markup(text: str) -> str:
+    for literal, pattern in zip(_PREVIEW_STRIP_LITERALS, _PREVIEW_STRIP_PATTERNS):
+        if literal is None:
+            text = text.replace('**', ' ').replace('*', ' ').replace('__', ' ')
+        elif literal in text:
+            text = pattern.sub(' ', text)
+    # 정규식 \s와 str.split()은 같은 공백 문자 정의를 씀
+    return ' '.join(text.split())
+
+def _cut_preview_text(text: str, length: int) -> str:
+    if len(text) <= length: return escape(text)
+    preview_text = text[:length]
+    last_space = preview_text.rfind(' ')
+    if last_space > length * 0.8:
+        preview_text = preview_text[:last_space]
+    # Markup.__add__는 뒤쪽 문자열을 다시 이스케이프하므로 한 번에 만듦 (미리보기 길이마다 호출됨)
+    return Markup(f"{escape(preview_text)}...")
+
+def _strip_preview_prefix(source: str, needed: int) -> str:
+    """마크업을 제거한 텍스트의 앞 ``needed``자 이상 - 짧은 앞부분으로 충분하면 그 부분만 처리
+
+    치환은 모두 공백이라 잘린 경계의 영향은 마지막 단어에만 미치므로, 마지막 단어를 버린 나머지는 전체 결과의 앞부분과 같음
+    """
+    limit = _PREVIEW_STRIP_CHUNK
+    while limit < len(source):
+        head = source[:limit]
+        if _is_preview_source_closed(head):
+            text = _strip_preview_markup(head).rpartition(' ')[0]
+            if len(text) > needed: return text
+        limit *= 2
+    return _strip_preview_markup(source)
+
+def _make_preview_texts(source: str, truncated: bool, load_content: Callable[[], str],
+                        lengths: Tuple[int, ...]) -> Tuple[str, ...]:
+    """여러 길이의 미리보기를 마크업 제거 한 번으로 계산"""
+    text = _strip_preview_prefix(source, max(lengths) + _PREVIEW_MARGIN_CHARS)
+    full_text: Optional[str] = None
+    previews = []
+    for length in lengths:
+        current = text
+        if truncated and len(text) <= length + _PREVIEW_MARGIN_CHARS:
+            # 앞부분이 대부분 태그라 모자라면 본문 전체로 계산 (잘린 끝의 공백/강조 기호 차이도 피함)
+            if full_text is None: full_text = _strip_preview_markup(load_content())
+            current = full_text
+        previews.append(_cut_preview_text(current, length))
+    return tuple(previews)
+
+def _make_preview_text(source: str, truncated: bool, load_content: Callable[[], str], length: int) -> str:
+    return _make_preview_texts(source, truncated, load_content, (length,))[0]
+
+def _find_preview_image(source: str, truncated: bool, load_content: Callable[[], str],
+                        thumbnail: Optional[str], thumbnail_alt: Optional[str], title: str) -> Tuple[Optional[str], str]:
+    """카드에 쓸 (이미지 파일명, 이스케이프된 대체 텍스트)"""
+    # Prioritize dedicated thumbnail
+    if thumbnail:
+        return thumbnail, escape(thumbnail_alt or title)
+
+    # Fallback to first image in content
+    first_image_filename: Optional[str] = None
+    first_image_alt: str = ""
+    img_match = _FIRST_IMAGE_PATTERN.search(source)
+    if img_match is None and truncated:
+        img_match = _FIRST_IMAGE_PATTERN.search(load_content())
+    if img_match:
+        filename_from_tag = img_match.group(1).strip()
+        alt_text_from_tag = img_match.group(2).strip() if img_match.group(2) and img_match.group(2).strip() else filename_from_tag
+        secure_name = secure_filename(filename_from_tag)
+        if secure_name == filename_from_tag:
+            allowed_img_extensions = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg'}
+            if any(filename_from_tag.lower().endswith(f'.{ext}') for ext in {'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'heic', 'heif'}):
+                first_image_filename = filename_from_tag
+                first_image_alt = alt_text_from_tag
+                
+    return first_image_filename, escape(first_image_alt)
+
+def _is_preview_source_closed(text: str) -> bool:
+    """남은 '['가 모두 앞부분 안에서 닫히는지 - 아니면 잘린 뒤쪽과 짝지어져 미리보기가 달라질 수 있음"""
+    # 규칙마다 바로 확인 - 뒤 규칙이 열린 태그를 지워 버리면 전체 본문에서의 결과와 달라짐
+    text = _PREVIEW_STRIP_PATTERNS[0].sub(' ', text)
+    if _OPEN_MEDIA_TAG_PATTERN.search(text): return False
+    text = _PREVIEW_STRIP_PATTERNS[1].sub(' ', text)
+    if '[highlight]' in text: return False
+    text = _PREVIEW_STRIP_PATTERNS[2].sub(' ', text)
+    if '[quote' in text: return False
+    # 네 번째 규칙(\[.*?\].*?\[/.*?\])의 최단 일치를 정규식 역추적 없이 따라감
+    start = text.find('[')
+    while start != -1:
+        close = text.find(']', start + 1)
+        closer = text.find('[/', close + 1) if close != -1 else -1
+        end = text.find(']', closer + 2) if closer != -1 else -1
+        if end == -1: return False
+        start = text.find('[', end + 1)
+    return True
+
+def _cut_preview_source(body: str, complete: bool) -> Optional[Tuple[str, bool]]:
+    """본문 앞부분에서 미리보기 원문을 자름 - (원문, 잘림 여부), 더 읽어야 하면 None
+
+    태그가 잘림 지점에 걸치면 닫힐 때까지 늘리되 PREVIEW_SOURCE_MAX_CHARS를 넘으면 앞부분으로 근사
+    """
+    if complete and len(body) <= PREVIEW_SOURCE_CHARS:
+        return body, False
+    if len(body) > PREVIEW_SOURCE_CHARS and _is_preview_source_closed(body[:PREVIEW_SOURCE_CHARS]):
+        return body[:PREVIEW_SOURCE_CHARS], True
+    if len(body) > PREVIEW_SOURCE_MAX_CHARS:
+        return body[:PREVIEW_SOURCE_CHARS], True
+    if complete:
+        return body, False
+    if len(body) > PREVIEW_SOURCE_CHARS and _is_preview_source_closed(body):
+        return body, True
+    return None
+
+def _normalize_newlines(text: str) -> str:
+    # 텍스트 모드 읽기(universal newlines)와 같은 결과
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+def _encoding_candidates(data: bytes, start: Optional[str] = None) -> Tuple[str, ...]:
+    candidates = _TEXT_ENCODINGS
+    if data.startswith(codecs.BOM_UTF8):
+        # utf-8로 읽으면 U+FEFF가 첫 헤더 줄 앞에 남아 그 줄의 메타데이터가 무시됨
+        candidates = ('utf-8-sig',) + candidates[1:]
+    if start in candidates:
+        candidates = candidates[candidates.index(start):]
+    return candidates
+
+def detect_encoding(data: bytes, start: Optional[str] = None) -> str:
+    """메모리의 바이트로 인코딩 판별 (BOM 확인 후 _TEXT_ENCODINGS 순서, latin-1은 항상 성공)"""
+    return _decode_text(data, start)[1]
+
+def _decode_text(data: bytes, start: Optional[str] = None) -> Tuple[str, str]:
+    """인코딩을 순서대로 시도해 (텍스트, 인코딩) 반환 - 파일을 다시 열지 않음
+
+    ``start``: 이미 판별한 인코딩 - 같은 파일이나 그 앞부분을 포함하는 버퍼라면 앞 순서 인코딩은 다시 실패하므로 건너뜀
+    """
+    for encoding in _encoding_candidates(data, start):
+        try:
+            return _normalize_newlines(data.decode(encoding)), encoding
+        except UnicodeDecodeError: continue
+    return _normalize_newlines(data.decode('utf-8', errors='replace')), 'utf-8'
+
+def _split_header(lines: List[str]) -> Tuple[Dict[str, str], int, bool]:
+    """_extract_metadata_and_body의 헤더 규칙 - (메타데이터, 본문 시작 줄, 헤더가 끝났는지)"""
+    metadata = {}
+    content_start = 0
+    for i, line in enumerate(lines):
+        line = line.strip()
+        if not line: continue
+        match = _META_LINE_PATTERN.match(line)
+        if match:
+            key, value = match.groups()
+            if len(key) <= 50 and _META_KEY_PATTERN.match(key):
+                metadata[key.lower()] = value.strip()
+            content_start = i + 1
+        else: return metadata, content_start, True
+    return metadata, content_start, False
+
+def _read_post_head(file_path: Path, max_size: int, known: Optional[PostSource] = None,
+                    scan_images: bool = False) -> PostHead:
+    """헤더 블록과 미리보기에 필요한 만큼의 본문만 읽음 (앱 컨텍스트 없이 작업 스레드/프로세스에서 실행)
+
+    ``known``의 크기/수정 시간이 지금 파일과 같으면 기록된 인코딩부터 시도
+    ``scan_images``면 앞부분에 이미지가 없을 때 나머지 바이트에서 첫 이미지 태그를 찾아 둠 (카드 이미지용)
+    """
+    with open(file_path, 'rb') as file:
+        stat = os.fstat(file.fileno())
+        if stat.st_size > max_size: raise ValueError(f"파일 크기 초과: {stat.st_size} > {max_size}")
+        encoding = None
+        if known is not None and (known.size, known.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            encoding = known.encoding
+        data = file.read(_HEAD_READ_BYTES)
+        while True:
+            at_eof = len(data) >= stat.st_size
+            # 끝까지 읽지 않았으면 마지막 완전한 줄까지만 해석 (멀티바이트 문자가 잘리지 않도록)
+            complete = data if at_eof else data[:data.rfind(b'\n') + 1]
+            # 버퍼는 앞부분을 포함하며 늘어나므로 앞서 판별한 인코딩부터 이어서 시도
+            text, encoding = _decode_text(complete, encoding)
+            lines = text.split('\n')
+            if not at_eof: lines.pop()
+            metadata, content_start, header_done = _split_header(lines)
+            body = '\n'.join(lines[content_start:]).strip()
+            preview = _cut_preview_source(body, at_eof) if header_done or at_eof else None
+            if preview is not None:
+                break
+            more = file.read(max(_HEAD_READ_BYTES, len(data)))
+            if not more:
+                preview = _cut_preview_source(body, True)
+                break
+            data += more
+        # 본문 시작 오프셋: 헤더가 차지한 줄바꿈 수만큼 원본 바이트에서 건너뜀
+        body_offset = 0
+        if content_start:
+            for count, match in enumerate(_LINE_BREAK_PATTERN.finditer(data), 1):
+                if count == content_start:
+                    body_offset = match.end()
+                    break
+        image_source = None
+        if scan_images and preview[1] and _FIRST_IMAGE_PATTERN.search(preview[0]) is None:
+            data += file.read(max(stat.st_size - len(data), 0))
+            # 이미지 태그가 없는 본문이 대부분이라 정규식 전에 bytes.find로 거름
+            start = data.find(b'[img:', body_offset)
+            match = _FIRST_IMAGE_BYTES_PATTERN.search(data, start) if start != -1 else None
+            image_source = match.group(0).decode(encoding, errors='replace') if match else ''
+    source = PostSource(path=str(file_path), encoding=encoding, body_offset=body_offset,
+                        size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    return PostHead(metadata=metadata, source=source, preview_source=preview[0], truncated=preview[1],
+                    image_source=image_source)
+
+def _read_post_body(source: PostSource) -> str:
+    with open(source.path, 'rb') as file:
+        stat = os.fstat(file.fileno())
+        if (stat.st_size, stat.st_mtime_ns) != (source.size, source.mtime_ns):
+            data = None
+        else:
+            file.seek(source.body_offset)
+            data = file.read()
+    if data is None:
+        # 헤더를 읽은 뒤 파일이 바뀌어 본문 오프셋을 믿을 수 없음 - 파일 전체를 다시 파싱하고 스냅샷 갱신 요청
+        content_changed.send('posts', directory=os.path.dirname(source.path),
+                             names=frozenset({os.path.basename(source.path)}))
+        return _extract_metadata_and_body(_read_file_safe(Path(source.path)))[1]
+    try:
+        return _normalize_newlines(data.decode(source.encoding)).strip()
+    except UnicodeDecodeError:
+        # 앞부분으로 고른 인코딩이 뒷부분과 맞지 않으면 파일 전체로 다시 판별
+        return _extract_metadata_and_body(_read_file_safe(Path(source.path)))[1]
+
+def _read_preview_source(source: PostSource) -> Tuple[str, bool]:
+    """본문 앞부분만 읽음 (인덱스에서 복원된 포스트용)"""
+    decoder = codecs.getincrementaldecoder(source.encoding)(errors='replace')
+    text = ""
+    try:
+        with open(source.path, 'rb') as file:
+            file.seek(source.body_offset)
+            while True:
+                data = file.read(_HEAD_READ_BYTES)
+                at_eof = not data
+                text += decoder.decode(data, final=at_eof)
+                body = _normalize_newlines(text)
+                preview = _cut_preview_source(body.strip() if at_eof else body.lstrip(), at_eof)
+                if preview is not None:
+                    return preview
+    except OSError:
+        return "", False
+
+def get_body_cache() -> ByteLRUCache:
+    """지연 로딩된 포스트 본문 캐시 (POST_BODY_CACHE_MAX_BYTES 예산의 LRU)"""
+    global _body_cache
+    if _body_cache is None:
+        _body_cache = ByteLRUCache(current_app.config.get('POST_BODY_CACHE_MAX_BYTES', POST_BODY_CACHE_MAX_BYTES))
+    return _body_cache
+
+def _load_post_body(source: PostSource) -> str:
+    cache = get_body_cache()
+    key = (source.path, source.body_offset, source.size, source.mtime_ns)
+    body = cache.get(key)
+    if body is None:
+        try:
+            body = _read_post_body(source)
+        except OSError as e:
+            current_app.logger.error(f"포스트 본문 읽기 실패 {source.path}: {e}")
+            return ""
+        cache.set(key, body)
+    return body
+
+def _read_post_head_safe(file_path: Path, max_size: int) -> Union[PostHead, Exception]:
+    try:
+        return _read_post_head(file_path, max_size, scan_images=True)
+    except UnicodeDecodeError as e:
+        return ValueError(f"파일 인코딩 오류: {e}")
+    except Exception as e:
+        return e
+
+def parse_text_files(posts_dir: Union[str, Path], filenames: List[str], workers: int = 1,
+                     use_processes: bool = False) -> Dict[str, Union[PostHead, Exception]]:
+    """여러 파일의 헤더를 스레드(또는 프로세스) 풀에서 읽음 - 경로 검증은 디렉토리 단위로 한 번만 수행"""
+    posts_dir = Path(posts_dir)
+    if not _validate_file_path(posts_dir): raise ValueError(f"잘못된 파일 경로: {posts_dir}")
+    max_size = current_app.config.get('MAX_FILE_READ_SIZE', MAX_FILE_SIZE)
+    results: Dict[str, Union[PostHead, Exception]] = {}
+    # 심볼릭 링크만 실제 경로를 다시 확인 (디렉토리 밖을 가리키는 링크 차단)
+    for filename in filenames:
+        file_path = posts_dir / filename
+        if file_path.is_symlink() and not _validate_file_path(file_path):
+            results[filename] = ValueError(f"잘못된 파일 경로: {file_path}")
+    filenames = [filename for filename in filenames if filename not in results]
+    paths = [posts_dir / filename for filename in filenames]
+    sizes = [max_size] * len(paths)
+    workers = max(1, workers)
+    if workers == 1:
+        outputs = [_read_post_head_safe(path, max_size) for path in paths]
+    elif use_processes:
+        # 디코딩/메타데이터 추출은 GIL을 잡으므로 CPU 병렬화가 필요하면 프로세스 풀 사용
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(_read_post_head_safe, paths, sizes,
+                                    chunksize=max(1, len(paths) // (workers * 4))))
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='post-loader') as pool:
+            outputs = list(pool.map(_read_post_head_safe, paths, sizes))
+    results.update(zip(filenames, outputs))
+    return results
+
 def _validate_file_path(file_path: Path) -> bool:
     try:
         abs_path = file_path.resolve()
@@ -310,70 +833,94 @@ def _validate_file_path(file_path: Path) -> bool:
     except (OSError, ValueError): return False
 
 def _read_file_safe(file_path: Path) -> str:
-    encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr', 'latin-1']
-    for encoding in encodings:
-        try:
-            with open(file_path, 'r', encoding=encoding) as file:
-                return file.read()
-        except UnicodeDecodeError: continue
-    with open(file_path, 'rb') as file:
-        content = file.read()
-        return content.decode('utf-8', errors='replace')
+    # 한 번만 읽고 인코딩 판별은 메모리에서
+    return _decode_text(file_path.read_bytes())[0]
 
 def _extract_metadata_and_body(content: str) -> Tuple[Dict[str, str], str]:
     lines = content.split('\n')
-    metadata = {}
-    content_start = 0
-    meta_pattern = re.compile(r'^\[([a-zA-Z\-_]+):\s*(.+?)\]$')
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if not line: continue
-        match = meta_pattern.match(line)
-        if match:
-            key, value = match.groups()
-            if len(key) <= 50 and re.match(r'^[a-zA-Z\-_]+$', key):
-                metadata[key.lower()] = value.strip()
-            content_start = i + 1
-        else: break
+    metadata, content_start, _ = _split_header(lines)
     body = '\n'.join(lines[content_start:]).strip()
     return metadata, body
 
-def get_all_text_posts(posts_dir: Optional[str] = None, tag: Optional[str] = None) -> List[TextPost]:
-    if posts_dir is None: posts_dir = current_app.config.get('POSTS_DIR')
-    posts_dir = Path(posts_dir)
-    posts = []
-    if not posts_dir.exists() or not posts_dir.is_dir():
-        current_app.logger.warning(f"포스트 디렉토리 없음: {posts_dir}")
-        return posts
+def get_all_text_posts(posts_dir: Optional[str] = None, tag: Optional[str] = None) -> List[PostSummary]:
+    from app.services.post_corpus import get_corpus
     try:
-        allowed_extensions = current_app.config.get('ALLOWED_TEXT_EXTENSIONS', {'txt', 'md'})
-        max_posts = current_app.config.get('MAX_POSTS_TOTAL', 2000)
-        files = []
-        for ext in allowed_extensions:
-            files.extend(posts_dir.glob(f"*.{ext}"))
-        files = sorted(files, key=lambda f: f.name)[:max_posts]
-        for file_path in files:
-            try:
-                post = get_text_post(str(posts_dir), file_path.name)
-                if post:
-                    # 날짜 정보가 없는 경우 파일 수정 시간을 기본값으로 사용 (now() 대신)
-                    if post.date == post.created_at and post.date > datetime.now(): # 기본값 검증
-                         try:
-                             mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                             post.date = mtime
-                         except: pass
-                    posts.append(post)
-            except Exception as e:
-                current_app.logger.error(f"포스트 로드 실패 {file_path.name}: {e}")
-                continue
-        
-        # 날짜 내림차순, 동일 날짜시 제목/파일명 내림차순으로 2차 정렬하여 순서 보장
-        posts.sort(key=lambda x: (x.date, x.id), reverse=True)
-        if tag and posts:
-            posts = [p for p in posts if tag in p.tags]
+        corpus = get_corpus(posts_dir)
+        return list(corpus.get_tagged(tag) if tag else corpus.posts)
     except Exception as e:
         current_app.logger.error(f"포스트 목록 로드 오류: {e}")
-    return posts
+        return []
+
+def get_posts_page(posts_dir: Optional[str] = None, tag: Optional[str] = None, after: Optional[str] = None,
+                   before: Optional[str] = None, per_page: int = DEFAULT_PER_PAGE) -> Page:
+    """최신순 목록의 한 페이지 - 커서 형식이 틀리면 ValueError"""
+    from app.services.post_corpus import get_corpus
+    try:
+        corpus = get_corpus(posts_dir)
+    except Exception as e:
+        current_app.logger.error(f"포스트 목록 로드 오류: {e}")
+        return Page(items=[], offset=0, total=0, per_page=per_page)
+    return corpus.get_page(tag, after, before, per_page)
+
+def get_series_page(posts_dir: Optional[str], series_name: str, after: Optional[str] = None,
+                    before: Optional[str] = None, per_page: int = DEFAULT_PER_PAGE) -> Page:
+    from app.services.post_corpus import get_corpus
+    try:
+        corpus = get_corpus(posts_dir)
+    except Exception as e:
+        current_app.logger.error(f"시리즈 포스트 로드 오류 {series_name}: {e}")
+        return Page(items=[], offset=0, total=0, per_page=per_page)
+    return corpus.get_series_page(series_name, after, before, per_page)
+
+def get_listing_page(posts_dir: Optional[str] = None, tag: Optional[str] = None, series: Optional[str] = None,
+                     after: Optional[str] = None, before: Optional[str] = None,
+                     per_page: int = DEFAULT_PER_PAGE) -> Tuple[str, Page]:
+    """(스냅샷 식별자, 한 페이지) - 같은 스냅샷에서 함께 읽어 캐시 키와 내용이 어긋나지 않게 함
+
+    스냅샷을 만들지 못하면 ('', 빈 페이지) - 식별자가 비어 있으면 캐시하지 말아야 함
+    """
+    from app.services.post_corpus import get_corpus
+    try:
+        corpus = get_corpus(posts_dir)
+    except Exception as e:
+        current_app.logger.error(f"포스트 목록 로드 오류: {e}")
+        return '', Page(items=[], offset=0, total=0, per_page=per_page)
+    if series:
+        page = corpus.get_series_page(series, after, before, per_page)
+    else:
+        page = corpus.get_page(tag, after, before, per_page)
+    return corpus.get_fingerprint(), page
+
+def get_content_version(posts_dir: Optional[str] = None) -> str:
+    """현재 스냅샷 식별자 - 포스트 파일 구성이 바뀌면 달라짐 (캐시 키용)"""
+    from app.services.post_corpus import get_corpus
+    return get_corpus(posts_dir).get_fingerprint()
+
+def get_content_validators(posts_dir: Optional[str] = None, slug: Optional[str] = None, tag: Optional[str] = None,
+                           series: Optional[str] = None) -> Optional[Tuple[str, int]]:
+    """조건부 요청용 (스냅샷 식별자, 관련 포스트의 최종 수정 시각 ns) - 포스트 파일은 읽지 않음
+
+    슬러그/태그/시리즈를 주면 그 화면에 나오는 포스트만 기준으로 삼고, 없는 슬러그면 None.
+    포스트 추가/삭제는 파일 수정 시각에 드러나지 않으므로 디렉토리 수정 시각도 함께 봄.
+    """
+    from app.services.post_corpus import get_corpus
+    corpus = get_corpus(posts_dir)
+    related: Optional[Sequence[PostSummary]] = None
+    if slug is not None:
+        post = corpus.by_slug.get(slug)
+        if post is None: return None
+        related = [post, *(p for p in corpus.get_adjacent(post) if p is not None),
+                   *(corpus.get_series(post.series) if post.series else ())]
+    elif tag is not None:
+        # 태그/시리즈 목록은 스냅샷마다 미리 만들어 두므로 없는 이름을 조회해도 항목이 늘지 않음 (빈 튜플)
+        related = corpus.get_tagged(tag)
+    elif series is not None:
+        related = corpus.get_series(series)
+    try:
+        directory_mtime = os.stat(corpus.posts_dir).st_mtime_ns
+    except OSError:
+        directory_mtime = 0
+    return corpus.get_fingerprint(), max(corpus.get_last_modified(related), directory_mtime)
 
 def get_text_post(posts_dir: Union[str, Path], filename: str) -> Optional[TextPost]:
     try:
@@ -382,81 +929,237 @@ def get_text_post(posts_dir: Union[str, Path], filename: str) -> Optional[TextPo
             return None
         file_path = Path(posts_dir) / filename
         metadata, content = parse_text_file(file_path)
-        post = TextPost(filename=filename, content=content)
-        if metadata: post.update_from_metadata(metadata)
-        return post
+        return build_text_post(filename, metadata, content)
     except Exception as e:
         current_app.logger.error(f"포스트 로드 오류 {filename}: {e}")
         return None
 
+def build_text_post(filename: str, metadata: Dict[str, str], content: str) -> TextPost:
+    post = TextPost(filename=filename, body=content)
+    if metadata: post.update_from_metadata(metadata)
+    return post
+
+def build_lazy_text_post(filename: str, head: PostHead) -> TextPost:
+    """헤더만 읽은 결과로 포스트 생성 - 본문은 content 접근 시 로드"""
+    post = TextPost(filename=filename, source=head.source)
+    post.set_preview_source(head.preview_source, head.truncated, head.image_source)
+    if head.metadata: post.update_from_metadata(head.metadata)
+    return post
+
+def get_word_count_cache() -> ByteLRUCache:
+    """로딩 때 세지 않은 요약의 단어 수 캐시 (WORD_COUNT_CACHE_SIZE 개수 제한 LRU, 키는 PostSummary.cache_key)"""
+    global _word_count_cache
+    if _word_count_cache is None:
+        _word_count_cache = ByteLRUCache(current_app.config.get('WORD_COUNT_CACHE_SIZE', WORD_COUNT_CACHE_SIZE),
+                                         sizeof=lambda count: 1)
+    return _word_count_cache
+
+def get_full_post_cache() -> ByteLRUCache:
+    """단일 포스트 화면용 TextPost 캐시 (FULL_POST_CACHE_SIZE 개수 제한 LRU, 본문은 본문 캐시에 따로 보관)"""
+    global _full_post_cache
+    if _full_post_cache is None:
+        _full_post_cache = ByteLRUCache(current_app.config.get('FULL_POST_CACHE_SIZE', FULL_POST_CACHE_SIZE),
+                                        sizeof=lambda post: 1)
+    return _full_post_cache
+
+def load_full_post(summary: PostSummary) -> Optional[TextPost]:
+    """요약의 파일 위치로 전체 TextPost를 만듦 - 헤더만 다시 읽고 본문은 지연 로딩"""
+    if summary.source is None: return None
+    cache = get_full_post_cache()
+    post = cache.get(summary.source)
+    if post is not None: return post
+    file_path = Path(summary.source.path)
+    if not _validate_file_path(file_path):
+        current_app.logger.warning(f"잘못된 파일 경로: {file_path}")
+        return None
+    try:
+        head = _read_post_head(file_path, current_app.config.get('MAX_FILE_READ_SIZE', MAX_FILE_SIZE), summary.source)
+        post = build_lazy_text_post(summary.filename, head)
+    except Exception as e:
+        current_app.logger.error(f"포스트 로드 오류 {summary.filename}: {e}")
+        return None
+    # 날짜가 없는 포스트는 스냅샷에서 정한 값(파일 수정 시간)을 그대로 사용
+    if head.source == summary.source:
+        post.date = summary.date
+        post._word_count = summary.word_count
+    cache.set(summary.source, post)
+    return post
+
 def get_tags_count(posts_dir: Optional[str] = None) -> Dict[str, int]:
     try:
-        posts = get_all_text_posts(posts_dir)
-        tags_count = {}
-        for post in posts:
-            for tag_item in post.tags:
-                tags_count[tag_item] = tags_count.get(tag_item, 0) + 1
-        return tags_count
+        from app.services.post_corpus import get_corpus
+        return dict(get_corpus(posts_dir).get_tags_count())
     except Exception as e:
         current_app.logger.error(f"태그 카운트 오류: {e}")
         return {}
 
-def get_series_posts(posts_dir: Union[str, Path], series_name: str) -> List[TextPost]:
+def get_tags_snapshot(posts_dir: Optional[str] = None) -> Tuple[str, Dict[str, int]]:
+    """(태그 버전, 태그별 포스트 수) - 같은 스냅샷에서 함께 읽어 조각 캐시 키와 내용이 어긋나지 않게 함"""
+    try:
+        from app.services.post_corpus import get_corpus
+        corpus = get_corpus(posts_dir)
+        return corpus.get_tags_version(), dict(corpus.get_tags_count())
+    except Exception as e:
+        current_app.logger.error(f"태그 카운트 오류: {e}")
+        return '', {}
+
+def get_tag_completions(posts_dir: Optional[str], query: str) -> List[Dict[str, Any]]:
+    try:
+        from app.services.post_corpus import get_corpus
+        return get_corpus(posts_dir).get_tag_index().complete(query)
+    except Exception as e:
+        current_app.logger.error(f"태그 자동완성 오류: {e}")
+        return []
+
+def get_related_tags(posts_dir: Optional[str], tag: str, limit: int = 10) -> Optional[List[Tuple[str, int]]]:
+    """함께 쓰인 횟수 순 관련 태그 (태그가 쓰인 포스트가 없으면 None)"""
+    try:
+        from app.services.post_corpus import get_corpus
+        return get_corpus(posts_dir).get_tag_graph().related(tag, limit)
+    except Exception as e:
+        current_app.logger.error(f"관련 태그 오류 {tag}: {e}")
+        return []
+
+def get_tag_graph(posts_dir: Optional[str] = None) -> Dict[str, Any]:
+    try:
+        from app.services.post_corpus import get_corpus
+        return get_corpus(posts_dir).get_tag_graph().to_dict()
+    except Exception as e:
+        current_app.logger.error(f"태그 그래프 오류: {e}")
+        return {'nodes': [], 'edges': []}
+
+def get_post_by_slug(posts_dir: Optional[str], slug: str) -> Optional[TextPost]:
+    if not slug or not isinstance(slug, str): return None
+    try:
+        from app.services.post_corpus import get_corpus
+        summary = get_corpus(posts_dir).by_slug.get(slug)
+        return load_full_post(summary) if summary is not None else None
+    except Exception as e:
+        current_app.logger.error(f"슬러그 조회 오류 {slug}: {e}")
+        return None
+
+def get_series_posts(posts_dir: Union[str, Path], series_name: str) -> List[PostSummary]:
     if not series_name or not isinstance(series_name, str): return []
     try:
-        all_posts = get_all_text_posts(str(posts_dir))
-        series_posts = [post for post in all_posts if post.series == series_name]
-        series_posts.sort(key=lambda x: (x.series_part or 9999, x.date))
-        return series_posts
+        from app.services.post_corpus import get_corpus
+        return list(get_corpus(str(posts_dir)).get_series(series_name))
     except Exception as e:
         current_app.logger.error(f"시리즈 포스트 로드 오류 {series_name}: {e}")
         return []
 
-def get_adjacent_posts(posts_dir: Union[str, Path], current_post: TextPost) -> Tuple[Optional[TextPost], Optional[TextPost]]:
+def get_adjacent_posts(posts_dir: Union[str, Path], current_post: TextPost) -> Tuple[Optional[PostSummary], Optional[PostSummary]]:
     if not isinstance(current_post, TextPost): return None, None
     try:
-        all_posts = get_all_text_posts(str(posts_dir))
-        current_index = None
-        for i, post in enumerate(all_posts):
-            if post.id == current_post.id:
-                current_index = i
-                break
-        if current_index is None: return None, None
-        prev_post = all_posts[current_index - 1] if current_index > 0 else None
-        next_post = all_posts[current_index + 1] if current_index < len(all_posts) - 1 else None
-        return prev_post, next_post
+        from app.services.post_corpus import get_corpus
+        return get_corpus(str(posts_dir)).get_adjacent(current_post)
     except Exception as e:
         current_app.logger.error(f"인접 포스트 조회 오류: {e}")
         return None, None
 
-def render_content(content: str, base_url_images: str = '/posts/images', base_url_videos: str = '/posts/videos', base_url_audios: str = '/posts/audios') -> Markup:
-    if not isinstance(content, str) or not content.strip(): return Markup("")
+def _render_content(content: str, base_url_images: str, base_url_videos: str, base_url_audios: str) -> Tuple[Markup, bool]:
+    """(렌더링 결과, 성공 여부) - 실패하면 오류 안내가 붙은 대체 출력"""
+    if not isinstance(content, str) or not content.strip(): return Markup(""), True
     for url in [base_url_images, base_url_videos, base_url_audios]:
         if not isinstance(url, str) or not url.startswith('/'):
             current_app.logger.error(f"잘못된 URL 설정: {url}")
-            return Markup("잘못된 URL 설정")
+            return Markup("잘못된 URL 설정"), False
     try:
         processed_content = _process_special_tags(content, base_url_images, base_url_videos, base_url_audios)
         html_content = _process_markdown(processed_content) if MARKDOWN_ENABLED else _process_content_fallback(processed_content)
-        clean_content = _sanitize_html_preserve_links(html_content)
-        final_content = _auto_linkify_urls_safe(clean_content)
-        return Markup(final_content)
+        final_content = _sanitize_and_linkify_html(html_content)
+        return Markup(final_content), True
     except Exception as e:
         current_app.logger.error(f"콘텐츠 렌더링 오류: {e}")
-        return Markup(f'<div class="content-error">일부 기능이 제한되었습니다.</div><div class="post-content">{escape(content)}</div>')
+        return Markup(f'<div class="content-error">일부 기능이 제한되었습니다.</div><div class="post-content">{escape(content)}</div>'), False
+
+def render_content(content: str, base_url_images: str = '/posts/images', base_url_videos: str = '/posts/videos', base_url_audios: str = '/posts/audios') -> Markup:
+    return _render_content(content, base_url_images, base_url_videos, base_url_audios)[0]
+
+def get_render_cache() -> ByteLRUCache:
+    """렌더링된 본문 HTML 캐시 (RENDER_CACHE_MAX_BYTES 예산의 LRU)"""
+    global _render_cache
+    if _render_cache is None:
+        _render_cache = ByteLRUCache(current_app.config.get('RENDER_CACHE_MAX_BYTES', RENDER_CACHE_MAX_BYTES))
+    return _render_cache
+
+def _render_config_fingerprint() -> str:
+    config = current_app.config
+    settings = (
+        config.get('MARKDOWN_EXTENSIONS'), config.get('ALLOWED_HTML_TAGS'),
+        sorted((config.get('ALLOWED_HTML_ATTRIBUTES') or {}).items()), config.get('ALLOWED_CSS_PROPERTIES'),
+        current_app.static_folder, MARKDOWN_ENABLED, BLEACH_AVAILABLE, HEIF_ENABLED,
+    )
+    return hashlib.md5(repr(settings).encode('utf-8')).hexdigest()
+
+def render_post_content(post: TextPost, base_url_images: str = '/posts/images', base_url_videos: str = '/posts/videos', base_url_audios: str = '/posts/audios') -> Markup:
+    """render_content 결과를 포스트 해시, 미디어 URL, 출력 관련 설정 기준으로 캐시 (실패한 대체 출력은 캐시하지 않음)"""
+    cache = get_render_cache()
+    key = (CACHE_VERSION, post.get_file_hash(), base_url_images, base_url_videos, base_url_audios, _render_config_fingerprint())
+    rendered = cache.get(key)
+    if rendered is None:
+        rendered, ok = _render_content(post.content, base_url_images, base_url_videos, base_url_audios)
+        if ok:
+            cache.set(key, rendered)
+    return rendered
+
+@content_changed.connect_via('post_images')
+def _on_post_images_changed(sender, **kwargs) -> None:
+    # 이미지 존재 여부(HEIC 변환 등)가 출력에 반영되므로 통째로 비움
+    if _render_cache is not None:
+        _render_cache.clear()
+
+# 커스텀 태그 규칙 - 여는 '[' 뒤의 부분. 순서가 곧 기존 치환 순서
+_SPECIAL_TAG_RULES = [
+    r'youtube:(?P<youtube>[^\]\r\n]+?)\]',
+    r'img:(?P<img>[^\|\]\r\n]+?)(?:\|(?P<img_alt>[^\|\]\r\n]*?))?(?:\|(?P<img_options>[^\]\r\n]*?))?\]',
+    r'video:(?P<video>[^\|\]\r\n]+?)(?:\|(?P<video_title>[^\]\r\n]*?))?\]',
+    r'audio:(?P<audio>[^\|\]\r\n]+?)(?:\|(?P<audio_title>[^\]\r\n]*?))?\]',
+    r'highlight\](?P<highlight>.*?)\[/highlight\]',
+    r'quote(?:\s+author="(?P<quote_author>[^"]*)")?\](?P<quote>.*?)\[/quote\]',
+    r'code(?:\s+lang="(?P<code_lang>[^"]*)")?\](?P<code>.*?)\[/code\]',
+]
+_SPECIAL_TAG_PATTERN = re.compile(r'\[(?:' + '|'.join(_SPECIAL_TAG_RULES) + ')', re.DOTALL | re.MULTILINE)
+_SPECIAL_TAG_SEQUENTIAL = [re.compile(r'\[' + rule, re.DOTALL | re.MULTILINE) for rule in _SPECIAL_TAG_RULES]
+# 다른 태그의 시작 - 한 태그 안에 다른 태그가 들어 있으면 단일 패스 결과가 순차 치환과 달라질 수 있음
+_SPECIAL_TAG_OPENER = re.compile(r'\[(?:youtube:|img:|video:|audio:|highlight|quote|code)')
+
+def _render_special_tag(match: re.Match, base_url_images: str, base_url_videos: str, base_url_audios: str) -> str:
+    groups = match.groupdict()
+    if groups.get('youtube') is not None:
+        return _create_youtube_embed(groups['youtube'])
+    if groups.get('img') is not None:
+        return _create_image_tag_secure(groups['img'], groups['img_alt'], groups['img_options'], base_url_images)
+    if groups.get('video') is not None:
+        return _create_video_tag_secure(groups['video'], groups['video_title'], base_url_videos)
+    if groups.get('audio') is not None:
+        return _create_audio_tag_secure(groups['audio'], groups['audio_title'], base_url_audios)
+    if groups.get('highlight') is not None:
+        return f'<div class="highlight-box">{escape(groups["highlight"])}</div>'
+    if groups.get('quote') is not None:
+        return _create_quote_block(groups['quote'], groups['quote_author'])
+    return _create_code_block(groups['code'], groups['code_lang'])
 
 def _process_special_tags(content: str, base_url_images: str, base_url_videos: str, base_url_audios: str) -> str:
-    replacements = [
-        (r'\[youtube:([^\]\r\n]+?)\]', lambda m: _create_youtube_embed(m.group(1))),
-        (r'\[img:([^\|\]\r\n]+?)(?:\|([^\|\]\r\n]*?))?(?:\|([^\]\r\n]*?))?\]', lambda m: _create_image_tag_secure(m.group(1), m.group(2), m.group(3), base_url_images)),
-        (r'\[video:([^\|\]\r\n]+?)(?:\|([^\]\r\n]*?))?\]', lambda m: _create_video_tag_secure(m.group(1), m.group(2), base_url_videos)),
-        (r'\[audio:([^\|\]\r\n]+?)(?:\|([^\]\r\n]*?))?\]', lambda m: _create_audio_tag_secure(m.group(1), m.group(2), base_url_audios)),
-        (r'\[highlight\](.*?)\[/highlight\]', lambda m: f'<div class="highlight-box">{escape(m.group(1))}</div>'),
-        (r'\[quote(?:\s+author="([^"]*)")?\](.*?)\[/quote\]', lambda m: _create_quote_block(m.group(2), m.group(1))),
-        (r'\[code(?:\s+lang="([^"]*)")?\](.*?)\[/code\]', lambda m: _create_code_block(m.group(2), m.group(1))),
-    ]
-    for pattern, handler in replacements:
-        content = re.sub(pattern, handler, content, flags=re.DOTALL | re.MULTILINE)
+    """커스텀 태그를 한 번의 스캔으로 HTML로 치환"""
+    if '[' not in content: return content
+    parts = []
+    position = 0
+    for match in _SPECIAL_TAG_PATTERN.finditer(content):
+        start, end = match.span()
+        if _SPECIAL_TAG_OPENER.search(content, start + 1, end):
+            # 중첩된 태그는 기존 순차 치환 결과를 그대로 따름
+            return _process_special_tags_sequential(content, base_url_images, base_url_videos, base_url_audios)
+        parts.append(content[position:start])
+        parts.append(_render_special_tag(match, base_url_images, base_url_videos, base_url_audios))
+        position = end
+    if not parts: return content
+    parts.append(content[position:])
+    return ''.join(parts)
+
+def _process_special_tags_sequential(content: str, base_url_images: str, base_url_videos: str, base_url_audios: str) -> str:
+    handler = lambda m: _render_special_tag(m, base_url_images, base_url_videos, base_url_audios)
+    for pattern in _SPECIAL_TAG_SEQUENTIAL:
+        content = pattern.sub(handler, content)
     return content
 
 def _create_youtube_embed(youtube_input: str) -> str:
@@ -662,36 +1365,57 @@ def _is_safe_url(url: str) -> bool:
         return bool(urlparse(url).netloc)
     except Exception: return False
 
+def _get_markdown_converter() -> 'markdown.Markdown':
+    """스레드별로 재사용하는 Markdown 변환기 - MARKDOWN_EXTENSIONS가 바뀔 때만 다시 생성"""
+    extensions = tuple(current_app.config.get('MARKDOWN_EXTENSIONS', _DEFAULT_MARKDOWN_EXTENSIONS))
+    converter = getattr(_markdown_local, 'converter', None)
+    if converter is None or _markdown_local.extensions != extensions:
+        converter = markdown.Markdown(extensions=list(extensions), extension_configs=MARKDOWN_EXTENSION_CONFIGS)
+        _markdown_local.converter = converter
+        _markdown_local.extensions = extensions
+    return converter
+
 def _process_markdown(content: str) -> str:
     try:
-        extensions = current_app.config.get('MARKDOWN_EXTENSIONS', ['extra', 'nl2br', 'sane_lists', 'codehilite', 'toc'])
-        md = markdown.Markdown(
-            extensions=extensions,
-            extension_configs={
-                'codehilite': {'css_class': 'highlight', 'linenums': False, 'guess_lang': False, 'use_pygments': True},
-                'toc': {'permalink': True, 'permalink_class': 'toc-link', 'permalink_title': '이 섹션에 대한 링크'}
-            }
-        )
-        return md.convert(content)
+        md = _get_markdown_converter()
+        try:
+            return md.convert(content)
+        finally:
+            # 각주/목차 등 문서별 상태를 다음 문서 전에 초기화
+            md.reset()
     except Exception as e:
+        _markdown_local.converter = None
         current_app.logger.error(f"마크다운 처리 오류: {e}")
         return _process_content_fallback(content)
 
-def _sanitize_html_preserve_links(html_content: str) -> str:
-    if not BLEACH_AVAILABLE: return html_content
-    try:
-        allowed_tags = current_app.config.get('ALLOWED_HTML_TAGS')
-        allowed_attrs = current_app.config.get('ALLOWED_HTML_ATTRIBUTES')
-        allowed_css = current_app.config.get('ALLOWED_CSS_PROPERTIES', [
-            'width', 'max-width', 'height', 'margin', 'margin-left', 'margin-right', 'margin-top', 'margin-bottom'
-        ])
-        css_sanitizer = CSSSanitizer(allowed_css_properties=allowed_css)
-        return bleach.clean(
-            html_content, tags=allowed_tags, attributes=allowed_attrs,
+def _get_html_cleaner() -> 'bleach.Cleaner':
+    """허용 태그/속성/CSS 설정별로 한 번 만든 정제기 (Cleaner는 스레드 안전하지 않아 스레드별 보관)"""
+    config = current_app.config
+    allowed_tags = config.get('ALLOWED_HTML_TAGS')
+    allowed_attrs = config.get('ALLOWED_HTML_ATTRIBUTES')
+    allowed_css = config.get('ALLOWED_CSS_PROPERTIES', [
+        'width', 'max-width', 'height', 'margin', 'margin-left', 'margin-right', 'margin-top', 'margin-bottom'
+    ])
+    key = (tuple(allowed_tags or ()), repr(sorted((allowed_attrs or {}).items())), tuple(allowed_css))
+    cleaner = getattr(_cleaner_local, 'cleaner', None)
+    if cleaner is None or _cleaner_local.key != key:
+        cleaner = bleach.Cleaner(
+            tags=allowed_tags, attributes=allowed_attrs,
             protocols=bleach.sanitizer.ALLOWED_PROTOCOLS, strip=True, strip_comments=True,
-            css_sanitizer=css_sanitizer
+            css_sanitizer=CSSSanitizer(allowed_css_properties=allowed_css),
+            filters=[PostLinkifyFilter]
         )
+        _cleaner_local.cleaner = cleaner
+        _cleaner_local.key = key
+    return cleaner
+
+def _sanitize_and_linkify_html(html_content: str) -> str:
+    """HTML 정제와 URL 자동 링크를 한 번의 파싱으로 처리"""
+    if not BLEACH_AVAILABLE: return _auto_linkify_urls_safe(html_content)
+    try:
+        return _get_html_cleaner().clean(html_content)
     except Exception as e:
+        _cleaner_local.cleaner = None
         current_app.logger.error(f"HTML 정제 오류: {e}")
         return escape(html_content)
 
@@ -24,4 +24,94 @@ document.addEventListener('DOMContentLoaded', function () {
     }
 
     // 서버 사이드 태그 필터링으로 변경되었으므로 클라이언트 필터링 로직 제거
+
+    // 무한 스크롤: 더보기로 펼친 뒤 목록 끝에 닿으면 다음 페이지를 JSON으로 받아 카드 추가
+    const container = document.querySelector('.posts-container[data-next-url]');
+    if (!container || !additionalPosts || !('IntersectionObserver' in window)) return;
+
+    let nextUrl = container.dataset.nextUrl;
+    let loading = false;
+    const pagination = container.querySelector('.pagination-nav');
+    const sentinel = document.createElement('div');
+    sentinel.className = 'posts-scroll-sentinel';
+    additionalPosts.after(sentinel);
+
+    function formatDate(isoDate) {
+        const [year, month, day] = isoDate.slice(0, 10).split('-');
+        return `${year}년 ${month}월 ${day}일`;
+    }
+
+    function element(tag, className, text) {
+        const node = document.createElement(tag);
+        if (className) node.className = className;
+        if (text !== undefined) node.textContent = text;
+        return node;
+    }
+
+    function buildCard(post) {
+        const link = element('a', 'post-card-link');
+        link.href = post.url;
+        link.dataset.tags = post.tags.join(',');
+        const article = element('article', 'post-card fade-in');
+
+        const header = element('div', 'post-card-header');
+        header.appendChild(element('h2', 'post-card-title', post.title));
+        const meta = element('div', 'post-card-meta');
+        meta.appendChild(element('div', 'post-card-date', formatDate(post.date)));
+        header.appendChild(meta);
+
+        const content = element('div', 'post-card-content');
+        if (post.image) {
+            const wrapper = element('div', 'post-card-image-wrapper');
+            const image = element('img', 'post-card-preview-image');
+            image.src = post.image;
+            image.alt = post.image_alt || '';
+            image.loading = 'lazy';
+            wrapper.appendChild(image);
+            content.appendChild(wrapper);
+        }
+        content.appendChild(element('div', 'post-card-preview', post.preview));
+
+        const footer = element('div', 'post-card-footer');
+        const tags = element('div', 'post-card-tags');
+        post.tags.slice(0, 2).forEach(tag => tags.appendChild(element('span', 'post-card-tag', tag)));
+        if (post.tags.length > 2) tags.appendChild(element('span', 'post-card-tag', `+${post.tags.length - 2}`));
+        footer.appendChild(tags);
+
+        article.append(header, content, footer);
+        link.appendChild(article);
+        return link;
+    }
+
+    const observer = new IntersectionObserver(entries => {
+        if (!entries.some(entry => entry.isIntersecting)) return;
+        if (loading || !nextUrl || additionalPosts.classList.contains('hidden')) return;
+        loading = true;
+        fetch(nextUrl, { headers: { 'Accept': 'application/json' } })
+            .then(response => {
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                return response.json();
+            })
+            .then(data => {
+                data.posts.forEach(post => additionalPosts.appendChild(buildCard(post)));
+                nextUrl = data.next_url;
+                // 스크롤로 이어 받기 시작하면 페이지 링크는 숨김
+                if (pagination) pagination.hidden = true;
+                if (nextUrl) rearm(); else observer.disconnect();
+            })
+            .catch(error => {
+                console.error('포스트 목록 로드 실패:', error);
+                observer.disconnect();
+            })
+            .finally(() => { loading = false; });
+    }, { rootMargin: '400px 0px' });
+
+    // 관찰을 다시 걸면 현재 교차 상태로 콜백이 한 번 더 불려, 화면에 남아 있는 경우에도 이어서 받음
+    function rearm() {
+        observer.unobserve(sentinel);
+        observer.observe(sentinel);
+    }
+
+    observer.observe(sentinel);
+    if (toggleButton) toggleButton.addEventListener('click', rearm);
 });
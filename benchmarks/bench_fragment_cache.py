@@ -0,0 +1,84 @@
+"""
+benchmarks/bench_fragment_cache.py
+----------------------------------
+
+Measure per-request latency of the listing pages (home, posts index, tag
+and series pages) with the Jinja fragment cache disabled and enabled. The
+full-page response cache is turned off so that every request renders its
+template; only the post cards and tag sidebars can be reused.
+
+Run from the repository root::
+
+    python benchmarks/bench_fragment_cache.py
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SECRET_KEY', 'dev-only-secret-key-do-not-use-in-production')
+os.environ.setdefault('FLASK_ENV', 'development')
+
+from app import create_app
+from app.services.cache_service import ByteLRUCache
+from app.services.fragment_cache import FRAGMENT_CACHE_MAX_BYTES
+from app.services.response_cache import reset_response_cache
+
+POST_COUNT = 400
+ROUNDS = 300
+WORDS = ['물리', '양자', '역학', '사진', '여행', '서버', 'python', 'flask', 'cache', 'physics', 'travel', 'index']
+
+def write_posts(directory: str) -> None:
+    rng = random.Random(23)
+    for i in range(POST_COUNT):
+        body = '\n\n'.join(' '.join(rng.choices(WORDS, k=60)) + ' **강조** `code`' for _ in range(8))
+        header = (
+            f"[title: 벤치마크 포스트 {i}]\n[date: 2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}]\n"
+            f"[tags: {', '.join(rng.sample(WORDS, 3))}]\n[series: 시리즈 {i % 4}]\n\n"
+        )
+        with open(os.path.join(directory, f'post-{i:04d}.txt'), 'w', encoding='utf-8') as file:
+            file.write(header + body)
+
+def measure(app, urls: list) -> list:
+    client = app.test_client()
+    samples = []
+    for i in range(ROUNDS):
+        url = urls[i % len(urls)]
+        start = time.perf_counter()
+        response = client.get(url)
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200, (url, response.status_code)
+    return samples
+
+def summary(samples: list) -> str:
+    samples = sorted(samples)
+    return f"median {statistics.median(samples) * 1000:6.2f} ms, p95 {samples[int(len(samples) * 0.95) - 1] * 1000:6.2f} ms"
+
+def main() -> None:
+    app = create_app('development')
+    app.logger.setLevel('ERROR')
+    app.config['CACHE_TYPE'] = 'null'
+    reset_response_cache()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app.config['POSTS_DIR'] = directory
+        write_posts(directory)
+        urls = ['/', '/posts/', '/posts/?per_page=50', '/posts/tag/physics', '/posts/series/시리즈 1']
+        app.jinja_env.fragment_cache = None
+        measure(app, urls)
+
+        results = {'no fragments': measure(app, urls)}
+        app.jinja_env.fragment_cache = cache = ByteLRUCache(FRAGMENT_CACHE_MAX_BYTES)
+        measure(app, urls)
+        results['fragment cache'] = measure(app, urls)
+
+    print(f"posts          : {POST_COUNT}, {len(urls)} urls, {ROUNDS} requests")
+    for name, samples in results.items():
+        print(f"{name:15}: {summary(samples)}")
+    print(f"fragments      : {cache.stats()}")
+
+if __name__ == '__main__':
+    main()
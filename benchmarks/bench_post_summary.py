@@ -0,0 +1,72 @@
+"""
+benchmarks/bench_post_summary.py
+--------------------------------
+
+Compare the resident size of 2000 listing entries kept as full
+``TextPost`` objects versus slotted ``PostSummary`` objects.
+
+Each figure counts what the listing keeps alive after loading: the
+body preview prefix for ``TextPost``, the precomputed card previews
+for ``PostSummary``.
+
+Run from the repository root::
+
+    python benchmarks/bench_post_summary.py
+"""
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SECRET_KEY', 'dev-only-secret-key-do-not-use-in-production')
+os.environ.setdefault('FLASK_ENV', 'development')
+
+from app import create_app
+from app.services.text_service import PostSummary, build_lazy_text_post, get_body_cache, parse_text_files
+
+POST_COUNT = 2000
+TAGS = ['물리', '수학', 'Python', '사진', '여행', '일상', 'AI', '서버', '음악', '독서']
+BODY = "물리학 노트입니다. 뉴턴의 법칙과 **역학**에 대한 설명이 이어집니다.\n[img:diagram.png|운동 다이어그램]\n\n" * 40
+
+def write_posts(directory: str) -> None:
+    for i in range(POST_COUNT):
+        tags = ', '.join(TAGS[(i + k) % len(TAGS)] for k in range(4))
+        header = (
+            f"[title: 테스트 포스트 {i}]\n[date: 2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}]\n"
+            f"[tags: {tags}]\n[author: 구센]\n[description: 벤치마크용 포스트 {i}]\n"
+            f"[series: 시리즈 {i % 20}]\n[series-part: {i % 50 + 1}]\n\n"
+        )
+        with open(os.path.join(directory, f'post-{i:04d}.txt'), 'w', encoding='utf-8') as file:
+            file.write(header + BODY)
+
+def measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    # 단어 수 계산 중 읽은 본문은 제한된 LRU에 있을 뿐 목록 객체가 붙잡는 메모리가 아님
+    get_body_cache().clear()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+def main() -> None:
+    app = create_app('development')
+    with tempfile.TemporaryDirectory() as directory, app.test_request_context():
+        app.config['POSTS_DIR'] = directory
+        write_posts(directory)
+        names = sorted(os.listdir(directory))
+        load = lambda: parse_text_files(directory, names).items()
+        full = measure(lambda: [build_lazy_text_post(name, head) for name, head in load()])
+        summary = measure(lambda: [PostSummary.from_post(build_lazy_text_post(name, head)) for name, head in load()])
+    print(f"posts          : {POST_COUNT}")
+    print(f"TextPost       : {full / 1024:.0f} KB ({full / POST_COUNT:.0f} B/post)")
+    print(f"PostSummary    : {summary / 1024:.0f} KB ({summary / POST_COUNT:.0f} B/post)")
+    print(f"reduction      : {full / summary:.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+benchmarks/bench_response_cache.py
+----------------------------------
+
+Measure per-request latency of post and listing pages with the full-page
+response cache disabled, backed by the in-process store, and backed by a
+Redis-protocol server. The Redis case runs against a minimal local
+stand-in (GET/SET/DEL over RESP on a loopback port), so it needs the
+``redis`` package but no Redis installation; pass ``--redis HOST:PORT``
+to use a real server instead.
+
+Every response is checked to carry the request's own CSP nonce, i.e. the
+placeholders stored in the cache are filled in at send time.
+
+Run from the repository root::
+
+    python benchmarks/bench_response_cache.py [--redis HOST:PORT]
+"""
+import argparse
+import os
+import random
+import re
+import socketserver
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SECRET_KEY', 'dev-only-secret-key-do-not-use-in-production')
+os.environ.setdefault('FLASK_ENV', 'development')
+
+from app import create_app
+from app.services.response_cache import REDIS_AVAILABLE, reset_response_cache
+from app.services.text_service import get_all_text_posts
+
+POST_COUNT = 300
+PARAGRAPHS = 40
+ROUNDS = 600
+WORDS = ['물리', '양자', '역학', '사진', '여행', '서버', 'python', 'flask', 'cache', 'physics', 'travel', 'index']
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    """Just enough of the Redis protocol for the response cache (no expiry, single db)."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), RespHandler)
+        self.data = {}
+        self.lock = threading.Lock()
+
+class RespHandler(socketserver.StreamRequestHandler):
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line.startswith(b'*'): return None
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        null = b'$-1\r\n'
+        while True:
+            args = self.read_command()
+            if not args: return
+            name = args[0].upper()
+            with self.server.lock:
+                if name == b'GET':
+                    value = self.server.data.get(args[1])
+                    reply = null if value is None else b'$%d\r\n%s\r\n' % (len(value), value)
+                elif name == b'SET':
+                    self.server.data[args[1]] = args[2]
+                    reply = b'+OK\r\n'
+                elif name == b'DEL':
+                    reply = b':%d\r\n' % sum(self.server.data.pop(key, None) is not None for key in args[1:])
+                elif name == b'PING':
+                    reply = b'+PONG\r\n'
+                elif name == b'HELLO' and args[1:2] in ([b'2'], [b'3']):
+                    # redis-py 5+ negotiates RESP3, which only changes the null reply for these commands
+                    proto = int(args[1])
+                    null = b'_\r\n' if proto == 3 else b'$-1\r\n'
+                    reply = (b'%1\r\n' if proto == 3 else b'*2\r\n') + b'$5\r\nproto\r\n:%d\r\n' % proto
+                else:
+                    reply = b'-ERR unknown command\r\n'
+            self.wfile.write(reply)
+
+def write_posts(directory: str) -> None:
+    rng = random.Random(22)
+    for i in range(POST_COUNT):
+        paragraphs = [
+            ' '.join(rng.choices(WORDS, k=80)) + f' https://example.com/{i}/{j} **강조** `code`'
+            for j in range(PARAGRAPHS)
+        ]
+        header = (
+            f"[title: 벤치마크 포스트 {i}]\n[date: 2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}]\n"
+            f"[tags: {', '.join(rng.sample(WORDS, 3))}]\n\n"
+        )
+        with open(os.path.join(directory, f'post-{i:04d}.txt'), 'w', encoding='utf-8') as file:
+            file.write(header + '\n\n'.join(paragraphs))
+
+def measure(app, urls: list) -> list:
+    client = app.test_client()
+    samples = []
+    for i in range(ROUNDS):
+        url = urls[i % len(urls)]
+        start = time.perf_counter()
+        response = client.get(url)
+        samples.append(time.perf_counter() - start)
+        assert response.status_code == 200, (url, response.status_code)
+        nonces = set(re.findall(rb'nonce="([^"]+)"', response.data))
+        assert len(nonces) == 1 and b'\x00' not in response.data, url
+    return samples
+
+def summary(samples: list) -> str:
+    samples = sorted(samples)
+    return f"median {statistics.median(samples) * 1000:6.2f} ms, p95 {samples[int(len(samples) * 0.95) - 1] * 1000:6.2f} ms"
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--redis', help='HOST:PORT of a Redis-protocol server (default: local stand-in)')
+    options = parser.parse_args()
+
+    app = create_app('development')
+    app.logger.setLevel('ERROR')
+    stand_in = None
+    if REDIS_AVAILABLE and not options.redis:
+        stand_in = RespStandIn()
+        threading.Thread(target=stand_in.serve_forever, daemon=True).start()
+    redis_host, redis_port = options.redis.rsplit(':', 1) if options.redis else stand_in.server_address if stand_in else (None, None)
+
+    with tempfile.TemporaryDirectory() as directory:
+        app.config['POSTS_DIR'] = directory
+        write_posts(directory)
+        with app.test_request_context():
+            slugs = [post.slug for post in get_all_text_posts(directory)]
+        urls = ['/posts/'] + [f'/posts/{slug}' for slug in slugs[:20]] + ['/posts/tag/physics']
+        # 포스트 본문 렌더 캐시 등은 미리 데워 두고 응답 캐시의 효과만 비교
+        app.config['CACHE_TYPE'] = 'null'
+        reset_response_cache()
+        measure(app, urls)
+
+        results = {'no cache': measure(app, urls)}
+        app.config['CACHE_TYPE'] = 'simple'
+        reset_response_cache()
+        results['memory'] = measure(app, urls)
+        if redis_host is not None:
+            app.config.update(CACHE_TYPE='redis', CACHE_REDIS_HOST=redis_host, CACHE_REDIS_PORT=int(redis_port))
+            reset_response_cache()
+            results['redis'] = measure(app, urls)
+        else:
+            print("redis package not installed - skipping the Redis backend")
+
+    print(f"posts          : {POST_COUNT} ({PARAGRAPHS} paragraphs each), {len(urls)} urls, {ROUNDS} requests")
+    for name, samples in results.items():
+        print(f"{name:15}: {summary(samples)}")
+    if stand_in is not None:
+        stand_in.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+benchmarks/bench_search.py
+--------------------------
+
+Measure the full-text search index over 2000 synthetic posts: how long
+a request waits while the background build is started, the time to build
+the index from scratch, the time to pick up a single edited post, and
+per-query latency for ranking alone and for a full result page
+with highlighted snippets. The page figure includes the per-request
+snapshot check of the unwatched temporary directory, which is printed
+separately.
+
+Post bodies mix Korean and English words drawn from a Zipf-like
+distribution so that common terms produce long posting lists. Every
+LONG_POST_EVERY-th post is LONG_POST_WORDS words long, so result pages
+that hit a long post show whether snippets reread whole bodies.
+
+Run from the repository root::
+
+    python benchmarks/bench_search.py
+"""
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SECRET_KEY', 'dev-only-secret-key-do-not-use-in-production')
+os.environ.setdefault('FLASK_ENV', 'development')
+
+from app import create_app
+from app.services.post_corpus import get_corpus
+from app.services.search_service import get_search_index, search_posts
+
+POST_COUNT = 2000
+WORDS_PER_POST = 600
+LONG_POST_EVERY = 50
+LONG_POST_WORDS = 60000
+ROUNDS = 200
+SYLLABLES = '가나다라마바사아자차카타파하물리수학양자역학사진여행서버음악독서'
+ENGLISH = ['python', 'flask', 'server', 'cache', 'quantum', 'physics', 'photo', 'travel', 'index', 'search']
+QUERIES = ['물리', '양자 역학', 'python', 'flask cache', '사진 여행', '서버', 'quantum physics', '음악 독서']
+
+def make_vocabulary(rng: random.Random) -> list:
+    korean = {''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(3000)}
+    return ENGLISH + ['물리', '양자', '역학', '사진', '여행', '서버', '음악', '독서'] + sorted(korean)
+
+def write_posts(directory: str) -> None:
+    rng = random.Random(15)
+    vocabulary = make_vocabulary(rng)
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    for i in range(POST_COUNT):
+        words = rng.choices(vocabulary, weights, k=LONG_POST_WORDS if i % LONG_POST_EVERY == 0 else WORDS_PER_POST)
+        body = '\n\n'.join(' '.join(words[j:j + 60]) + '.' for j in range(0, len(words), 60))
+        header = (
+            f"[title: {' '.join(rng.choices(vocabulary, weights, k=4))} {i}]\n"
+            f"[date: 2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}]\n[tags: 벤치마크]\n"
+            f"[description: {' '.join(rng.choices(vocabulary, weights, k=10))}]\n\n"
+        )
+        with open(os.path.join(directory, f'post-{i:04d}.txt'), 'w', encoding='utf-8') as file:
+            file.write(header + body)
+
+def percentiles(samples: list) -> str:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    return f"median {statistics.median(samples) * 1000:.2f} ms, p95 {p95 * 1000:.2f} ms"
+
+def main() -> None:
+    app = create_app('development')
+    with tempfile.TemporaryDirectory() as directory, app.test_request_context():
+        app.config['POSTS_DIR'] = directory
+        write_posts(directory)
+        corpus = get_corpus(directory)
+
+        start = time.perf_counter()
+        index = get_search_index(corpus)
+        request_wait = time.perf_counter() - start
+        index.wait()
+        build = time.perf_counter() - start
+
+        # 파일 하나를 고친 뒤 새 스냅샷에서 바뀐 포스트만 다시 색인하는 비용
+        with open(os.path.join(directory, corpus.posts[0].filename), 'a', encoding='utf-8') as file:
+            file.write('\n\n추가된 문단 appended paragraph.\n')
+        corpus = get_corpus(directory)
+        start = time.perf_counter()
+        get_search_index(corpus).wait()
+        incremental = time.perf_counter() - start
+
+        rank_times, page_times, scan_times = [], [], []
+        for i in range(ROUNDS):
+            query = QUERIES[i % len(QUERIES)]
+            # 감시되지 않는 디렉토리라 요청마다 스냅샷 확인(stat)이 들어가므로 따로 표시
+            start = time.perf_counter()
+            get_corpus(directory)
+            scan_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            index.rank(query)
+            rank_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            search_posts(query, 1, 10, directory)
+            page_times.append(time.perf_counter() - start)
+    print(f"posts          : {POST_COUNT} ({WORDS_PER_POST} words each, every {LONG_POST_EVERY}th {LONG_POST_WORDS})")
+    print(f"terms          : {len(index._postings)}")
+    print(f"request wait   : {request_wait * 1000:.1f} ms")
+    print(f"index build    : {build * 1000:.0f} ms")
+    print(f"one-post update: {incremental * 1000:.1f} ms")
+    print(f"rank only      : {percentiles(rank_times)}")
+    print(f"page + snippets: {percentiles(page_times)}")
+    print(f"  (corpus scan : {percentiles(scan_times)})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+benchmarks/bench_tag_autocomplete.py
+------------------------------------
+
+Compare tag autocomplete over 5000 synthetic tags: the previous approach
+of scanning every tag twice (prefix, then substring) against the
+``TagIndex`` sorted-array / bigram lookup built once per corpus version.
+
+Run from the repository root::
+
+    python benchmarks/bench_tag_autocomplete.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('SECRET_KEY', 'dev-only-secret-key-do-not-use-in-production')
+os.environ.setdefault('FLASK_ENV', 'development')
+
+from app.services.tag_index import TagIndex
+
+TAG_COUNT = 5000
+QUERY_COUNT = 2000
+SYLLABLES = '가나다라마바사아자차카타파하물리수학사진여행abcdefghij'
+
+def scan(tags_count: dict, query: str) -> list:
+    matching = [
+        {'name': tag, 'count': count, 'url': f'/posts/tag/{tag}'}
+        for tag, count in tags_count.items() if tag.lower().startswith(query)
+    ]
+    containing = [
+        {'name': tag, 'count': count, 'url': f'/posts/tag/{tag}'}
+        for tag, count in tags_count.items()
+        if query in tag.lower() and not tag.lower().startswith(query)
+    ]
+    all_matches = matching + containing
+    all_matches.sort(key=lambda x: x['count'], reverse=True)
+    return all_matches[:10]
+
+def main() -> None:
+    rng = random.Random(16)
+    tags_count = {}
+    while len(tags_count) < TAG_COUNT:
+        tags_count[''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 8)))] = rng.randint(1, 50)
+    queries = [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))) for _ in range(QUERY_COUNT)]
+
+    start = time.perf_counter()
+    index = TagIndex(tags_count)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [scan(tags_count, query) for query in queries]
+    scanned = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = [index.complete(query) for query in queries]
+    indexed = time.perf_counter() - start
+    assert actual == expected
+
+    print(f"tags           : {TAG_COUNT}")
+    print(f"index build    : {build * 1000:.1f} ms")
+    print(f"full scan      : {scanned / QUERY_COUNT * 1e6:.0f} us/query")
+    print(f"TagIndex       : {indexed / QUERY_COUNT * 1e6:.1f} us/query")
+    print(f"speedup        : {scanned / indexed:.0f}x")
+
+if __name__ == '__main__':
+    main()